@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store of build outputs with manifest-swap rollback.
+
+Reads:
+  - STORE_PATHS / STORE_GLOBS        generator outputs only: README.md, the
+                                     build_readme / workflow-status panels,
+                                     project cards, dist/build-manifest.json
+
+Writes:
+  - .surface-store/objects/ab/cdef…  one blob per distinct file content (sha256)
+  - .surface-store/builds/<id>.json  per-build manifest: path -> sha256, size
+  - .surface-store/HEAD              id of the build currently materialized
+
+Used by:
+  - scripts/build_readme.py          capture() + commit() after every real build;
+                                     dist/build-manifest.json links the build
+  - scripts/rollback_surface.sh      --to-build <id> (checkout)
+
+Commands:
+  - list                             builds, newest first (* marks HEAD)
+  - checkout <id|prefix|previous>    materialize a build's files; --dry-run previews
+  - verify [id]                      re-hash the blobs a build references
+  - gc [--keep N]                    drop old manifests and unreferenced blobs
+
+Rules:
+  - the build id is the sha256 of the sorted path -> blob map, excluding
+    dist/build-manifest.json (which embeds the id), so identical outputs get
+    the same id and every unchanged panel is shared across builds
+  - blobs are written once (tmp + rename) and never modified; checkout copies
+    them out, never hardlinks, so editing a working file cannot corrupt the store
+  - hand-made assets (banners, dividers, badges) are never captured
+  - checkout only rewrites files whose hash differs and removes only generator
+    outputs recorded in a stored build that the target build does not have;
+    a file that merely matches STORE_GLOBS is never deleted
+  - the newest KEEP_BUILDS manifests are kept; gc runs on commit past that
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+from surface_io import display_path, dumps_json, encode_jsonl_line, load_json
+
+ROOT = Path(__file__).resolve().parent.parent
+STORE = ROOT / ".surface-store"
+OBJECTS = STORE / "objects"
+BUILDS = STORE / "builds"
+HEAD = STORE / "HEAD"
+
+BUILD_MANIFEST = "dist/build-manifest.json"
+# build_readme.py writes README.md and the first five panels, generate_workflow_status.py the last.
+STORE_PATHS = (
+    "README.md",
+    "assets/flow-line.svg",
+    "assets/section_quote.svg",
+    "assets/system-health.svg",
+    "assets/system-matrix.svg",
+    "assets/repo-metrics.svg",
+    "assets/workflow-status.svg",
+    BUILD_MANIFEST,
+)
+# generate_project_cards.py output.
+STORE_GLOBS = (
+    "assets/projects/**/*.svg",
+    "assets/projects/**/*.json",
+    "assets/projects/**/*.jsonl",
+)
+
+KEEP_BUILDS = 50
+HASH_CHUNK = 1 << 16
+
+
+def utc_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_path(sha: str) -> Path:
+    return OBJECTS / sha[:2] / sha[2:]
+
+
+def store_files() -> list[Path]:
+    paths: set[Path] = {path for path in (ROOT / rel for rel in STORE_PATHS) if path.is_file()}
+    for pattern in STORE_GLOBS:
+        paths.update(path for path in ROOT.glob(pattern) if path.is_file())
+    return sorted(paths)
+
+
+def put_blob(path: Path) -> tuple[dict[str, Any], bool]:
+    """Store ``path``'s bytes; returns its manifest entry and whether the blob is new."""
+    sha = file_sha256(path)
+    target = blob_path(sha)
+    entry = {"sha256": sha, "size": path.stat().st_size}
+    if target.exists():
+        return entry, False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, target)
+    return entry, True
+
+
+def build_id_for(files: dict[str, dict[str, Any]]) -> str:
+    addressed = {rel: entry["sha256"] for rel, entry in sorted(files.items()) if rel != BUILD_MANIFEST}
+    return hashlib.sha256(encode_jsonl_line(addressed)).hexdigest()[:16]
+
+
+class Snapshot:
+    """Files of one build, stored as blobs; commit() writes the build manifest."""
+
+    __slots__ = ("files", "new_blobs")
+
+    def __init__(self) -> None:
+        self.files: dict[str, dict[str, Any]] = {}
+        self.new_blobs = 0
+
+    def add(self, path: Path) -> None:
+        entry, new = put_blob(path)
+        self.files[str(display_path(path))] = entry
+        self.new_blobs += int(new)
+
+    @property
+    def build_id(self) -> str:
+        return build_id_for(self.files)
+
+    def commit(self, **meta: Any) -> Path:
+        build_id = self.build_id
+        path = BUILDS / f"{build_id}.json"
+        payload = {"build_id": build_id, "created": utc_now(), "files": self.files, **meta}
+        BUILDS.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(dumps_json(payload), encoding="utf-8")
+        os.replace(tmp, path)
+        HEAD.write_text(build_id + "\n", encoding="utf-8")
+
+        if len(list(BUILDS.glob("*.json"))) > KEEP_BUILDS:
+            gc(KEEP_BUILDS)
+        return path
+
+
+def capture(exclude: Iterable[str] = ()) -> Snapshot:
+    """Store every generator output except ``exclude`` (relative paths)."""
+    skipped = set(exclude)
+    snapshot = Snapshot()
+    for path in store_files():
+        if str(display_path(path)) not in skipped:
+            snapshot.add(path)
+    return snapshot
+
+
+def load_builds() -> list[dict[str, Any]]:
+    builds = [load_json(path, None, strict=False) for path in BUILDS.glob("*.json")]
+    valid = [build for build in builds if isinstance(build, dict) and isinstance(build.get("files"), dict)]
+    return sorted(valid, key=lambda build: (str(build.get("created", "")), build["build_id"]), reverse=True)
+
+
+def head_id() -> str | None:
+    try:
+        return HEAD.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def resolve_build(ref: str) -> dict[str, Any]:
+    builds = load_builds()
+    if ref == "previous":
+        # One step older than HEAD, so repeated rollbacks keep walking back.
+        ids = [build["build_id"] for build in builds]
+        current = head_id()
+        position = ids.index(current) if current in ids else 0
+        if position + 1 >= len(builds):
+            raise SystemExit("No previous build in the store")
+        return builds[position + 1]
+
+    matches = [build for build in builds if build["build_id"].startswith(ref)]
+    if len(matches) != 1:
+        raise SystemExit(f"{'Ambiguous' if matches else 'Unknown'} build id: {ref}")
+    return matches[0]
+
+
+def checkout(build: dict[str, Any], dry_run: bool = False) -> tuple[int, int, int]:
+    """Materialize ``build``; returns (written, removed, unchanged) file counts."""
+    files: dict[str, dict[str, Any]] = build["files"]
+    missing = [rel for rel, entry in files.items() if not blob_path(entry["sha256"]).exists()]
+    if missing:
+        raise SystemExit(f"Build {build['build_id']} is missing blobs for: {', '.join(sorted(missing))}")
+
+    written = unchanged = 0
+    for rel, entry in sorted(files.items()):
+        target = ROOT / rel
+        if target.is_file() and target.stat().st_size == entry["size"] and file_sha256(target) == entry["sha256"]:
+            unchanged += 1
+            continue
+        written += 1
+        if dry_run:
+            print(f"DRY-RUN: would restore {rel}")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".restore.tmp")
+        shutil.copyfile(blob_path(entry["sha256"]), tmp)
+        os.replace(tmp, target)
+        print(f"RESTORED: {rel}")
+
+    # Only generator outputs some stored build recorded are ours to delete.
+    recorded = {rel for stored in load_builds() for rel in stored["files"]}
+    outputs = {str(display_path(path)) for path in store_files()}
+    removed = 0
+    for rel in sorted((recorded & outputs) - set(files)):
+        path = ROOT / rel
+        removed += 1
+        if dry_run:
+            print(f"DRY-RUN: would remove {rel}")
+        else:
+            path.unlink()
+            print(f"REMOVED: {rel}")
+
+    if not dry_run:
+        HEAD.write_text(build["build_id"] + "\n", encoding="utf-8")
+    return written, removed, unchanged
+
+
+def verify(build: dict[str, Any]) -> list[str]:
+    problems = []
+    for rel, entry in sorted(build["files"].items()):
+        blob = blob_path(entry["sha256"])
+        if not blob.exists():
+            problems.append(f"MISSING: {rel} {entry['sha256'][:12]}")
+        elif file_sha256(blob) != entry["sha256"]:
+            problems.append(f"CORRUPT: {rel} {entry['sha256'][:12]}")
+    return problems
+
+
+def gc(keep: int = KEEP_BUILDS) -> tuple[int, int]:
+    """Keep the newest ``keep`` builds (and HEAD); returns (manifests, blobs) removed."""
+    builds = load_builds()
+    current = head_id()
+    kept = [build for position, build in enumerate(builds) if position < keep or build["build_id"] == current]
+    dropped = [build for build in builds if build not in kept]
+    for build in dropped:
+        (BUILDS / f"{build['build_id']}.json").unlink(missing_ok=True)
+
+    referenced = {entry["sha256"] for build in kept for entry in build["files"].values()}
+    blobs = 0
+    for blob in OBJECTS.glob("*/*"):
+        if blob.parent.name + blob.name not in referenced and not blob.name.endswith(".tmp"):
+            blob.unlink()
+            blobs += 1
+    return len(dropped), blobs
+
+
+def store_size() -> int:
+    return sum(blob.stat().st_size for blob in OBJECTS.glob("*/*"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Content-addressed surface build store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list stored builds, newest first")
+    restore = commands.add_parser("checkout", help="materialize a stored build")
+    restore.add_argument("build", help="build id, unique prefix, or 'previous'")
+    restore.add_argument("--dry-run", action="store_true", help="print planned restores without writing")
+    check = commands.add_parser("verify", help="re-hash the blobs of a build")
+    check.add_argument("build", nargs="?", help="build id or prefix (default: HEAD)")
+    collect = commands.add_parser("gc", help="drop old builds and unreferenced blobs")
+    collect.add_argument("--keep", type=int, default=KEEP_BUILDS)
+    args = parser.parse_args()
+
+    if args.command == "list":
+        builds = load_builds()
+        current = head_id()
+        for build in builds:
+            marker = "*" if build["build_id"] == current else " "
+            size = sum(entry["size"] for entry in build["files"].values())
+            print(f"{marker} {build['build_id']}  {build.get('created', '?')}  files={len(build['files'])}  bytes={size}  source={str(build.get('source_hash', ''))[:16]}")
+        print(f"SUMMARY: builds={len(builds)} blobs={sum(1 for _ in OBJECTS.glob('*/*'))} store_bytes={store_size()}")
+        return 0
+
+    if args.command == "checkout":
+        build = resolve_build(args.build)
+        written, removed, unchanged = checkout(build, dry_run=args.dry_run)
+        print(f"SUMMARY: build={build['build_id']} restored={written} removed={removed} unchanged={unchanged}")
+        return 0
+
+    if args.command == "verify":
+        ref = args.build or head_id()
+        if not ref:
+            print("NO BUILDS: store is empty")
+            return 1
+        build = resolve_build(ref)
+        problems = verify(build)
+        for problem in problems:
+            print(problem)
+        print(f"SUMMARY: build={build['build_id']} files={len(build['files'])} problems={len(problems)}")
+        return 1 if problems else 0
+
+    manifests, blobs = gc(max(1, args.keep))
+    print(f"SUMMARY: removed_builds={manifests} removed_blobs={blobs} store_bytes={store_size()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ Rules:
 - README.md is generated.
 - removed legacy tmp README artifact is deprecated.
 - --dry-run writes nothing.
+- --no-store skips the .surface-store capture (Pages deploys, one-off builds).
 """
 
 from __future__ import annotations
@@ -20,7 +21,17 @@ import html
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from artifact_store import BUILD_MANIFEST, capture
+from host_sampler import load_summary
+from pipeline_log import PipelineLog
+from pipeline_trace import span, traced
+from registry_index import load_index
+from render_profile import DEFAULT_PROFILE, add_profile_argument, filter_defs, glow_circle, glow_path, glow_rect
+from repo_aggregate import TopK
+from repo_record import RepoRecord
+from surface_io import dumps_json, iter_records, load_json
 
 ROOT = Path(__file__).resolve().parent.parent
 ASSETS = ROOT / "assets"
@@ -44,10 +55,14 @@ SOURCE_FILES = [
     "health/orchestrator.json",
     "metrics/aggregate.json",
     "metrics/metrics.json",
+    "metrics/metrics.jsonl",
     "metrics/popdeuxrem_popdeuxrem.json",
-    "assets/projects/index.json",
+    "assets/projects/index/head.json",
 ]
 
+PROJECT_CARDS_INDEX = "assets/projects/index.json"
+PROJECT_CARDS_HEAD = "assets/projects/index/head.json"
+
 
 def utc_now() -> str:
     return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -64,16 +79,6 @@ def read_text(path: Path, default: str = "") -> str:
         return default
 
 
-def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
-        return default
-
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise SystemExit("Invalid JSON: {}: {}".format(path.relative_to(ROOT), exc)) from exc
-
-
 def stable_json(value: Any) -> str:
     return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
 
@@ -143,15 +148,19 @@ def update_header_metadata(content: str, timestamp: str, short_hash: str) -> str
     )
 
 
-def load_projects() -> list[dict[str, Any]]:
+def load_projects(dry_run: bool = False) -> list[dict[str, Any]]:
     """Load canonical projects from data/projects.json."""
-    projects_data = load_json(ROOT / "data/projects.json", {})
-    if isinstance(projects_data, dict):
-        return projects_data.get("projects", [])
-    return []
+    return load_index(write=not dry_run).projects()
+
 
+GLOW_FILTER = """    <filter id="glow">
+      <feGaussianBlur stdDeviation="3" result="b"/>
+      <feMerge><feMergeNode in="b"/><feMergeNode in="SourceGraphic"/></feMerge>
+    </filter>
+"""
 
-def svg_panel_shell(width: int, height: int, body: str) -> str:
+
+def svg_panel_shell(width: int, height: int, body: str, profile: str = DEFAULT_PROFILE) -> str:
     """Unified SVG panel shell with consistent styling."""
     return f"""<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" role="img">
   <defs>
@@ -160,11 +169,7 @@ def svg_panel_shell(width: int, height: int, body: str) -> str:
       <stop offset="50%" stop-color="#bc8cff"/>
       <stop offset="100%" stop-color="#00ff9d"/>
     </linearGradient>
-    <filter id="glow">
-      <feGaussianBlur stdDeviation="3" result="b"/>
-      <feMerge><feMergeNode in="b"/><feMergeNode in="SourceGraphic"/></feMerge>
-    </filter>
-  </defs>
+{filter_defs(profile, GLOW_FILTER)}  </defs>
   <rect width="100%" height="100%" rx="16" fill="#0d1117"/>
   <rect x="1" y="1" width="{width-2}" height="{height-2}" rx="16" fill="none" stroke="url(#g)" stroke-width="1.5" opacity="0.75"/>
   {body}
@@ -246,51 +251,49 @@ def overall_health(health: dict[str, str]) -> str:
     return "healthy"
 
 
-def load_repo_metrics() -> list[dict[str, Any]]:
-    repos_raw = load_json(ROOT / "identity/repos.json", [])
-    metrics = load_json(ROOT / "metrics/metrics.json", {})
+REPO_PANEL_LIMIT = 8
+
+
+def load_repo_metrics(limit: int = REPO_PANEL_LIMIT, dry_run: bool = False) -> list[RepoRecord]:
+    """Join registry entries with streamed metrics records and keep the top ``limit``."""
     aggregate = load_json(ROOT / "metrics/aggregate.json", {})
 
-    repos: list[dict[str, Any]] = []
+    registry: dict[str, RepoRecord] = {}
 
-    if isinstance(repos_raw, dict):
-        repos_iter = repos_raw.get("repos", [])
-    else:
-        repos_iter = repos_raw
+    def register(item: Any) -> None:
+        record = RepoRecord.from_json(item)
+        if record is not None and record.key not in registry:
+            registry[record.key] = record
 
-    if isinstance(repos_iter, list):
-        for item in repos_iter:
-            if isinstance(item, str):
-                repos.append({"name": item})
-            elif isinstance(item, dict):
-                repos.append(item)
+    for entry in load_index(write=not dry_run).registry():
+        register(entry["full_name"])
 
-    if not repos and isinstance(aggregate, dict):
+    if not registry and isinstance(aggregate, dict):
         for key in ("repos", "repositories"):
             values = aggregate.get(key)
             if isinstance(values, list):
                 for item in values:
                     if isinstance(item, dict):
-                        repos.append(item)
+                        register(item)
 
-    if isinstance(metrics, dict):
-        values = metrics.get("repos") or metrics.get("repositories")
-        if isinstance(values, list):
-            for item in values:
-                if isinstance(item, dict) and item not in repos:
-                    repos.append(item)
+    top = TopK(limit)
 
-    return repos[:8]
+    for item in iter_records(ROOT / "metrics/metrics.json", ("repos", "repositories")):
+        if not isinstance(item, dict):
+            continue
+        record = RepoRecord.from_json(item)
+        if record is not None:
+            registry.pop(record.key, None)
+            top.push(record)
 
+    for record in registry.values():
+        top.push(record)
 
-def repo_name(repo: dict[str, Any]) -> str:
-    return str(
-        repo.get("name")
-        or repo.get("repo")
-        or repo.get("full_name")
-        or repo.get("slug")
-        or "unknown"
-    )
+    return top.items()
+
+
+def repo_name(repo: RepoRecord) -> str:
+    return repo.name or "unknown"
 
 
 def load_quotes() -> list[str]:
@@ -340,7 +343,7 @@ def seed_int(seed: str, namespace: str, modulo: int, offset: int = 0) -> int:
     return (int(digest[:12], 16) % modulo) + offset
 
 
-def svg_shell(width: int, height: int, body: str) -> str:
+def svg_shell(width: int, height: int, body: str, profile: str = DEFAULT_PROFILE) -> str:
     return """<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" role="img">
   <defs>
     <linearGradient id="g" x1="0" x2="1" y1="0" y2="1">
@@ -348,11 +351,7 @@ def svg_shell(width: int, height: int, body: str) -> str:
       <stop offset="50%" stop-color="#bc8cff"/>
       <stop offset="100%" stop-color="#00ff9d"/>
     </linearGradient>
-    <filter id="glow">
-      <feGaussianBlur stdDeviation="3" result="b"/>
-      <feMerge><feMergeNode in="b"/><feMergeNode in="SourceGraphic"/></feMerge>
-    </filter>
-  </defs>
+{glow}  </defs>
   <rect width="100%" height="100%" rx="16" fill="#0d1117"/>
   <rect x="1" y="1" width="{stroke_width}" height="{stroke_height}" rx="16" fill="none" stroke="url(#g)" stroke-width="1.5" opacity="0.75"/>
   {body}
@@ -363,24 +362,28 @@ def svg_shell(width: int, height: int, body: str) -> str:
         stroke_width=width - 2,
         stroke_height=height - 2,
         body=body,
+        glow=filter_defs(profile, GLOW_FILTER),
     )
 
 
-def generate_flow_line_svg(seed: str) -> str:
+def generate_flow_line_svg(seed: str, profile: str = DEFAULT_PROFILE) -> str:
     digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
 
     body = """
-  <path d="M30 50 C180 10, 280 90, 430 50 S680 10, 830 50" fill="none" stroke="url(#g)" stroke-width="3" filter="url(#glow)"/>
+  {path}
   <circle cx="30" cy="50" r="5" fill="#00f3ff"/>
   <circle cx="430" cy="50" r="5" fill="#bc8cff"/>
   <circle cx="830" cy="50" r="5" fill="#00ff9d"/>
-  <text x="450" y="82" fill="#8b949e" font-family="monospace" font-size="11" text-anchor="middle">SURFACE ENGINE · TRACE {}</text>
-""".format(esc(digest))
+  <text x="450" y="82" fill="#8b949e" font-family="monospace" font-size="11" text-anchor="middle">SURFACE ENGINE · TRACE {digest}</text>
+""".format(
+        path=glow_path(profile, "M30 50 C180 10, 280 90, 430 50 S680 10, 830 50", "url(#g)", 3),
+        digest=esc(digest),
+    )
 
-    return svg_shell(860, 100, body)
+    return svg_shell(860, 100, body, profile)
 
 
-def generate_quote_svg(quote: str) -> str:
+def generate_quote_svg(quote: str, profile: str = DEFAULT_PROFILE) -> str:
     q = quote.strip()
 
     if len(q) > 120:
@@ -392,10 +395,10 @@ def generate_quote_svg(quote: str) -> str:
   <text x="400" y="126" fill="#8b949e" font-family="monospace" font-size="11" text-anchor="middle">deterministic quote selection · no random build drift</text>
 """.format(esc(q))
 
-    return svg_shell(800, 150, body)
+    return svg_shell(800, 150, body, profile)
 
 
-def generate_health_svg(health: dict[str, str]) -> str:
+def generate_health_svg(health: dict[str, str], profile: str = DEFAULT_PROFILE) -> str:
     rows = [
         ("AUTOMATION", health.get("automation", "unknown")),
         ("ORCHESTRATOR", health.get("orchestrator", "unknown")),
@@ -436,16 +439,44 @@ def generate_health_svg(health: dict[str, str]) -> str:
         esc(overall_health(health).upper()),
     )
 
-    return svg_shell(430, 240, body)
+    return svg_shell(430, 240, body, profile)
 
 
-def generate_system_matrix_svg(seed: str) -> str:
-    cpu = seed_int(seed, "system-matrix.cpu", 72, 8)
-    ram = seed_int(seed, "system-matrix.ram", 58, 24)
-    io = seed_int(seed, "system-matrix.io", 82, 7)
-    latency = seed_int(seed, "system-matrix.latency", 34, 9)
-    packets = seed_int(seed, "system-matrix.packets", 900, 100)
+def matrix_range(host: dict[str, Any], metric: str, y: int, fill: str) -> tuple[str, str]:
+    """min/max tick marks on a bar plus the "min-max" caption beside its value."""
+    low, high = (int(round(host[metric][key])) for key in ("min", "max"))
+    ticks = "".join(
+        '\n  <rect x="{}" y="{}" width="2" height="16" fill="{}" opacity="0.7"/>'.format(104 + int(value * 2.33), y - 2, fill)
+        for value in (low, high)
+    )
+    caption = '\n  <text x="404" y="{}" fill="#8b949e" font-family="monospace" font-size="9">{}-{}</text>'.format(y + 11, low, high)
+    return ticks, caption
+
+
+def generate_system_matrix_svg(seed: str, profile: str = DEFAULT_PROFILE, host: dict[str, Any] | None = None) -> str:
+    """Status matrix; ``host`` is a host_sampler summary, else values are seeded from the source hash."""
     trace = hashlib.sha256(("system-matrix::" + seed).encode("utf-8")).hexdigest()[:12]
+    marks = {"cpu": ("", ""), "ram": ("", ""), "io": ("", "")}
+
+    if host is None:
+        cpu = seed_int(seed, "system-matrix.cpu", 72, 8)
+        ram = seed_int(seed, "system-matrix.ram", 58, 24)
+        io = seed_int(seed, "system-matrix.io", 82, 7)
+        latency = seed_int(seed, "system-matrix.latency", 34, 9)
+        packets = seed_int(seed, "system-matrix.packets", 900, 100)
+        link_label, link_value = "RTT", "{}ms".format(latency)
+        footer = "packets:{}/s · deterministic mock telemetry from source hash".format(packets)
+    else:
+        cpu, ram, io = (int(round(host[metric]["avg"])) for metric in ("cpu", "ram", "io"))
+        # A single sample has no spread; its min/max would only repeat the value.
+        if host["samples"] > 1:
+            for metric, y, fill in (("cpu", 58, "#00f3ff"), ("ram", 92, "#bc8cff"), ("io", 126, "#00ff9d")):
+                marks[metric] = matrix_range(host, metric, y, fill)
+        # /proc has no round-trip time, so the link cell shows the sampled packet rate.
+        link_label, link_value = "PKT", "{}/s".format(int(round(host["packets"]["avg"])))
+        footer = "host samples:{} over {}s · avg bars, min/max ticks · packets max:{}/s".format(
+            host["samples"], host["window_s"], int(round(host["packets"]["max"]))
+        )
 
     cpu_width = max(12, int(cpu * 2.35))
     ram_width = max(12, int(ram * 2.35))
@@ -461,27 +492,27 @@ def generate_system_matrix_svg(seed: str) -> str:
 
   <text x="42" y="70" fill="#8b949e" font-family="monospace" font-size="12">CPU</text>
   <rect x="104" y="58" width="235" height="12" rx="6" fill="#161b22"/>
-  <rect x="104" y="58" width="{cpu_width}" height="12" rx="6" fill="#00f3ff" opacity="0.92" filter="url(#glow)"/>
-  <text x="366" y="70" fill="#00f3ff" font-family="monospace" font-size="12">{cpu}%</text>
+  {cpu_bar}{cpu_ticks}
+  <text x="366" y="70" fill="#00f3ff" font-family="monospace" font-size="12">{cpu}%</text>{cpu_range}
 
   <text x="42" y="104" fill="#8b949e" font-family="monospace" font-size="12">RAM</text>
   <rect x="104" y="92" width="235" height="12" rx="6" fill="#161b22"/>
-  <rect x="104" y="92" width="{ram_width}" height="12" rx="6" fill="#bc8cff" opacity="0.92" filter="url(#glow)"/>
-  <text x="366" y="104" fill="#bc8cff" font-family="monospace" font-size="12">{ram}%</text>
+  {ram_bar}{ram_ticks}
+  <text x="366" y="104" fill="#bc8cff" font-family="monospace" font-size="12">{ram}%</text>{ram_range}
 
   <text x="42" y="138" fill="#8b949e" font-family="monospace" font-size="12">I/O</text>
   <rect x="104" y="126" width="235" height="12" rx="6" fill="#161b22"/>
-  <rect x="104" y="126" width="{io_width}" height="12" rx="6" fill="#00ff9d" opacity="0.92" filter="url(#glow)"/>
-  <text x="366" y="138" fill="#00ff9d" font-family="monospace" font-size="12">{io}%</text>
+  {io_bar}{io_ticks}
+  <text x="366" y="138" fill="#00ff9d" font-family="monospace" font-size="12">{io}%</text>{io_range}
 
   <line x1="42" y1="160" x2="440" y2="160" stroke="#30363d" stroke-width="1"/>
 
   <text x="42" y="188" fill="#8b949e" font-family="monospace" font-size="12">NET</text>
-  <circle cx="106" cy="184" r="5" fill="#00ff9d" filter="url(#glow)"/>
+  {net_dot}
   <text x="122" y="188" fill="#00ff9d" font-family="monospace" font-size="12">{net_state}</text>
 
-  <text x="230" y="188" fill="#8b949e" font-family="monospace" font-size="12">RTT</text>
-  <text x="278" y="188" fill="#00f3ff" font-family="monospace" font-size="12">{latency}ms</text>
+  <text x="230" y="188" fill="#8b949e" font-family="monospace" font-size="12">{link_label}</text>
+  <text x="278" y="188" fill="#00f3ff" font-family="monospace" font-size="12">{link_value}</text>
 
   <text x="42" y="218" fill="#8b949e" font-family="monospace" font-size="12">POLICY</text>
   <text x="122" y="218" fill="#bc8cff" font-family="monospace" font-size="12">{policy_state}</text>
@@ -489,41 +520,44 @@ def generate_system_matrix_svg(seed: str) -> str:
   <text x="230" y="218" fill="#8b949e" font-family="monospace" font-size="12">DRIFT</text>
   <text x="292" y="218" fill="#00ff9d" font-family="monospace" font-size="12">{drift_state}</text>
 
-  <text x="42" y="246" fill="#8b949e" font-family="monospace" font-size="10">packets:{packets}/s · deterministic mock telemetry from source hash</text>
+  <text x="42" y="246" fill="#8b949e" font-family="monospace" font-size="10">{footer}</text>
 """.format(
         trace=esc(trace),
-        cpu_width=cpu_width,
-        ram_width=ram_width,
-        io_width=io_width,
+        cpu_bar=glow_rect(profile, 104, 58, cpu_width, 12, 6, "#00f3ff", "0.92"),
+        ram_bar=glow_rect(profile, 104, 92, ram_width, 12, 6, "#bc8cff", "0.92"),
+        io_bar=glow_rect(profile, 104, 126, io_width, 12, 6, "#00ff9d", "0.92"),
+        net_dot=glow_circle(profile, 106, 184, 5, "#00ff9d"),
         cpu=cpu,
         ram=ram,
         io=io,
+        cpu_ticks=marks["cpu"][0],
+        ram_ticks=marks["ram"][0],
+        io_ticks=marks["io"][0],
+        cpu_range=marks["cpu"][1],
+        ram_range=marks["ram"][1],
+        io_range=marks["io"][1],
         net_state=esc(net_state),
-        latency=latency,
+        link_label=esc(link_label),
+        link_value=esc(link_value),
         policy_state=esc(policy_state),
         drift_state=esc(drift_state),
-        packets=packets,
+        footer=esc(footer),
     )
 
-    return svg_shell(480, 270, body)
+    return svg_shell(480, 270, body, profile)
 
 
-def generate_metrics_svg(repos: list[dict[str, Any]]) -> str:
+def generate_metrics_svg(repos: list[RepoRecord], profile: str = DEFAULT_PROFILE) -> str:
     if not repos:
-        repos = [{"name": "popdeuxrem", "status": "tracked"}]
+        repos = [RepoRecord("popdeuxrem", "popdeuxrem")]
 
     row_svg: list[str] = []
     y = 66
 
     for repo in repos[:6]:
         name = repo_name(repo)
-        status = repo.get("status") or repo.get("state") or "tracked"
-        stars = (
-            repo.get("stars")
-            or repo.get("stargazers_count")
-            or repo.get("star_count")
-            or "-"
-        )
+        status = repo.status or "tracked"
+        stars = repo.stars or "-"
 
         row_svg.append(
             '<text x="42" y="{y}" fill="#c9d1d9" font-family="monospace" font-size="12">{name}</text>'
@@ -544,24 +578,45 @@ def generate_metrics_svg(repos: list[dict[str, Any]]) -> str:
   <text x="42" y="232" fill="#8b949e" font-family="monospace" font-size="11">identity/repos.json · metrics/*.json</text>
 """.format("".join(row_svg))
 
-    return svg_shell(560, 260, body)
+    return svg_shell(560, 260, body, profile)
+
+
+def load_project_cards_head() -> dict[str, Any] | None:
+    """The paged index head: top cards, totals and recorded card existence."""
+    head = load_json(ROOT / PROJECT_CARDS_HEAD, None, strict=False)
 
+    if not isinstance(head, dict) or not isinstance(head.get("cards"), list):
+        return None
 
-def load_project_cards(limit: int = 4) -> list[dict[str, Any]]:
-    index_path = ROOT / "assets" / "projects" / "index.json"
-    payload = load_json(index_path, {})
+    return head
 
-    if not isinstance(payload, dict):
-        return []
 
-    cards = payload.get("cards", [])
+def iter_project_cards() -> Iterator[Any]:
+    return iter_records(ROOT / PROJECT_CARDS_INDEX, ("cards",))
 
-    if not isinstance(cards, list):
-        return []
 
+def card_exists(item: dict[str, Any], path: str) -> bool:
+    """Trust the generator's recorded state; legacy entries without it are stat'ed."""
+    if "exists" in item:
+        return bool(item["exists"])
+    return (ROOT / path).exists()
+
+
+def load_project_cards(limit: int = 4, head: dict[str, Any] | None = None) -> list[dict[str, Any]]:
     normalized: list[dict[str, Any]] = []
+    sprite_exists: bool | None = None
+
+    if head is not None:
+        cards: Iterator[Any] = iter(head["cards"])
+        sprite = head.get("sprite")
+        sprite_exists = bool(isinstance(sprite, dict) and sprite.get("exists"))
+    else:
+        cards = iter_project_cards()
 
     for item in cards:
+        if len(normalized) >= limit:
+            break
+
         if not isinstance(item, dict):
             continue
 
@@ -570,14 +625,23 @@ def load_project_cards(limit: int = 4) -> list[dict[str, Any]]:
         if not path:
             continue
 
-        if not (ROOT / path).exists():
+        if not card_exists(item, path):
             continue
 
+        src = path
+        atlas = item.get("atlas")
+        if isinstance(atlas, dict) and atlas.get("path") and atlas.get("fragment"):
+            if sprite_exists is None:
+                sprite_exists = (ROOT / str(atlas["path"])).exists()
+            if sprite_exists:
+                src = "{}#{}".format(atlas["path"], atlas["fragment"])
+
         normalized.append(
             {
                 "full_name": str(item.get("full_name") or item.get("name") or "unknown"),
                 "name": str(item.get("name") or item.get("full_name") or "unknown"),
                 "path": path,
+                "src": src,
                 "html_url": str(item.get("html_url") or ""),
                 "status": str(item.get("status") or "tracked"),
                 "language": str(item.get("language") or "Unknown"),
@@ -587,7 +651,7 @@ def load_project_cards(limit: int = 4) -> list[dict[str, Any]]:
             }
         )
 
-    return normalized[:limit]
+    return normalized
 
 
 def workflow_panel_markdown() -> str:
@@ -606,7 +670,7 @@ def project_cards_markdown(cards: list[dict[str, Any]]) -> str:
     rows: list[str] = []
 
     for card in cards:
-        path = str(card["path"])
+        path = str(card.get("src") or card["path"])
         name = str(card["name"])
         url = str(card.get("html_url") or "")
 
@@ -627,9 +691,10 @@ def generated_readme_block(
     build_hash_value: str,
     timestamp: str,
     health: dict[str, str],
-    repos: list[dict[str, Any]],
+    repos: list[RepoRecord],
+    cards_head: dict[str, Any] | None = None,
 ) -> str:
-    project_cards = load_project_cards(limit=4)
+    project_cards = load_project_cards(limit=4, head=cards_head)
 
     workflow_exists = (ROOT / "assets" / "workflow-status.svg").exists()
 
@@ -673,25 +738,15 @@ def generated_readme_block(
     return "\n".join(lines)
 
 
-def project_cards_manifest() -> dict[str, Any]:
-    index_path = ROOT / "assets" / "projects" / "index.json"
-    payload = load_json(index_path, {})
-
-    if not isinstance(payload, dict):
-        return {
-            "index": "assets/projects/index.json",
-            "count": 0,
-            "cards": [],
-        }
-
-    cards = payload.get("cards", [])
-
-    if not isinstance(cards, list):
-        cards = []
+def project_cards_manifest(head: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Card summary for the build manifest.
 
+    With a paged index only the head is read, so the cost does not grow with
+    the card count; the head's pages_hash stands in for the full card list.
+    """
     normalized: list[dict[str, Any]] = []
 
-    for item in cards:
+    for item in head["cards"] if head is not None else iter_project_cards():
         if not isinstance(item, dict):
             continue
 
@@ -702,7 +757,7 @@ def project_cards_manifest() -> dict[str, Any]:
         if not path:
             continue
 
-        exists = (ROOT / path).exists()
+        exists = card_exists(item, path)
 
         normalized.append(
             {
@@ -721,10 +776,23 @@ def project_cards_manifest() -> dict[str, Any]:
 
     normalized = sorted(normalized, key=lambda item: str(item.get("full_name", "")).lower())
 
+    if head is None:
+        return {
+            "index": PROJECT_CARDS_INDEX,
+            "count": len(normalized),
+            "cards": normalized,
+        }
+
     return {
-        "index": "assets/projects/index.json",
-        "count": len(normalized),
+        "index": PROJECT_CARDS_HEAD,
+        "count": int(head.get("count") or len(normalized)),
         "cards": normalized,
+        "pages": {
+            "count": head.get("pages") or 0,
+            "hash": head.get("pages_hash"),
+            "size": head.get("page_size"),
+            "template": head.get("page_template"),
+        },
     }
 
 
@@ -736,38 +804,53 @@ def write_file(path: Path, content: str, dry_run: bool, outputs: list[str]) -> N
         print("DRY-RUN: would write {}".format(rel))
         return
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    with span("write_file", cat="io", path=rel, bytes=len(content)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
     print("WROTE: {}".format(rel))
 
 
-def build(dry_run: bool = False, check: bool = False) -> int:
-    validate_json_files()
-    template = require_template()
+@traced()
+def build(dry_run: bool = False, check: bool = False, profile: str = DEFAULT_PROFILE, store: bool = True) -> int:
+    with span("load_sources", cat="io"):
+        validate_json_files()
+        template = require_template()
+
+        source_state = collect_source_state()
+        shash = source_hash(source_state)
+        timestamp = utc_now()
 
-    source_state = collect_source_state()
-    shash = source_hash(source_state)
-    timestamp = utc_now()
+        health = load_health_summary()
+        repos = load_repo_metrics(dry_run=dry_run)
+        quotes = load_quotes()
+        quote = deterministic_quote(quotes, shash)
 
-    health = load_health_summary()
-    repos = load_repo_metrics()
-    quotes = load_quotes()
-    quote = deterministic_quote(quotes, shash)
+        cards_head = load_project_cards_head()
+        host = load_summary()
 
-    generated = generated_readme_block(shash, timestamp, health, repos)
-    readme = replace_generated_block(template, generated)
-    readme = update_header_metadata(readme, timestamp, shash[:16])
+    with span("render", cat="render", asset="README.md") as attrs:
+        generated = generated_readme_block(shash, timestamp, health, repos, cards_head)
+        readme = replace_generated_block(template, generated)
+        readme = update_header_metadata(readme, timestamp, shash[:16])
+        attrs["bytes"] = len(readme)
 
     outputs: list[str] = []
 
-    write_file(ASSETS / "flow-line.svg", generate_flow_line_svg(shash), dry_run, outputs)
-    write_file(ASSETS / "section_quote.svg", generate_quote_svg(quote), dry_run, outputs)
-    write_file(ASSETS / "system-health.svg", generate_health_svg(health), dry_run, outputs)
-    write_file(ASSETS / "system-matrix.svg", generate_system_matrix_svg(shash), dry_run, outputs)
-    write_file(ASSETS / "repo-metrics.svg", generate_metrics_svg(repos), dry_run, outputs)
+    renderers = (
+        ("flow-line.svg", lambda: generate_flow_line_svg(shash, profile)),
+        ("section_quote.svg", lambda: generate_quote_svg(quote, profile)),
+        ("system-health.svg", lambda: generate_health_svg(health, profile)),
+        ("system-matrix.svg", lambda: generate_system_matrix_svg(shash, profile, host)),
+        ("repo-metrics.svg", lambda: generate_metrics_svg(repos, profile)),
+    )
+    for name, render in renderers:
+        with span("render", cat="render", asset=name) as attrs:
+            svg = render()
+            attrs["bytes"] = len(svg)
+        write_file(ASSETS / name, svg, dry_run, outputs)
     write_file(README_OUT, readme, dry_run, outputs)
 
-    cards_manifest = project_cards_manifest()
+    cards_manifest = project_cards_manifest(cards_head)
 
     manifest = {
         "engine": "Lysergic GitHub Surface Engine",
@@ -777,20 +860,45 @@ def build(dry_run: bool = False, check: bool = False) -> int:
         "source_hash": shash,
         "short_sha": shash[:16],
         "outputs": outputs,
-        "project_cards_index": "assets/projects/index.json",
+        "project_cards_index": cards_manifest["index"],
         "project_cards_count": cards_manifest["count"],
         "project_cards": cards_manifest["cards"],
         "source_files": source_state,
         "status": "success",
     }
 
+    if profile != DEFAULT_PROFILE:
+        manifest["render_profile"] = profile
+
+    if host is not None:
+        manifest["host_samples"] = host
+
+    if "pages" in cards_manifest:
+        manifest["project_cards_pages"] = cards_manifest["pages"]
+
+    snapshot = None
+    if store and not dry_run:
+        with span("store_outputs", cat="io") as attrs:
+            snapshot = capture(exclude=(BUILD_MANIFEST,))
+            attrs.update(files=len(snapshot.files), new_blobs=snapshot.new_blobs)
+        manifest["artifacts"] = {
+            "build_id": snapshot.build_id,
+            "manifest": ".surface-store/builds/{}.json".format(snapshot.build_id),
+            "files": len(snapshot.files),
+        }
+
     write_file(
         DIST / "build-manifest.json",
-        json.dumps(manifest, indent=2, sort_keys=True) + "\n",
+        dumps_json(manifest, ensure_ascii=True),
         dry_run,
         outputs,
     )
 
+    if snapshot is not None:
+        snapshot.add(DIST / "build-manifest.json")
+        snapshot.commit(source_hash=shash)
+        print("STORED: build {} ({} new blobs)".format(snapshot.build_id, snapshot.new_blobs))
+
     if check:
         print("CHECK: template markers valid")
         print("CHECK: JSON files valid")
@@ -807,9 +915,12 @@ def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true", help="validate without mutating files")
     parser.add_argument("--check", action="store_true", help="print validation checks")
+    parser.add_argument("--no-store", action="store_true", help="do not capture outputs into .surface-store")
+    add_profile_argument(parser)
     args = parser.parse_args()
 
-    return build(dry_run=args.dry_run, check=args.check)
+    with PipelineLog("build", echo=False, dry_run=args.dry_run) as log, log.span("README build", profile=args.profile):
+        return build(dry_run=args.dry_run, check=args.check, profile=args.profile, store=not args.no_store)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Cheap change-detection preflight before a full collection.
+
+Reads:
+  - dist/registry-index.json         registry repositories and their owners
+  - tmp/preflight/state.json         ETags, owner types, last event ids, per-repo fingerprints
+  - GitHub, conditionally (If-None-Match), concurrently on one pooled client:
+      /users/<owner>/events          new activity since the last seen event id
+                                     (/orgs/<owner>/events once the owner is known as an org)
+      /users/<owner>/repos           one batched call per owner: pushed_at, stars, forks,
+                                     ... of up to LISTING_PAGE repos
+      /repos/<owner>/<name>          only for registry repos the listing did not cover
+      /repos/<surface>/actions/runs  latest completed run of another workflow: id,
+                                     status and conclusion (status=completed)
+
+Writes:
+  - tmp/preflight/state.json         after every planned stage succeeded (run), or
+                                     on accept after the caller's own build
+  - tmp/preflight/pending.json       the state a check --record would save
+  - $GITHUB_OUTPUT                   quiet=true|false when set, for workflow step gating
+  - logs/pipeline.jsonl              stage "preflight" events (scripts/pipeline_log.py)
+
+Used by:
+  - .github/workflows/readme-sync.yml   check --record gates the full make build,
+                                        accept records the state once it succeeded
+  - make refresh                        run
+
+Commands:
+  - check [--record]                 probe and print the per-repo decisions; nothing runs,
+                                     --record keeps the would-be state in pending.json
+  - accept                           promote pending.json to state.json (no probes)
+  - run [--dry-run] [--force]        probe, then run only the needed stages through
+                                     scripts/webhook_receiver.py run_stages()
+
+Rules:
+  - per repo: metrics when a collected field moved (pushed_at, stars, description,
+    ...) or new events name it; sync when stars/forks/watchers moved on an enabled
+    repo; cards when a card field moved; readme when any of those run or the
+    latest workflow run changed (which also refreshes the workflow panel)
+  - a probe without a usable answer (network error, rate limit, HTTP error) counts
+    as changed, so the preflight can skip work but never hide an update; the
+    events feed only adds reasons, the listing and repo probes decide
+  - "all quiet": every probe answered 304 or matched the stored fingerprints;
+    nothing runs, the state is left as is and the process exits 0
+  - the state is saved only after a successful run (or accept), so a failed
+    collection is retried next time; --force ignores the stored state
+  - the workflow probe skips the current run (GITHUB_RUN_ID) and readme-sync's
+    own runs, which would otherwise change on every scheduled sync
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from github_client import RATE_LIMIT, GitHubClient, github_token
+from pipeline_log import PipelineLog, run_id
+from registry_index import load_index
+from surface_io import encode_jsonl_line, load_json, write_json
+from webhook_receiver import run_stages, surface_repo
+
+ROOT = Path(__file__).resolve().parent.parent
+STATE_FILE = ROOT / "tmp" / "preflight" / "state.json"
+PENDING_FILE = STATE_FILE.with_name("pending.json")
+
+PROBE_TIMEOUT = 5
+PROBE_WORKERS = 8
+LISTING_PAGE = 100
+EVENTS_PAGE = 30
+WORKFLOW_PAGE = 10
+# Runs of the workflow that runs this preflight never count as a change.
+SELF_WORKFLOW = ".github/workflows/readme-sync.yml"
+
+# Fields of a repository payload that each output depends on.
+COLLECT_FIELDS = (
+    "description",
+    "language",
+    "stargazers_count",
+    "forks_count",
+    "watchers_count",
+    "open_issues_count",
+    "default_branch",
+    "archived",
+    "disabled",
+    "private",
+    "pushed_at",
+    "updated_at",
+    "html_url",
+)
+SYNC_FIELDS = ("stargazers_count", "watchers_count", "forks_count")
+CARD_FIELDS = ("html_url", "description", "language", "stargazers_count", "forks_count", "open_issues_count", "updated_at", "pushed_at")
+
+Probe = tuple[int, Any, str | None, str | None]
+
+
+def field_hash(item: dict[str, Any], fields: tuple[str, ...]) -> str:
+    return hashlib.sha256(encode_jsonl_line({field: item.get(field) for field in fields})).hexdigest()[:16]
+
+
+def fingerprints(item: dict[str, Any]) -> dict[str, str]:
+    return {
+        "collect": field_hash(item, COLLECT_FIELDS),
+        "sync": field_hash(item, SYNC_FIELDS),
+        "card": field_hash(item, CARD_FIELDS),
+    }
+
+
+def load_state() -> dict[str, Any]:
+    state = load_json(STATE_FILE, {}, strict=False)
+    state = state if isinstance(state, dict) else {}
+    for key in ("etags", "owners", "repos"):
+        if not isinstance(state.get(key), dict):
+            state[key] = {}
+    return state
+
+
+def events_path(owner: str, info: dict[str, Any]) -> str:
+    scope = "orgs" if info.get("type") == "Organization" else "users"
+    return f"/{scope}/{owner}/events?per_page={EVENTS_PAGE}"
+
+
+def listing_path(owner: str) -> str:
+    return f"/users/{owner}/repos?per_page={LISTING_PAGE}&sort=pushed"
+
+
+def workflow_path(repo: str) -> str:
+    return f"/repos/{repo}/actions/runs?status=completed&per_page={WORKFLOW_PAGE}"
+
+
+def latest_foreign_run(runs: Any) -> dict[str, Any]:
+    """Newest run that is neither this job's run nor a run of SELF_WORKFLOW."""
+    current = os.environ.get("GITHUB_RUN_ID")
+    for run in runs if isinstance(runs, list) else []:
+        if not isinstance(run, dict) or str(run.get("id")) == current or run.get("path") == SELF_WORKFLOW:
+            continue
+        return run
+    return {}
+
+
+class Preflight:
+    """Probes change signals and turns them into a repo -> stages batch."""
+
+    def __init__(self, client: GitHubClient, state: dict[str, Any], surface: str | None) -> None:
+        self.client = client
+        self.state = state
+        self.surface = surface
+        # The state to save after a successful run; starts as the old one.
+        self.next_state: dict[str, Any] = {
+            "etags": dict(state["etags"]),
+            "owners": {owner: dict(info) for owner, info in state["owners"].items()},
+            "repos": dict(state["repos"]),
+            "workflow": state.get("workflow"),
+        }
+        self.batch: dict[str, set[str]] = {}
+        self.reasons: dict[str, list[str]] = {}
+        self.probes = 0
+
+    def probe_all(self, paths: list[str]) -> dict[str, Probe]:
+        self.probes += len(paths)
+        if not paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(paths))) as pool:
+            results = pool.map(lambda path: self.client.get_conditional(path, self.state["etags"].get(path), PROBE_TIMEOUT), paths)
+            return dict(zip(paths, results))
+
+    def answered(self, path: str, result: Probe) -> bool:
+        """True for 200/304; records the new ETag of a 200."""
+        status, _body, _error, etag = result
+        if status == 200 and etag:
+            self.next_state["etags"][path] = etag
+        return status in (200, 304)
+
+    def mark(self, key: str, stages: set[str], reason: str) -> None:
+        if not stages:
+            return
+        self.batch.setdefault(key, set()).update(stages | {"readme"})
+        self.reasons.setdefault(key, []).append(reason)
+
+    def compare(self, entry: dict[str, Any], item: dict[str, Any], via: str) -> None:
+        key = entry["key"]
+        new = fingerprints(item)
+        old = self.state["repos"].get(key) or {}
+        self.next_state["repos"][key] = {"via": via, **new}
+
+        stages = set()
+        if new["collect"] != old.get("collect"):
+            stages.add("metrics")
+        if new["sync"] != old.get("sync") and entry["enabled"]:
+            stages.add("sync")
+        if new["card"] != old.get("card"):
+            stages.add("cards")
+        self.mark(key, stages, f"{via} changed" if old else "no previous state")
+
+    def assume_changed(self, entry: dict[str, Any], reason: str) -> None:
+        stages = {"metrics", "cards"} | ({"sync"} if entry["enabled"] else set())
+        self.mark(entry["key"], stages, reason)
+
+    def plan(self, registry: list[dict[str, Any]]) -> dict[str, set[str]]:
+        by_owner: dict[str, list[dict[str, Any]]] = {}
+        for entry in registry:
+            by_owner.setdefault(entry["owner"], []).append(entry)
+
+        paths = []
+        for owner in sorted(by_owner):
+            paths += [listing_path(owner), events_path(owner, self.state["owners"].get(owner.lower(), {}))]
+        if self.surface:
+            paths.append(workflow_path(self.surface))
+        results = self.probe_all(paths)
+
+        unlisted: list[dict[str, Any]] = []
+        for owner, entries in sorted(by_owner.items()):
+            info = self.next_state["owners"].setdefault(owner.lower(), {})
+
+            path = listing_path(owner)
+            result = results[path]
+            if not self.answered(path, result):
+                for entry in entries:
+                    self.assume_changed(entry, f"owner listing failed (HTTP {result[0]})")
+            elif result[0] == 304:
+                unlisted += [entry for entry in entries if (self.state["repos"].get(entry["key"]) or {}).get("via") != "listing"]
+            else:
+                listed = {}
+                for item in result[1] if isinstance(result[1], list) else []:
+                    if isinstance(item, dict) and item.get("full_name"):
+                        listed[str(item["full_name"]).lower()] = item
+                        info["type"] = (item.get("owner") or {}).get("type") or info.get("type")
+                for entry in entries:
+                    if entry["key"] in listed:
+                        self.compare(entry, listed[entry["key"]], "listing")
+                    else:
+                        unlisted.append(entry)
+
+            path = events_path(owner, self.state["owners"].get(owner.lower(), {}))
+            result = results[path]
+            if self.answered(path, result) and result[0] == 200 and isinstance(result[1], list):
+                self.new_events(info, result[1], {entry["key"] for entry in entries})
+
+        repo_results = self.probe_all([f"/repos/{entry['full_name']}" for entry in unlisted])
+        for entry in unlisted:
+            path = f"/repos/{entry['full_name']}"
+            result = repo_results[path]
+            if not self.answered(path, result):
+                self.assume_changed(entry, f"repo probe failed (HTTP {result[0]})")
+            elif result[0] == 200 and isinstance(result[1], dict):
+                self.compare(entry, result[1], "repo")
+
+        if self.surface:
+            self.workflow(results[workflow_path(self.surface)])
+        return self.batch
+
+    def new_events(self, info: dict[str, Any], events: list[Any], keys: set[str]) -> None:
+        last = int(info.get("last_event") or 0)
+        ids = []
+        for event in events:
+            if not isinstance(event, dict) or not str(event.get("id", "")).isdigit():
+                continue
+            ids.append(int(event["id"]))
+            key = str((event.get("repo") or {}).get("name") or "").lower()
+            # Without a previous id every event is "new"; the fingerprints decide instead.
+            if last and int(event["id"]) > last and key in keys:
+                self.mark(key, {"metrics"}, f"event {event.get('type')}")
+        if ids:
+            info["last_event"] = max(ids + [last])
+
+    def workflow(self, result: Probe) -> None:
+        path = workflow_path(str(self.surface))
+        key = str(self.surface).lower()
+        stages = {"workflow", "workflow_panel"}
+        if not self.answered(path, result):
+            self.mark(key, stages, f"workflow probe failed (HTTP {result[0]})")
+            return
+        if result[0] == 304:
+            return
+
+        latest = latest_foreign_run(result[1].get("workflow_runs") if isinstance(result[1], dict) else None)
+        signature = {"repo": key, "run": latest.get("id"), "status": latest.get("status"), "conclusion": latest.get("conclusion")}
+        if signature != self.state.get("workflow"):
+            self.mark(key, stages, f"workflow run {latest.get('id')} {latest.get('conclusion') or latest.get('status')}")
+        self.next_state["workflow"] = signature
+
+
+def github_output(quiet: bool) -> None:
+    target = os.environ.get("GITHUB_OUTPUT")
+    if target:
+        with open(target, "a", encoding="utf-8") as handle:
+            handle.write(f"quiet={'true' if quiet else 'false'}\n")
+
+
+def main() -> int:
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Probe cheap change signals before collecting")
+    commands = parser.add_subparsers(dest="command", required=True)
+    inspect = commands.add_parser("check", help="print per-repo decisions without running anything")
+    inspect.add_argument("--record", action="store_true", help="keep the would-be state for a later accept")
+    commands.add_parser("accept", help="save the state recorded by check --record (after the build succeeded)")
+    execute = commands.add_parser("run", help="run only the stages the probes call for")
+    execute.add_argument("--dry-run", action="store_true", help="pass --dry-run to every stage and keep the state")
+    execute.add_argument("--force", action="store_true", help="ignore the stored state; every repo counts as changed")
+    args = parser.parse_args()
+
+    if args.command == "accept":
+        if not PENDING_FILE.exists():
+            print(f"SKIP: {PENDING_FILE.relative_to(ROOT)} missing; nothing to accept")
+            return 0
+        os.replace(PENDING_FILE, STATE_FILE)
+        print(f"ACCEPTED: {STATE_FILE.relative_to(ROOT)}")
+        return 0
+
+    dry_run = args.command == "check" or args.dry_run
+    log = PipelineLog("preflight", dry_run=args.command == "check")
+    registry = list(load_index(write=False).registry())
+    state = load_state()
+    if args.command == "run" and args.force:
+        state = {"etags": {}, "owners": state["owners"], "repos": {}}
+
+    client = GitHubClient(github_token(), pool_size=PROBE_WORKERS)
+    RATE_LIMIT.load()
+    preflight = Preflight(client, state, surface_repo())
+    try:
+        batch = preflight.plan(registry)
+    finally:
+        client.close()
+        RATE_LIMIT.save(dry_run=dry_run)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    github_output(not batch)
+    if args.command == "check" and args.record:
+        if batch:
+            write_json(PENDING_FILE, preflight.next_state)
+        else:
+            PENDING_FILE.unlink(missing_ok=True)
+    if not batch:
+        log("INFO", f"All quiet: {preflight.probes} probes, nothing to rebuild", ms=elapsed_ms)
+        log.close()
+        return 0
+
+    for key in sorted(batch):
+        log("INFO", f"Changed {key}: {', '.join(sorted(batch[key]))} ({'; '.join(preflight.reasons[key])})", repo=key)
+    log("INFO", f"Preflight planned {len(batch)} repos from {preflight.probes} probes", ms=elapsed_ms)
+
+    if args.command == "check":
+        log.close()
+        return 0
+
+    with log.span("Targeted rebuild", repos=sorted(batch)) as fields:
+        fields["ok"] = ok = run_stages(batch, log, run_id(), dry_run=args.dry_run)
+    if ok and not args.dry_run:
+        write_json(STATE_FILE, preflight.next_state)
+    log.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Reads:
   - .github/workflows/*.yml
   - git remote origin URL
   - optional GITHUB_TOKEN / GH_TOKEN
+  - tmp/github_rate_limit.json (read and updated; shared with the other GitHubClient users)
 Writes:
   - telemetry/workflows.json
 Rules:
@@ -17,14 +18,14 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
-import os
 import re
 import subprocess
 import sys
-import urllib.error
-import urllib.request
 from pathlib import Path
 from typing import Any
+from github_client import RATE_LIMIT, GitHubClient, github_token
+from pipeline_trace import span
+from surface_io import write_json
 ROOT = Path(__file__).resolve().parent.parent
 WORKFLOWS_DIR = ROOT / ".github" / "workflows"
 OUT = ROOT / "telemetry" / "workflows.json"
@@ -44,14 +45,6 @@ def run_cmd(args: list[str], timeout: int = 15) -> tuple[int, str, str]:
         return proc.returncode, proc.stdout, proc.stderr
     except Exception as exc:
         return 1, "", str(exc)
-def write_json(path: Path, payload: Any, dry_run: bool = False) -> None:
-    encoded = json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
-    if dry_run:
-        print(f"DRY-RUN: would write {path.relative_to(ROOT)}")
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(encoded, encoding="utf-8")
-    print(f"WROTE: {path.relative_to(ROOT)}")
 def workflow_files() -> list[dict[str, str]]:
     files: list[dict[str, str]] = []
     if not WORKFLOWS_DIR.exists():
@@ -111,26 +104,18 @@ def collect_with_gh(limit: int) -> tuple[bool, list[dict[str, Any]], str | None]
             }
         )
     return True, sorted(runs, key=lambda run: str(run.get("created_at") or ""), reverse=True), None
-def github_api_request(path: str, token: str | None, timeout: int) -> tuple[int, dict[str, Any] | None, str | None]:
-    url = f"https://api.github.com{path}"
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "popdeuxrem-workflow-telemetry",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    req = urllib.request.Request(url, headers=headers, method="GET")
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return int(response.status), json.loads(response.read().decode("utf-8")), None
-    except urllib.error.HTTPError as exc:
-        return int(exc.code), None, exc.read().decode("utf-8", errors="replace")[:500]
-    except Exception as exc:
-        return 0, None, str(exc)
 def collect_with_api(repo_slug: str, limit: int, timeout: int) -> tuple[bool, list[dict[str, Any]], str | None]:
-    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-    status, payload, error = github_api_request(f"/repos/{repo_slug}/actions/runs?per_page={limit}", token, timeout)
+    with span("collect_with_api", cat="collect", repo=repo_slug) as attrs:
+        ok, runs, error = fetch_runs_with_api(repo_slug, limit, timeout, attrs)
+        attrs["runs"] = len(runs)
+        return ok, runs, error
+def fetch_runs_with_api(repo_slug: str, limit: int, timeout: int, attrs: dict[str, Any]) -> tuple[bool, list[dict[str, Any]], str | None]:
+    client = GitHubClient(github_token(), pool_size=1)
+    try:
+        status, payload, error = client.get(f"/repos/{repo_slug}/actions/runs?per_page={limit}", timeout=timeout)
+    finally:
+        client.close()
+    attrs["http_status"] = status
     if status != 200 or not isinstance(payload, dict):
         return False, [], f"GitHub API status={status}; {error or 'unknown error'}"
     raw_runs = payload.get("workflow_runs", [])
@@ -210,7 +195,9 @@ def main() -> int:
     if not ok:
         source = "api"
         if repo_slug:
+            RATE_LIMIT.load()
             ok, runs, error = collect_with_api(repo_slug, args.limit, args.timeout)
+            RATE_LIMIT.save(dry_run=args.dry_run)
         else:
             error = error or "could not infer GitHub repository slug"
     if not ok:
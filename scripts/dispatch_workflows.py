@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Concurrent workflow_dispatch across the registry (entry point: systems/orchestrator/dispatch.sh).
+
+Reads:
+  - identity/repos.json              "repositories" + "sync_settings"
+
+Writes:
+  - logs/pipeline.jsonl              stage "dispatch" events (scripts/pipeline_log.py)
+  - tmp/github_rate_limit.json       shared rate-limit state (scripts/github_client.py)
+
+Commands:
+  - dispatch <repo> <workflow> [ref] [inputs]   one registry repo
+  - broadcast <workflow> [ref] [inputs]         every enabled repo, concurrently
+  - dashboard [repo]                            update.yml on the dashboard repo
+  - list                                        registered repositories
+
+Rules:
+  - all POSTs share one pooled GitHubClient, bounded by --concurrency
+  - each repo gets its own deadline (--deadline, default sync_settings
+    timeout_seconds); retries (retry_attempts / retry_delay_seconds) happen
+    inside that deadline and only for transient failures (no response,
+    429, 5xx)
+  - every attempt uses the time left before the deadline as its socket
+    timeout; an in-flight POST is never cancelled, so a dispatch reported
+    as "timeout" was not sent after the report
+  - unauthenticated runs make a single attempt, as GitHub rejects them
+  - prints one result row per repo; exit status 1 when any dispatch fails
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any
+
+from github_client import RATE_LIMIT, GitHubClient, github_token
+from pipeline_log import PipelineLog
+from registry_index import RegistryIndex, load_index
+from sync_orchestrator import DEFAULT_CONCURRENCY, ROOT
+
+DISPATCH_OK = (200, 204)
+DEFAULT_DASHBOARD = "dashboard"
+DASHBOARD_WORKFLOW = "update.yml"
+
+
+class DispatchResult:
+    __slots__ = ("repo", "status", "http_status", "attempts", "elapsed_ms", "detail")
+
+    def __init__(self, repo: str) -> None:
+        self.repo = repo
+        self.status = "failed"
+        self.http_status = 0
+        self.attempts = 0
+        self.elapsed_ms = 0
+        self.detail = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("dispatched", "planned")
+
+
+def transient(status: int) -> bool:
+    return status == 0 or status == 429 or status >= 500
+
+
+async def post_dispatch(
+    client: GitHubClient,
+    result: DispatchResult,
+    path: str,
+    payload: dict[str, Any],
+    settings: dict[str, int],
+    deadline: float,
+    log: PipelineLog,
+) -> None:
+    attempts = settings["retry_attempts"] if client.authenticated else 1
+    deadline_at = time.monotonic() + deadline
+
+    for attempt in range(1, attempts + 1):
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            result.status = "timeout"
+            result.detail = f"deadline {deadline:g}s exceeded"
+            return
+        result.attempts = attempt
+        status, _, error = await asyncio.to_thread(client.post, path, payload, remaining)
+        result.http_status = status
+
+        if status in DISPATCH_OK:
+            result.status = "dispatched"
+            result.detail = ""
+            return
+
+        lines = (error or "").strip().splitlines()
+        result.detail = lines[0][:120] if lines else f"HTTP {status}"
+        log("WARN", f"Attempt {attempt}/{attempts} failed for {result.repo} (HTTP {status})")
+        if not transient(status):
+            return
+        if time.monotonic() >= deadline_at:
+            result.status = "timeout"
+            result.detail = f"deadline {deadline:g}s exceeded"
+            return
+        if attempt < attempts:
+            await asyncio.sleep(min(settings["retry_delay_seconds"], max(0.0, deadline_at - time.monotonic())))
+
+
+async def dispatch_repo(
+    client: GitHubClient,
+    item: dict[str, Any],
+    workflow: str,
+    ref: str,
+    inputs: dict[str, Any],
+    settings: dict[str, int],
+    deadline: float,
+    gate: asyncio.Semaphore,
+    log: PipelineLog,
+    dry_run: bool = False,
+) -> DispatchResult:
+    owner, name = str(item["owner"]), str(item["name"])
+    result = DispatchResult(f"{owner}/{name}")
+    path = f"/repos/{owner}/{name}/actions/workflows/{workflow}/dispatches"
+
+    if dry_run:
+        result.status = "planned"
+        result.detail = f"POST {path}"
+        return result
+
+    async with gate:
+        started = time.monotonic()
+        log("INFO", f"Dispatching workflow {workflow} on {result.repo} (ref: {ref})")
+        await post_dispatch(client, result, path, {"ref": ref, "inputs": inputs}, settings, deadline, log)
+        result.elapsed_ms = int((time.monotonic() - started) * 1000)
+
+    level = "INFO" if result.ok else "ERROR"
+    log(
+        level,
+        f"Dispatch {result.status} on {result.repo}" + (f": {result.detail}" if result.detail else ""),
+        ms=result.elapsed_ms,
+        repo=result.repo,
+        http_status=result.http_status,
+        attempts=result.attempts,
+    )
+    return result
+
+
+async def dispatch_all(
+    targets: list[dict[str, Any]],
+    workflow: str,
+    ref: str = "main",
+    inputs: dict[str, Any] | None = None,
+    settings: dict[str, int] | None = None,
+    deadline: float | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    log: PipelineLog | None = None,
+    dry_run: bool = False,
+) -> list[DispatchResult]:
+    """Dispatch ``workflow`` to every target concurrently; results keep target order."""
+    if settings is None:
+        settings = dict(load_index(write=not dry_run).settings)
+    log = log or PipelineLog("dispatch", dry_run=True)
+    deadline = deadline or float(settings["timeout_seconds"] or 60)
+
+    client = GitHubClient(github_token(), pool_size=concurrency)
+    if not client.authenticated:
+        log("WARN", "GITHUB_TOKEN not set, using unauthenticated request (rate limited)")
+
+    RATE_LIMIT.load()
+    gate = asyncio.Semaphore(max(1, concurrency))
+    try:
+        return await asyncio.gather(
+            *(
+                dispatch_repo(client, item, workflow, ref, inputs or {}, settings, deadline, gate, log, dry_run=dry_run)
+                for item in targets
+            )
+        )
+    finally:
+        client.close()
+        RATE_LIMIT.save(dry_run=dry_run)
+
+
+def result_table(results: list[DispatchResult]) -> str:
+    rows = [("REPO", "STATUS", "HTTP", "TRIES", "MS", "DETAIL")]
+    rows.extend(
+        (item.repo, item.status, str(item.http_status or "-"), str(item.attempts), str(item.elapsed_ms), item.detail)
+        for item in results
+    )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]) - 1)]
+    return "\n".join(
+        ("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1]).rstrip() for row in rows
+    )
+
+
+def find_repo(index: RegistryIndex, name: str) -> dict[str, Any] | None:
+    """O(1) registry lookup by name, owner/name or project id."""
+    return index.repository(name)
+
+
+def parse_inputs(raw: str) -> dict[str, Any]:
+    try:
+        inputs = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Invalid inputs JSON: {exc}") from exc
+    if not isinstance(inputs, dict):
+        raise SystemExit("Invalid inputs JSON: expected an object")
+    return inputs
+
+
+def list_repos(repos: list[dict[str, Any]]) -> None:
+    print("Registered Repositories:")
+    for item in repos:
+        state = "enabled" if item.get("enabled") is True else "disabled"
+        print(f"  {item['name']} ({item['registry'].get('type')}) - {item['owner']} [{state}]")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Orchestrator Dispatch - Multi-repo workflow trigger")
+    parser.add_argument("--deadline", type=float, default=None, help="per-repo deadline in seconds (default: sync_settings timeout_seconds)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="maximum in-flight dispatches")
+    parser.add_argument("--dry-run", action="store_true", help="print planned dispatches without calling GitHub")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    single = commands.add_parser("dispatch", help="dispatch a workflow to one registry repo")
+    single.add_argument("repo")
+    single.add_argument("workflow")
+    single.add_argument("ref", nargs="?", default="main")
+    single.add_argument("inputs", nargs="?", default="{}")
+
+    broadcast = commands.add_parser("broadcast", help="dispatch a workflow to every enabled repo")
+    broadcast.add_argument("workflow")
+    broadcast.add_argument("ref", nargs="?", default="main")
+    broadcast.add_argument("inputs", nargs="?", default="{}")
+
+    dashboard = commands.add_parser("dashboard", help=f"run {DASHBOARD_WORKFLOW} on the dashboard repo")
+    dashboard.add_argument("repo", nargs="?", default=DEFAULT_DASHBOARD)
+
+    commands.add_parser("list", help="list registered repositories")
+    args = parser.parse_args()
+
+    index = load_index(write=not args.dry_run)
+    repos, settings = list(index.registry()), dict(index.settings)
+
+    if args.command == "list":
+        list_repos(repos)
+        return 0
+
+    log = PipelineLog("dispatch", dry_run=args.dry_run)
+    try:
+        if args.command == "broadcast":
+            targets = [item for item in repos if item.get("enabled") is True]
+            workflow, ref, inputs = args.workflow, args.ref, parse_inputs(args.inputs)
+            log("INFO", f"Dispatching workflow to {len(targets)} enabled repos")
+        else:
+            name = args.repo
+            item = find_repo(index, name)
+            if item is None:
+                log("ERROR", f"Repository not found in registry: {name}")
+                return 1
+            if args.command == "dispatch" and item.get("enabled") is not True:
+                log("WARN", f"Repository disabled: {name}")
+                return 1
+            if args.command == "dashboard":
+                workflow, ref, inputs = DASHBOARD_WORKFLOW, "main", {"trigger": "orchestrator"}
+                if not (ROOT / "metrics" / "aggregate.json").exists():
+                    log("WARN", "No aggregate metrics found")
+            else:
+                workflow, ref, inputs = args.workflow, args.ref, parse_inputs(args.inputs)
+            targets = [item]
+
+        results = asyncio.run(
+            dispatch_all(
+                targets,
+                workflow,
+                ref,
+                inputs,
+                settings=settings,
+                deadline=args.deadline,
+                concurrency=max(1, args.concurrency),
+                log=log,
+                dry_run=args.dry_run,
+            )
+        )
+    finally:
+        log.close()
+
+    print(result_table(results))
+    failed = sum(1 for item in results if not item.ok)
+    print(f"SUMMARY: repos={len(results)} dispatched={len(results) - failed} failed={failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
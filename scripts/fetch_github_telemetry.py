@@ -13,16 +13,16 @@ import urllib.error
 from pathlib import Path
 from typing import Any
 
+from registry_index import load_index
+from surface_io import write_json
+
 ROOT = Path(__file__).resolve().parent.parent
-PROJECTS_JSON = ROOT / "data" / "projects.json"
 METRICS_JSON = ROOT / "metrics" / "github_telemetry.json"
 CACHE_TTL_SECONDS = 3600
 
 
 def load_projects() -> list[dict[str, Any]]:
-    if not PROJECTS_JSON.exists():
-        return []
-    return json.loads(PROJECTS_JSON.read_text(encoding="utf-8")).get("projects", [])
+    return load_index().projects()
 
 
 def fetch_repo_data(repo: str, token: str | None = None) -> dict[str, Any]:
@@ -97,6 +97,7 @@ def main() -> int:
             "stars": repo_data.get("stargazers_count", project.get("stars", 0)),
             "forks": repo_data.get("forks_count", 0),
             "open_issues": repo_data.get("open_issues_count", 0),
+            "language": repo_data.get("language"),
             "updated_at": repo_data.get("updated_at", ""),
             "workflow_status": workflow_status,
             "latest_run": latest_run,
@@ -114,9 +115,7 @@ def main() -> int:
         "projects": telemetry,
     }
 
-    METRICS_JSON.parent.mkdir(parents=True, exist_ok=True)
-    METRICS_JSON.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-    print(f"WROTE: {METRICS_JSON.relative_to(ROOT)}")
+    write_json(METRICS_JSON, payload, ensure_ascii=True)
     return 0
 
 
@@ -1,19 +1,74 @@
 #!/usr/bin/env python3
 """
 Deterministic GitHub Pages surface generator.
-Generates index.html from canonical data/projects.json.
+Builds an incremental static site from canonical data/projects.json.
 No external dependencies. Pure stdlib.
+
+Writes:
+  - index.html                      listing page 1
+  - site/page/<n>.html              listing pages 2..N (PAGE_SIZE projects each)
+  - site/projects/<id>.html         one detail page per project
+  - site/assets/surface.<hash>.css  content-hashed stylesheet, safe to cache forever
+  - site/assets/search.<hash>.js    content-hashed search/filter client
+  - site/assets/grid.<hash>.js      content-hashed virtualized grid (--grid virtual only)
+  - site/chunks/<n>.json            CHUNK_SIZE cards per chunk (--grid virtual)
+  - site/search.json                precomputed token and facet index (compact)
+  - site/manifest.json              page -> input fingerprint and project ids
+
+Rules:
+  - a page is rewritten only when its input fingerprint changed or the file is missing
+  - fingerprints cover the rendered view of each project, not whole input files
+  - pages and hashed assets dropped from the manifest are removed
+  - shared assets are minified before hashing, so minify_surface.py never changes their bytes
+  - detail slugs are unique; ids that slugify alike get an id-derived suffix
+  - per-page weight is bounded by PAGE_SIZE; styles and scripts live in shared assets
+  - --grid virtual: index.html holds FIRST_SCREEN cards; the rest are lazy-loaded
+    from chunks and rendered through a fixed-row virtual window, so first paint and
+    DOM node count do not depend on the project count
+  - search.json has a stable name so listing pages do not change when projects do;
+    it is rewritten only when its bytes change
+
+Search index (site/search.json):
+  - docs: [name, detail path relative to site/, status, domain, language]
+  - tokens: token -> ascending doc numbers
+  - facets: facet -> value -> base64 bitset, bit n set when doc n matches
 """
 from __future__ import annotations
+import argparse
+import base64
 import hashlib
+import html
 import json
+import os
+import re
 from pathlib import Path
 from typing import Any
 
+from minify_surface import minify_text
+from registry_index import load_index
+from surface_io import StagedWriter, encode_jsonl_line, load_json, remove_file, write_json
+
 ROOT = Path(__file__).resolve().parent.parent
-PROJECTS_JSON = ROOT / "data" / "projects.json"
 METRICS_JSON = ROOT / "metrics" / "github_telemetry.json"
 OUTPUT_HTML = ROOT / "index.html"
+SITE_DIR = ROOT / "site"
+SITE_ASSETS = SITE_DIR / "assets"
+SITE_MANIFEST = SITE_DIR / "manifest.json"
+SEARCH_JSON = SITE_DIR / "search.json"
+
+PAGE_SIZE = 24
+GRID_MODES = ("paged", "virtual")
+FIRST_SCREEN = 12
+CHUNK_SIZE = 48
+CHUNK_TEMPLATE = "{n}.json"
+SITE_CHUNKS = SITE_DIR / "chunks"
+# .sys-virtual .sys-card height plus the 1.25rem grid gap.
+ROW_HEIGHT = 240
+
+SEARCH_FACETS = ("status", "domain", "language")
+
+# Bump whenever page markup changes so every page is rewritten.
+TEMPLATE_VERSION = "2"
 
 STATUS_COLORS = {
     "SHIP": ("rgba(74, 222, 128, 0.15)", "#4ade80"),
@@ -23,22 +78,284 @@ STATUS_COLORS = {
     "EXPERIMENTAL": ("rgba(34, 211, 238, 0.15)", "#22d3ee"),
 }
 
+ACCENTS = {
+    "popdeuxrem": ("#b44fff", "rgba(180,79,255,0.08)"),
+    "shadow-scripts": ("#00ffe0", "rgba(0,255,224,0.07)"),
+    "lysergic-systems": ("#ff3cac", "rgba(255,60,172,0.08)"),
+}
+
+ACCENT_PALETTE = [
+    ("#b44fff", "rgba(180,79,255,0.08)"),
+    ("#00ffe0", "rgba(0,255,224,0.07)"),
+    ("#ff3cac", "rgba(255,60,172,0.08)"),
+    ("#7aa2ff", "rgba(122,162,255,0.08)"),
+    ("#f5d76e", "rgba(245,215,110,0.07)"),
+]
+
+STYLESHEET = """* { margin: 0; padding: 0; box-sizing: border-box; }
+[hidden] { display: none !important; }
+body {
+  background: #0a0a0f;
+  font-family: 'JetBrains Mono', monospace;
+  color: #999;
+  min-height: 100vh;
+  padding: 3rem 1rem;
+}
+#deployed-systems {
+  max-width: 900px;
+  margin: 0 auto;
+}
+.sys-header {
+  text-align: center;
+  margin-bottom: 2.5rem;
+}
+.sys-header h2 {
+  letter-spacing: 0.35em;
+  color: #fff;
+  font-size: 1.1rem;
+  font-weight: normal;
+}
+.sys-header p {
+  color: #666;
+  font-size: 0.75rem;
+  letter-spacing: 0.2em;
+  margin-top: 0.5rem;
+}
+.sys-grid {
+  display: grid;
+  grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+  gap: 1.25rem;
+}
+.sys-card {
+  position: relative;
+  background: #0d0d0f;
+  border: 1px solid #1f1f2e;
+  border-radius: 6px;
+  padding: 1.5rem;
+  overflow: hidden;
+  opacity: 0;
+  transform: translateY(24px);
+  animation: cardEntrance 0.6s ease forwards;
+  transition: border-color 0.3s ease, box-shadow 0.3s ease, transform 0.3s ease;
+  text-decoration: none;
+  display: block;
+  color: inherit;
+}
+.sys-card:nth-child(1) { animation-delay: 0.05s; }
+.sys-card:nth-child(2) { animation-delay: 0.15s; }
+.sys-card:nth-child(3) { animation-delay: 0.25s; }
+@keyframes cardEntrance { to { opacity:1; transform:translateY(0); } }
+.sys-card::before {
+  content:''; position:absolute; inset:0;
+  background: var(--card-glow); opacity:0;
+  transition: opacity 0.4s ease; pointer-events:none; border-radius:6px;
+}
+.sys-card:hover::before { opacity:1; }
+.sys-card:hover {
+  transform: translateY(-3px);
+  border-color: var(--accent);
+  box-shadow: 0 0 20px -6px var(--accent);
+}
+.sys-detail { opacity:1; transform:none; animation:none; }
+.sys-card-top { display:flex; align-items:center; justify-content:space-between; margin-bottom:0.75rem; }
+.sys-name { font-size:0.9rem; font-weight:700; color:var(--accent); letter-spacing:0.05em; margin:0; }
+.sys-status { font-size:0.6rem; font-weight:700; letter-spacing:0.15em; padding:2px 8px; border-radius:3px; text-transform:uppercase; }
+.status-SHIP  { background:rgba(0,255,100,0.12); color:#00ff64; border:1px solid #00ff6440; }
+.status-BUILD { background:rgba(255,160,0,0.12);  color:#ffa000; border:1px solid #ffa00040; }
+.sys-domain { font-size:0.65rem; color:#444; letter-spacing:0.15em; text-transform:uppercase; margin-bottom:0.75rem; }
+.sys-desc   { font-size:0.72rem; color:#888; line-height:1.65; margin:0 0 1.1rem; }
+.sys-footer { display:flex; align-items:center; justify-content:space-between; border-top:1px solid #1a1a2a; padding-top:0.75rem; }
+.sys-stars  { font-size:0.65rem; color:#555; letter-spacing:0.1em; }
+.sys-stars span { color:#ffd700; margin-right:4px; }
+.sys-link   { font-size:0.65rem; color:var(--accent); letter-spacing:0.1em; text-decoration:none; opacity:0.7; transition:opacity 0.2s; }
+.sys-link:hover { opacity:1; }
+.sys-pager { display:flex; justify-content:center; gap:1rem; margin-top:2rem; font-size:0.7rem; letter-spacing:0.15em; }
+.sys-pager a { color:#b44fff; text-decoration:none; }
+.sys-search { display:flex; flex-wrap:wrap; gap:0.75rem; margin-bottom:1.5rem; }
+.sys-search input, .sys-search select {
+  background:#0d0d0f; border:1px solid #1f1f2e; border-radius:4px; color:#999;
+  font:inherit; font-size:0.7rem; letter-spacing:0.1em; padding:0.5rem 0.75rem;
+}
+.sys-search input { flex:1 1 220px; }
+.sys-results { display:grid; gap:0.5rem; }
+.sys-result { font-size:0.72rem; color:#888; text-decoration:none; border-bottom:1px solid #1a1a2a; padding:0.5rem 0; }
+.sys-result:hover { color:#fff; }
+.sys-virtual { align-content:start; }
+.sys-virtual .sys-card { opacity:1; transform:none; animation:none; height:220px; }
+"""
+
+GRID_SCRIPT = """(function () {
+  var grid = document.querySelector(".sys-grid[data-chunks]");
+  if (!grid || !window.fetch || !window.requestAnimationFrame) return;
+
+  var total = Number(grid.getAttribute("data-total"));
+  var chunkSize = Number(grid.getAttribute("data-chunk-size"));
+  var rowHeight = Number(grid.getAttribute("data-row-height"));
+  var template = grid.getAttribute("data-chunks");
+  var seeded = Array.prototype.slice.call(grid.children);
+  var chunks = {}, pending = {}, frame = 0;
+
+  function load(n) {
+    if (chunks[n] || pending[n]) return;
+    pending[n] = true;
+    var url = new URL(template.replace("{n}", n + 1), document.baseURI);
+    fetch(url).then(function (response) { return response.json(); }).then(function (data) {
+      chunks[n] = data.cards.map(function (card) { card.url = new URL(card.href, url).href; return card; });
+      schedule();
+    }).catch(function () { pending[n] = false; });
+  }
+
+  function node(tag, className, text) {
+    var element = document.createElement(tag);
+    element.className = className;
+    if (text !== undefined) element.textContent = text;
+    return element;
+  }
+
+  function card(data) {
+    var link = node("a", "sys-card"), top = node("div", "sys-card-top"), footer = node("div", "sys-footer");
+    var stars = node("span", "sys-stars");
+    link.href = data.url;
+    link.setAttribute("data-id", data.id);
+    link.setAttribute("style", data.style);
+    top.appendChild(node("p", "sys-name", data.name));
+    top.appendChild(node("span", "sys-status status-" + data.status, data.status));
+    stars.appendChild(node("span", "", "\u2605"));
+    stars.appendChild(document.createTextNode(" " + data.stars));
+    footer.appendChild(stars);
+    footer.appendChild(node("span", "sys-link", "Details \u2192"));
+    link.appendChild(top);
+    link.appendChild(node("div", "sys-domain", data.domain));
+    link.appendChild(node("p", "sys-desc", data.description));
+    link.appendChild(footer);
+    return link;
+  }
+
+  function item(i) {
+    var n = Math.floor(i / chunkSize);
+    if (chunks[n]) return card(chunks[n][i - n * chunkSize]);
+    load(n);
+    return i < seeded.length ? seeded[i] : node("div", "sys-card sys-placeholder");
+  }
+
+  function render() {
+    frame = 0;
+    if (grid.hidden) return;
+
+    var columns = Math.max(1, getComputedStyle(grid).gridTemplateColumns.split(" ").length);
+    var rows = Math.ceil(total / columns);
+    var top = grid.getBoundingClientRect().top;
+    var first = Math.max(0, Math.floor(-top / rowHeight) - 2);
+    var last = Math.min(rows, Math.ceil((window.innerHeight - top) / rowHeight) + 2);
+    var fragment = document.createDocumentFragment();
+
+    for (var i = first * columns; i < Math.min(total, last * columns); i++) fragment.appendChild(item(i));
+
+    grid.style.paddingTop = first * rowHeight + "px";
+    grid.style.height = rows * rowHeight + "px";
+    grid.replaceChildren(fragment);
+  }
+
+  function schedule() {
+    if (!frame) frame = requestAnimationFrame(render);
+  }
+
+  grid.classList.add("sys-virtual");
+  window.addEventListener("scroll", schedule, { passive: true });
+  window.addEventListener("resize", schedule);
+  schedule();
+})();
+"""
+
+SEARCH_SCRIPT = """(function () {
+  var root = document.getElementById("deployed-systems");
+  var source = root && root.getAttribute("data-search-index");
+  if (!source || !window.fetch) return;
+
+  var url = new URL(source, document.baseURI);
+  var form = root.querySelector(".sys-search");
+  var input = form.querySelector("input");
+  var selects = form.querySelectorAll("select[data-facet]");
+  var grid = root.querySelector(".sys-grid");
+  var pager = root.querySelector(".sys-pager");
+  var results = root.querySelector(".sys-results");
+  var index, tokens, size;
+
+  function empty(fill) {
+    var bits = new Uint8Array(Math.ceil(size / 8));
+    if (fill) bits.fill(255);
+    return bits;
+  }
+
+  function decode(value) {
+    var raw = atob(value), bits = empty(false);
+    for (var i = 0; i < raw.length; i++) bits[i] = raw.charCodeAt(i);
+    return bits;
+  }
+
+  function intersect(mask, bits) {
+    for (var i = 0; i < mask.length; i++) mask[i] &= bits[i];
+  }
 
-def load_projects() -> list[dict[str, Any]]:
-    if not PROJECTS_JSON.exists():
-        return []
-    data = json.loads(PROJECTS_JSON.read_text(encoding="utf-8"))
-    if isinstance(data, dict):
-        return data.get("projects", [])
-    if isinstance(data, list):
-        return data
-    return []
+  function prefix(term) {
+    var bits = empty(false);
+    for (var t = 0; t < tokens.length; t++) {
+      if (tokens[t].lastIndexOf(term, 0) !== 0) continue;
+      index.tokens[tokens[t]].forEach(function (n) { bits[n >> 3] |= 1 << (n & 7); });
+    }
+    return bits;
+  }
+
+  function run() {
+    var terms = input.value.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+    var active = terms.length > 0, mask = empty(true);
+
+    terms.forEach(function (term) { intersect(mask, prefix(term)); });
+    selects.forEach(function (select) {
+      if (!select.value) return;
+      active = true;
+      intersect(mask, decode(index.facets[select.getAttribute("data-facet")][select.value]));
+    });
+
+    grid.hidden = active;
+    if (pager) pager.hidden = active;
+    results.hidden = !active;
+    results.textContent = "";
+    if (!active) return;
+
+    for (var n = 0; n < size; n++) {
+      if (!(mask[n >> 3] & (1 << (n & 7)))) continue;
+      var doc = index.docs[n], link = document.createElement("a");
+      link.className = "sys-result";
+      link.href = new URL(doc[1], url).href;
+      link.textContent = [doc[0], doc[2], doc[3], doc[4]].filter(Boolean).join(" · ");
+      results.appendChild(link);
+    }
+  }
+
+  fetch(url).then(function (response) { return response.json(); }).then(function (data) {
+    index = data;
+    size = data.docs.length;
+    tokens = Object.keys(data.tokens);
+    selects.forEach(function (select) {
+      Object.keys(data.facets[select.getAttribute("data-facet")] || {}).forEach(function (value) {
+        select.appendChild(new Option(value, value));
+      });
+      select.addEventListener("change", run);
+    });
+    input.addEventListener("input", run);
+    form.hidden = false;
+  });
+})();
+"""
+
+
+def load_projects(dry_run: bool = False) -> list[dict[str, Any]]:
+    return load_index(write=not dry_run).projects()
 
 
 def load_telemetry() -> dict[str, Any]:
-    if not METRICS_JSON.exists():
-        return {}
-    return json.loads(METRICS_JSON.read_text(encoding="utf-8"))
+    return load_json(METRICS_JSON, {})
 
 
 def deterministic_seed(project: dict[str, Any]) -> int:
@@ -51,144 +368,437 @@ def generate_badge_class(status: str) -> str:
     return f"badge-{status.lower()}"
 
 
-def generate_html(projects: list[dict[str, Any]], telemetry: dict[str, Any]) -> str:
+def esc(value: Any) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def slugify(value: str) -> str:
+    value = value.strip().lower()
+    value = re.sub(r"[^a-z0-9_.-]+", "-", value)
+    value = re.sub(r"-+", "-", value)
+    value = value.strip("-.")
+    return value or "unknown"
+
+
+def assign_unique_slugs(views: list[dict[str, Any]]) -> None:
+    """Make detail slugs unique when ids slugify alike ("Foo Bar", "foo-bar").
+
+    An id that already is its own slug keeps it; the others get a suffix
+    derived from their id, so the result does not depend on input order.
+    """
+    taken: set[str] = set()
+
+    for view in sorted(views, key=lambda view: (view["slug"] != view["id"], view["id"])):
+        base = slug = view["slug"]
+        if slug in taken:
+            slug = f"{base}-{hashlib.sha256(view['id'].encode('utf-8')).hexdigest()[:8]}"
+        counter = 2
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        taken.add(slug)
+        view["slug"] = slug
+
+
+def fingerprint(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def accent(project_id: str) -> tuple[str, str]:
+    if project_id in ACCENTS:
+        return ACCENTS[project_id]
+    digest = hashlib.sha256(project_id.encode("utf-8")).hexdigest()
+    return ACCENT_PALETTE[int(digest[:2], 16) % len(ACCENT_PALETTE)]
+
+
+def project_views(projects: list[dict[str, Any]], telemetry: dict[str, Any]) -> list[dict[str, Any]]:
+    """Everything a page renders for each project; the unit of change detection."""
     # Sort projects alphabetically for deterministic output
-    projects = sorted(projects, key=lambda p: str(p.get("id", "")).lower())
-    
-    telemetry_map = {t["id"]: t for t in telemetry.get("projects", []) if isinstance(t, dict)}
+    projects = sorted((p for p in projects if isinstance(p, dict)), key=lambda p: str(p.get("id", "")).lower())
 
-    cards_html = []
-    for i, project in enumerate(projects):
-        t = telemetry_map.get(project.get("id", ""), {})
-        live_stars = t.get("stars", project.get("stars", 0))
+    telemetry_map = {t["id"]: t for t in telemetry.get("projects", []) if isinstance(t, dict) and "id" in t}
 
-        card = f'''      <a class="sys-card" data-id="{project.get("id", "")}" href="{project.get("repo", "#")}" target="_blank" rel="noopener noreferrer">
-        <div class="sys-card-top">
-          <p class="sys-name">{project.get("name", "Unknown")}</p>
-          <span class="sys-status status-{project.get("status", "DESIGN")}">{project.get("status", "DESIGN")}</span>
-        </div>
-        <div class="sys-domain">{project.get("domain", "Unknown")}</div>
-        <p class="sys-desc">{project.get("description", "")}</p>
-        <div class="sys-footer">
-          <span class="sys-stars"><span>★</span> {live_stars}</span>
-          <span class="sys-link">Repository →</span>
-        </div>
-      </a>'''
-        cards_html.append(card)
+    views: list[dict[str, Any]] = []
+    for project in projects:
+        project_id = str(project.get("id", ""))
+        t = telemetry_map.get(project_id, {})
+        color, glow = accent(project_id)
+
+        views.append(
+            {
+                "id": project_id,
+                "slug": slugify(project_id or str(project.get("name", ""))),
+                "name": project.get("name", "Unknown"),
+                "status": project.get("status", "DESIGN"),
+                "domain": project.get("domain", "Unknown"),
+                "description": project.get("description", ""),
+                "stars": t.get("stars", project.get("stars", 0)),
+                "language": t.get("language") or project.get("language") or "Unknown",
+                "repo": project.get("repo", "#"),
+                "accent": color,
+                "glow": glow,
+            }
+        )
+
+    assign_unique_slugs(views)
+    return views
+
+
+def hashed_asset(stem: str, suffix: str, source: str) -> tuple[Path, str]:
+    """(content-hashed path, minified content); the hash covers the bytes that are served."""
+    content = minify_text(suffix, source)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return SITE_ASSETS / f"{stem}.{digest}{suffix}", content
+
+
+def site_assets(grid: str = "paged") -> dict[str, tuple[Path, str]]:
+    """Logical name -> (content-hashed path, content) for every asset the grid mode loads."""
+    assets = {
+        "search.js": hashed_asset("search", ".js", SEARCH_SCRIPT),
+        "surface.css": hashed_asset("surface", ".css", STYLESHEET),
+    }
+    if grid == "virtual":
+        assets["grid.js"] = hashed_asset("grid", ".js", GRID_SCRIPT)
+    return assets
+
+
+def tokenize(*values: Any) -> set[str]:
+    tokens: set[str] = set()
+    for value in values:
+        for token in re.split(r"[^a-z0-9]+", str(value or "").lower()):
+            if token:
+                tokens.add(token)
+    return tokens
+
+
+def bitset(docs: list[int], size: int) -> str:
+    data = bytearray((size + 7) // 8)
+    for doc in docs:
+        data[doc >> 3] |= 1 << (doc & 7)
+    return base64.b64encode(bytes(data)).decode("ascii")
+
+
+def build_search_index(views: list[dict[str, Any]]) -> dict[str, Any]:
+    """Inverted token index plus facet bitsets over views, in listing order."""
+    docs: list[list[Any]] = []
+    postings: dict[str, list[int]] = {}
+    facets: dict[str, dict[str, list[int]]] = {facet: {} for facet in SEARCH_FACETS}
+
+    for number, view in enumerate(views):
+        docs.append(
+            [
+                view["name"],
+                href(detail_path(view), SEARCH_JSON),
+                view["status"],
+                view["domain"],
+                view["language"],
+            ]
+        )
+
+        for token in tokenize(view["id"], view["name"], view["domain"], view["description"], view["status"], view["language"]):
+            postings.setdefault(token, []).append(number)
 
-    cards_joined = "\n".join(cards_html)
+        for facet in SEARCH_FACETS:
+            facets[facet].setdefault(str(view[facet]), []).append(number)
+
+    size = len(views)
+
+    return {
+        "version": 1,
+        "docs": docs,
+        "tokens": postings,
+        "facets": {
+            facet: {value: bitset(members, size) for value, members in values.items()}
+            for facet, values in facets.items()
+        },
+    }
+
+
+def write_search_index(index: dict[str, Any], dry_run: bool = False) -> None:
+    """One compact canonical line; untouched when the bytes are unchanged."""
+    writer = StagedWriter(SEARCH_JSON, dry_run=dry_run)
+    writer.write(encode_jsonl_line(index))
+    writer.commit(skip_unchanged=True)
+
+
+def listing_path(page: int) -> Path:
+    return OUTPUT_HTML if page == 1 else SITE_DIR / "page" / f"{page}.html"
+
+
+def chunk_path(chunk: int) -> Path:
+    return SITE_CHUNKS / CHUNK_TEMPLATE.format(n=chunk)
+
+
+def detail_path(view: dict[str, Any]) -> Path:
+    return SITE_DIR / "projects" / f"{view['slug']}.html"
+
+
+def href(target: Path, page: Path) -> str:
+    return Path(os.path.relpath(target, page.parent)).as_posix()
+
+
+def card_style(view: dict[str, Any]) -> str:
+    return "--accent:{}; --card-glow: radial-gradient(ellipse at top left, {} 0%, transparent 70%);".format(
+        view["accent"], view["glow"]
+    )
+
+
+def page_shell(title: str, assets: dict[str, Path], page: Path, body: str, scripts: tuple[str, ...] = ()) -> str:
+    script_html = "".join(f'\n  <script src="{href(assets[name], page)}" defer></script>' for name in scripts)
 
     return f'''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>◆ Deployed Systems | Lysergic Infrastructure</title>
-  <style>
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{
-      background: #0a0a0f;
-      font-family: 'JetBrains Mono', monospace;
-      color: #999;
-      min-height: 100vh;
-      padding: 3rem 1rem;
-    }}
-    #deployed-systems {{
-      max-width: 900px;
-      margin: 0 auto;
-    }}
-    .sys-header {{
-      text-align: center;
-      margin-bottom: 2.5rem;
-    }}
-    .sys-header h2 {{
-      letter-spacing: 0.35em;
-      color: #fff;
-      font-size: 1.1rem;
-      font-weight: normal;
-    }}
-    .sys-header p {{
-      color: #666;
-      font-size: 0.75rem;
-      letter-spacing: 0.2em;
-      margin-top: 0.5rem;
-    }}
-    .sys-grid {{
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
-      gap: 1.25rem;
-    }}
-    .sys-card {{
-      position: relative;
-      background: #0d0d0f;
-      border: 1px solid #1f1f2e;
-      border-radius: 6px;
-      padding: 1.5rem;
-      overflow: hidden;
-      opacity: 0;
-      transform: translateY(24px);
-      animation: cardEntrance 0.6s ease forwards;
-      transition: border-color 0.3s ease, box-shadow 0.3s ease, transform 0.3s ease;
-      text-decoration: none;
-      display: block;
-      color: inherit;
-    }}
-    .sys-card:nth-child(1) {{ animation-delay: 0.05s; }}
-    .sys-card:nth-child(2) {{ animation-delay: 0.15s; }}
-    .sys-card:nth-child(3) {{ animation-delay: 0.25s; }}
-    @keyframes cardEntrance {{ to {{ opacity:1; transform:translateY(0); }} }}
-    .sys-card::before {{
-      content:''; position:absolute; inset:0;
-      background: var(--card-glow); opacity:0;
-      transition: opacity 0.4s ease; pointer-events:none; border-radius:6px;
-    }}
-    .sys-card:hover::before {{ opacity:1; }}
-    .sys-card:hover {{
-      transform: translateY(-3px);
-      border-color: var(--accent);
-      box-shadow: 0 0 20px -6px var(--accent);
-    }}
-    .sys-card[data-id="popdeuxrem"]     {{ --accent:#b44fff; --card-glow: radial-gradient(ellipse at top left, rgba(180,79,255,0.08) 0%, transparent 70%); }}
-    .sys-card[data-id="shadow-scripts"] {{ --accent:#00ffe0; --card-glow: radial-gradient(ellipse at top left, rgba(0,255,224,0.07) 0%, transparent 70%); }}
-    .sys-card[data-id="lysergic-systems"]{{ --accent:#ff3cac; --card-glow: radial-gradient(ellipse at top left, rgba(255,60,172,0.08) 0%, transparent 70%); }}
-    .sys-card-top {{ display:flex; align-items:center; justify-content:space-between; margin-bottom:0.75rem; }}
-    .sys-name {{ font-size:0.9rem; font-weight:700; color:var(--accent); letter-spacing:0.05em; margin:0; }}
-    .sys-status {{ font-size:0.6rem; font-weight:700; letter-spacing:0.15em; padding:2px 8px; border-radius:3px; text-transform:uppercase; }}
-    .status-SHIP  {{ background:rgba(0,255,100,0.12); color:#00ff64; border:1px solid #00ff6440; }}
-    .status-BUILD {{ background:rgba(255,160,0,0.12);  color:#ffa000; border:1px solid #ffa00040; }}
-    .sys-domain {{ font-size:0.65rem; color:#444; letter-spacing:0.15em; text-transform:uppercase; margin-bottom:0.75rem; }}
-    .sys-desc   {{ font-size:0.72rem; color:#888; line-height:1.65; margin:0 0 1.1rem; }}
-    .sys-footer {{ display:flex; align-items:center; justify-content:space-between; border-top:1px solid #1a1a2a; padding-top:0.75rem; }}
-    .sys-stars  {{ font-size:0.65rem; color:#555; letter-spacing:0.1em; }}
-    .sys-stars span {{ color:#ffd700; margin-right:4px; }}
-    .sys-link   {{ font-size:0.65rem; color:var(--accent); letter-spacing:0.1em; text-decoration:none; opacity:0.7; transition:opacity 0.2s; }}
-    .sys-link:hover {{ opacity:1; }}
-  </style>
+  <title>{esc(title)}</title>
+  <link rel="stylesheet" href="{href(assets["surface.css"], page)}">{script_html}
 </head>
 <body>
-  <!-- DEPLOYED SYSTEMS -->
-  <section id="deployed-systems">
+{body}
+</body>
+</html>
+'''
+
+
+def search_form_html() -> str:
+    selects = "".join(
+        f'\n      <select data-facet="{facet}" aria-label="Filter by {facet}"><option value="">all {facet}</option></select>'
+        for facet in SEARCH_FACETS
+    )
+    return f'''    <form class="sys-search" role="search" hidden onsubmit="return false">
+      <input type="search" placeholder="search systems" aria-label="Search systems">{selects}
+    </form>
+    <div class="sys-results" hidden></div>'''
+
+
+def card_html(view: dict[str, Any], page: Path) -> str:
+    return f'''      <a class="sys-card" data-id="{esc(view["id"])}" style="{card_style(view)}" href="{href(detail_path(view), page)}">
+        <div class="sys-card-top">
+          <p class="sys-name">{esc(view["name"])}</p>
+          <span class="sys-status status-{esc(view["status"])}">{esc(view["status"])}</span>
+        </div>
+        <div class="sys-domain">{esc(view["domain"])}</div>
+        <p class="sys-desc">{esc(view["description"])}</p>
+        <div class="sys-footer">
+          <span class="sys-stars"><span>★</span> {esc(view["stars"])}</span>
+          <span class="sys-link">Details →</span>
+        </div>
+      </a>'''
+
+
+def listing_body(path: Path, grid_html: str, pager_html: str = "") -> str:
+    return f'''  <!-- DEPLOYED SYSTEMS -->
+  <section id="deployed-systems" data-search-index="{href(SEARCH_JSON, path)}">
     <div class="sys-header">
       <h2>◆ Deployed Systems</h2>
       <p>Operational repositories and active build pipelines</p>
     </div>
-    <div class="sys-grid">
+{search_form_html()}
+{grid_html}{pager_html}
+  </section>'''
+
+
+def generate_listing_html(views: list[dict[str, Any]], page: int, pages: int, assets: dict[str, Path]) -> str:
+    path = listing_path(page)
+    cards_joined = "\n".join(card_html(view, path) for view in views)
+
+    pager = []
+    if page > 1:
+        pager.append(f'<a href="{href(listing_path(page - 1), path)}">← Prev</a>')
+    if pages > 1:
+        pager.append(f"<span>{page} / {pages}</span>")
+    if page < pages:
+        pager.append(f'<a href="{href(listing_path(page + 1), path)}">Next →</a>')
+
+    pager_html = f'\n    <nav class="sys-pager">{" ".join(pager)}</nav>' if pager else ""
+    grid_html = f'''    <div class="sys-grid">
+{cards_joined}
+    </div>'''
+
+    body = listing_body(path, grid_html, pager_html)
+    return page_shell("◆ Deployed Systems | Lysergic Infrastructure", assets, path, body, scripts=("search.js",))
+
+
+def generate_virtual_listing_html(views: list[dict[str, Any]], total: int, assets: dict[str, Path]) -> str:
+    """First screenful of cards; grid.js virtualizes the rest from chunk files."""
+    path = OUTPUT_HTML
+    cards_joined = "\n".join(card_html(view, path) for view in views)
+    chunks = href(SITE_CHUNKS, path) + "/" + CHUNK_TEMPLATE
+
+    grid_html = f'''    <div class="sys-grid" data-chunks="{esc(chunks)}" data-chunk-size="{CHUNK_SIZE}" data-total="{total}" data-row-height="{ROW_HEIGHT}">
 {cards_joined}
+    </div>'''
+
+    body = listing_body(path, grid_html)
+    return page_shell("◆ Deployed Systems | Lysergic Infrastructure", assets, path, body, scripts=("search.js", "grid.js"))
+
+
+def chunk_card(view: dict[str, Any], chunk: Path) -> dict[str, Any]:
+    return {
+        "id": view["id"],
+        "name": view["name"],
+        "status": view["status"],
+        "domain": view["domain"],
+        "description": view["description"],
+        "stars": view["stars"],
+        "href": href(detail_path(view), chunk),
+        "style": card_style(view),
+    }
+
+
+def generate_chunk_json(views: list[dict[str, Any]], chunk: int) -> str:
+    path = chunk_path(chunk)
+    return encode_jsonl_line({"chunk": chunk, "cards": [chunk_card(view, path) for view in views]}).decode("utf-8")
+
+
+def generate_detail_html(view: dict[str, Any], listing_page: int, assets: dict[str, Path]) -> str:
+    path = detail_path(view)
+
+    body = f'''  <section id="deployed-systems">
+    <div class="sys-header">
+      <h2>◆ {esc(view["name"])}</h2>
+      <p>{esc(view["domain"])}</p>
     </div>
-  </section>
-</body>
-</html>
-'''
+    <div class="sys-card sys-detail" data-id="{esc(view["id"])}" style="{card_style(view)}">
+      <div class="sys-card-top">
+        <p class="sys-name">{esc(view["name"])}</p>
+        <span class="sys-status status-{esc(view["status"])}">{esc(view["status"])}</span>
+      </div>
+      <p class="sys-desc">{esc(view["description"])}</p>
+      <div class="sys-footer">
+        <span class="sys-stars"><span>★</span> {esc(view["stars"])}</span>
+        <a class="sys-link" href="{esc(view["repo"])}" target="_blank" rel="noopener noreferrer">Repository →</a>
+      </div>
+    </div>
+    <nav class="sys-pager"><a href="{href(listing_path(listing_page), path)}">← Deployed Systems</a></nav>
+  </section>'''
+
+    return page_shell(f"◆ {view['name']} | Lysergic Infrastructure", assets, path, body)
+
+
+def plan_pages(views: list[dict[str, Any]], assets: dict[str, Path], grid: str = "paged") -> list[tuple[Path, str, list[str], Any]]:
+    """(path, kind, project ids, fingerprint inputs) for every page; nothing is rendered yet."""
+    page_size = PAGE_SIZE if grid == "paged" else max(1, len(views))
+    pages = max(1, -(-len(views) // page_size))
+    plan: list[tuple[Path, str, list[str], Any]] = []
+    asset_names = {name: path.name for name, path in assets.items()}
+
+    if grid == "virtual":
+        first = views[:FIRST_SCREEN]
+        inputs = {"assets": asset_names, "projects": first, "total": len(views)}
+        plan.append((OUTPUT_HTML, "virtual", [view["id"] for view in first], inputs))
+
+        for chunk in range(1, -(-len(views) // CHUNK_SIZE) + 1):
+            members = views[(chunk - 1) * CHUNK_SIZE : chunk * CHUNK_SIZE]
+            inputs = {"chunk": chunk, "projects": members}
+            plan.append((chunk_path(chunk), "chunk", [view["id"] for view in members], inputs))
+    else:
+        for page in range(1, pages + 1):
+            chunk = views[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+            inputs = {"assets": asset_names, "page": page, "pages": pages, "projects": chunk}
+            plan.append((listing_path(page), "listing", [view["id"] for view in chunk], inputs))
+
+    for offset, view in enumerate(views):
+        listing_page = offset // page_size + 1
+        inputs = {"assets": asset_names, "listing_page": listing_page, "project": view}
+        plan.append((detail_path(view), "detail", [view["id"]], inputs))
+
+    return plan
+
+
+def render_page(kind: str, inputs: dict[str, Any], assets: dict[str, Path]) -> str:
+    if kind == "listing":
+        return generate_listing_html(inputs["projects"], inputs["page"], inputs["pages"], assets)
+    if kind == "virtual":
+        return generate_virtual_listing_html(inputs["projects"], inputs["total"], assets)
+    if kind == "chunk":
+        return generate_chunk_json(inputs["projects"], inputs["chunk"])
+    return generate_detail_html(inputs["project"], inputs["listing_page"], assets)
+
+
+def write_text(path: Path, content: str, dry_run: bool = False) -> None:
+    if dry_run:
+        print(f"DRY-RUN: would write {path.relative_to(ROOT)}")
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    print(f"WROTE: {path.relative_to(ROOT)}")
+
+
+def load_site_manifest() -> dict[str, Any]:
+    manifest = load_json(SITE_MANIFEST, {}, strict=False)
+    return manifest if isinstance(manifest, dict) else {}
 
 
 def main() -> int:
-    projects = load_projects()
-    telemetry = load_telemetry()
-    html = generate_html(projects, telemetry)
-    OUTPUT_HTML.write_text(html, encoding="utf-8")
-    print(f"WROTE: {OUTPUT_HTML.relative_to(ROOT)}")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="print planned writes without mutating files")
+    parser.add_argument("--force", action="store_true", help="rewrite every page regardless of fingerprints")
+    parser.add_argument(
+        "--grid",
+        choices=GRID_MODES,
+        default="paged",
+        help="paged listing pages, or a first-screen index.html with lazy-loaded chunks and a virtualized grid",
+    )
+    args = parser.parse_args()
+
+    views = project_views(load_projects(dry_run=args.dry_run), load_telemetry())
+    shared = site_assets(args.grid)
+    assets = {name: path for name, (path, _) in shared.items()}
+
+    previous = load_site_manifest()
+    previous_pages = previous.get("pages") if isinstance(previous.get("pages"), dict) else {}
+    previous_assets = previous.get("assets") if isinstance(previous.get("assets"), dict) else {}
+
+    for path, content in shared.values():
+        if args.force or not path.exists():
+            write_text(path, content, dry_run=args.dry_run)
+
+    pages: dict[str, Any] = {}
+    written = 0
+
+    for path, kind, ids, inputs in plan_pages(views, assets, grid=args.grid):
+        rel = str(path.relative_to(ROOT))
+        digest = fingerprint({"template_version": TEMPLATE_VERSION, "inputs": inputs})
+        pages[rel] = {"hash": digest, "kind": kind, "projects": ids}
+
+        cached = previous_pages.get(rel)
+        if not args.force and isinstance(cached, dict) and cached.get("hash") == digest and path.exists():
+            continue
+
+        write_text(path, render_page(kind, inputs, assets), dry_run=args.dry_run)
+        written += 1
+
+    for rel in sorted(set(previous_pages) - set(pages)):
+        path = ROOT / rel
+        if path != OUTPUT_HTML and SITE_DIR in path.parents:
+            remove_file(path, dry_run=args.dry_run)
+
+    write_search_index(build_search_index(views), dry_run=args.dry_run)
+
+    current_assets = {name: str(path.relative_to(ROOT)) for name, path in assets.items()}
+    for rel in sorted(str(value) for value in previous_assets.values()):
+        path = ROOT / rel
+        if rel not in current_assets.values() and path.parent == SITE_ASSETS:
+            remove_file(path, dry_run=args.dry_run)
+
+    manifest = {
+        "source": "scripts/generate_pages_surface.py",
+        "template_version": TEMPLATE_VERSION,
+        "grid": args.grid,
+        "page_size": PAGE_SIZE if args.grid == "paged" else CHUNK_SIZE,
+        "count": len(views),
+        "assets": current_assets,
+        "pages": pages,
+        "search": str(SEARCH_JSON.relative_to(ROOT)),
+    }
+    write_json(SITE_MANIFEST, manifest, dry_run=args.dry_run, skip_unchanged=True)
+
+    print(f"SUMMARY: pages={len(pages)} rewritten={written} unchanged={len(pages) - written} projects={len(views)}")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
@@ -3,12 +3,16 @@
 Deterministic project card generator.
 
 Reads:
-  - metrics/metrics.json
+  - metrics/metrics.jsonl, else metrics/metrics.json
   - metrics/aggregate.json
 
 Writes:
   - assets/projects/<safe-repo-name>.svg
   - assets/projects/index.json
+  - assets/projects/index.jsonl (--format jsonl|both)
+  - assets/projects/index/head.json (top cards, totals, pages digest)
+  - assets/projects/index/page-NNNN.json (INDEX_PAGE_SIZE cards per page)
+  - assets/projects/atlas.svg (--atlas, or SURFACE_CARD_ATLAS=1)
 
 Rules:
   - no network calls
@@ -16,6 +20,13 @@ Rules:
   - deterministic filenames
   - SVG-only generated artifacts
   - no secrets
+  - cards are cached by trace hash + CARD_TEMPLATE_VERSION; unchanged cards are not rewritten
+  - streaming: records, cards, atlas and index are processed one at a time
+  - stale cards are found by diffing against the previous index, not by globbing
+  - index entries record "exists" so readers never stat card files
+  - build runs (make cards/build, quantum_build.sh, webhook_receiver.py) use
+    BUILD_LIMIT and take profile and atlas from the environment, so a partial
+    rebuild never drops the atlas a full build keeps
 """
 
 from __future__ import annotations
@@ -24,25 +35,61 @@ import argparse
 import hashlib
 import html
 import json
+import os
 import re
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from pipeline_trace import span
+from repo_aggregate import TopK, top_repos
+from render_profile import DEFAULT_PROFILE, add_profile_argument, default_profile, filter_defs, glow_circle
+from repo_record import RepoRecord
+from surface_io import (
+    OUTPUT_FORMATS,
+    JsonListWriter,
+    JsonlWriter,
+    StagedWriter,
+    encode_jsonl_line,
+    iter_document_records,
+    iter_records,
+    jsonl_path,
+    load_json,
+    remove_file,
+    write_json,
+)
 
 ROOT = Path(__file__).resolve().parent.parent
 METRICS_JSON = ROOT / "metrics" / "metrics.json"
 AGGREGATE_JSON = ROOT / "metrics" / "aggregate.json"
 PROJECTS_DIR = ROOT / "assets" / "projects"
 INDEX_JSON = PROJECTS_DIR / "index.json"
+INDEX_JSONL = jsonl_path(INDEX_JSON)
+ATLAS_SVG = PROJECTS_DIR / "atlas.svg"
+INDEX_DIR = PROJECTS_DIR / "index"
+INDEX_HEAD = INDEX_DIR / "head.json"
+INDEX_PAGE_TEMPLATE = "page-{page:04d}.json"
+INDEX_PAGE_SIZE = 100
+INDEX_HEAD_LIMIT = 12
 
+# Bump whenever svg_card() markup changes so every cached card is re-rendered.
+CARD_TEMPLATE_VERSION = "1"
 
-def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
-        return default
+# --limit of every build run (Makefile cards/build, quantum_build.sh).
+BUILD_LIMIT = 8
+ATLAS_ENV = "SURFACE_CARD_ATLAS"
 
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise SystemExit(f"Invalid JSON: {path.relative_to(ROOT)}: {exc}") from exc
+
+def default_atlas() -> bool:
+    return os.environ.get(ATLAS_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def build_arguments() -> list[str]:
+    """Arguments a build run passes, with profile and atlas resolved from the environment."""
+    arguments = ["--limit", str(BUILD_LIMIT), "--profile", default_profile()]
+    if default_atlas():
+        arguments.append("--atlas")
+    return arguments
 
 
 def write_text(path: Path, content: str, dry_run: bool = False) -> None:
@@ -55,22 +102,10 @@ def write_text(path: Path, content: str, dry_run: bool = False) -> None:
     print(f"WROTE: {path.relative_to(ROOT)}")
 
 
-def write_json(path: Path, payload: Any, dry_run: bool = False) -> None:
-    encoded = json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
-    write_text(path, encoded, dry_run=dry_run)
-
-
 def esc(value: Any) -> str:
     return html.escape(str(value), quote=True)
 
 
-def safe_int(value: Any) -> int:
-    try:
-        return int(value)
-    except Exception:
-        return 0
-
-
 def slugify(value: str) -> str:
     value = value.strip().lower()
     value = value.replace("/", "__")
@@ -87,58 +122,47 @@ def truncate(value: Any, length: int) -> str:
     return text[: max(0, length - 1)].rstrip() + "…"
 
 
-def normalize_repositories() -> list[dict[str, Any]]:
-    metrics = load_json(METRICS_JSON, {})
-    aggregate = load_json(AGGREGATE_JSON, {})
+def iter_repository_items() -> Iterator[Any]:
+    found = False
 
-    candidates: list[Any] = []
+    for item in iter_records(METRICS_JSON, ("repositories", "repos")):
+        found = True
+        yield item
 
-    if isinstance(metrics, dict):
-        raw = metrics.get("repositories") or metrics.get("repos") or []
-        if isinstance(raw, list):
-            candidates.extend(raw)
+    if not found:
+        yield from iter_document_records(AGGREGATE_JSON, ("top_repos",))
 
-    if not candidates and isinstance(aggregate, dict):
-        raw = aggregate.get("top_repos") or []
-        if isinstance(raw, list):
-            candidates.extend(raw)
 
-    repos: list[dict[str, Any]] = []
+def normalize_repositories() -> Iterator[RepoRecord]:
+    """Stream normalized records; the collector writes them unique and sorted by key."""
+    previous_key = None
 
-    for item in candidates:
+    for item in iter_repository_items():
         if not isinstance(item, dict):
             continue
 
-        full_name = str(
-            item.get("full_name")
-            or item.get("repo")
-            or item.get("slug")
-            or item.get("name")
-            or "unknown"
-        )
-
-        name = str(item.get("name") or full_name.split("/")[-1] or "unknown")
+        repo = RepoRecord.from_json(item)
+        if repo is None or repo.key == previous_key:
+            continue
 
-        repos.append(
-            {
-                "full_name": full_name,
-                "name": name,
-                "html_url": item.get("html_url") or f"https://github.com/{full_name}",
-                "description": item.get("description") or "Deterministic system artifact.",
-                "language": item.get("language") or "Unknown",
-                "stars": safe_int(item.get("stars") or item.get("stargazers_count")),
-                "forks": safe_int(item.get("forks") or item.get("forks_count")),
-                "open_issues": safe_int(item.get("open_issues") or item.get("open_issues_count")),
-                "status": item.get("status") or "tracked",
-                "updated_at": item.get("updated_at") or item.get("pushed_at") or None,
-            }
-        )
+        previous_key = repo.key
+        yield repo
 
-    deduped: dict[str, dict[str, Any]] = {}
-    for repo in repos:
-        deduped[str(repo["full_name"]).lower()] = repo
 
-    return [deduped[key] for key in sorted(deduped.keys())]
+def card_fields(repo: RepoRecord) -> dict[str, Any]:
+    """Display values for one card, with card-level defaults applied."""
+    return {
+        "full_name": repo.full_name,
+        "name": repo.name,
+        "html_url": repo.html_url,
+        "description": repo.description or "Deterministic system artifact.",
+        "language": repo.language or "Unknown",
+        "stars": repo.stars,
+        "forks": repo.forks,
+        "open_issues": repo.open_issues,
+        "status": repo.status or "tracked",
+        "updated_at": repo.updated_at or repo.pushed_at or None,
+    }
 
 
 def status_color(status: str) -> str:
@@ -169,41 +193,61 @@ def language_color(language: str) -> str:
     return palette[int(digest[:2], 16) % len(palette)]
 
 
-def svg_card(repo: dict[str, Any]) -> str:
-    full_name = str(repo["full_name"])
-    name = str(repo["name"])
-    description = truncate(repo.get("description"), 88)
-    language = str(repo.get("language") or "Unknown")
-    status = str(repo.get("status") or "tracked")
-    stars = safe_int(repo.get("stars"))
-    forks = safe_int(repo.get("forks"))
-    issues = safe_int(repo.get("open_issues"))
-    updated = str(repo.get("updated_at") or "unknown")
+def card_trace(repo: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(repo, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
 
-    trace = hashlib.sha256(json.dumps(repo, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:12]
-    lang_color = language_color(language)
-    state_color = status_color(status)
 
-    return f'''<svg width="760" height="240" viewBox="0 0 760 240" xmlns="http://www.w3.org/2000/svg" role="img" aria-label="{esc(full_name)} project card">
-  <defs>
-    <linearGradient id="border" x1="0" x2="1" y1="0" y2="1">
-      <stop offset="0%" stop-color="#00f3ff"/>
-      <stop offset="48%" stop-color="#bc8cff"/>
-      <stop offset="100%" stop-color="#00ff9d"/>
-    </linearGradient>
-    <filter id="softGlow">
+def card_hash(trace: str, profile: str = DEFAULT_PROFILE) -> str:
+    """Cache key for one rendered card: content trace plus template version (and non-default profile)."""
+    version = CARD_TEMPLATE_VERSION if profile == DEFAULT_PROFILE else f"{CARD_TEMPLATE_VERSION}-{profile}"
+    return hashlib.sha256(f"{version}:{trace}".encode("utf-8")).hexdigest()
+
+
+CARD_WIDTH = 760
+CARD_HEIGHT = 240
+
+CARD_GLOW_FILTER = """    <filter id="softGlow">
       <feGaussianBlur stdDeviation="3" result="blur"/>
       <feMerge>
         <feMergeNode in="blur"/>
         <feMergeNode in="SourceGraphic"/>
       </feMerge>
     </filter>
-  </defs>
+"""
+
+
+def card_defs(profile: str = DEFAULT_PROFILE) -> str:
+    return f"""  <defs>
+    <linearGradient id="border" x1="0" x2="1" y1="0" y2="1">
+      <stop offset="0%" stop-color="#00f3ff"/>
+      <stop offset="48%" stop-color="#bc8cff"/>
+      <stop offset="100%" stop-color="#00ff9d"/>
+    </linearGradient>
+{filter_defs(profile, CARD_GLOW_FILTER)}  </defs>
+"""
+
+
+def card_body(record: RepoRecord, trace: str | None = None, profile: str = DEFAULT_PROFILE) -> str:
+    """Card markup without the root element or defs; shared by single cards and the atlas."""
+    repo = card_fields(record)
+    full_name = repo["full_name"]
+    name = repo["name"]
+    description = truncate(repo["description"], 88)
+    language = repo["language"]
+    status = repo["status"]
+    stars = repo["stars"]
+    forks = repo["forks"]
+    issues = repo["open_issues"]
+    updated = str(repo["updated_at"] or "unknown")
+
+    trace = (trace or card_trace(repo))[:12]
+    lang_color = language_color(language)
+    state_color = status_color(status)
 
-  <rect width="760" height="240" rx="18" fill="#0d1117"/>
+    return f'''  <rect width="760" height="240" rx="18" fill="#0d1117"/>
   <rect x="1" y="1" width="758" height="238" rx="18" fill="none" stroke="url(#border)" stroke-width="1.5" opacity="0.8"/>
 
-  <circle cx="42" cy="42" r="8" fill="{state_color}" filter="url(#softGlow)"/>
+  {glow_circle(profile, 42, 42, 8, state_color, "softGlow")}
   <text x="62" y="47" fill="#8b949e" font-family="monospace" font-size="13">PROJECT SIGNAL</text>
 
   <text x="42" y="88" fill="#c9d1d9" font-family="monospace" font-size="24" font-weight="700">{esc(name[:34])}</text>
@@ -225,82 +269,345 @@ def svg_card(repo: dict[str, Any]) -> str:
   <text x="456" y="195" fill="#00ff9d" font-family="monospace" font-size="12">{issues}</text>
 
   <text x="42" y="222" fill="#484f58" font-family="monospace" font-size="10">trace:{trace} · status:{esc(status)} · updated:{esc(updated[:20])}</text>
-</svg>
 '''
 
 
-def build_index(repos: list[dict[str, Any]]) -> dict[str, Any]:
-    items = []
+def svg_card(record: RepoRecord, trace: str | None = None, profile: str = DEFAULT_PROFILE) -> str:
+    with span("svg_card", cat="render", repo=record.full_name) as attrs:
+        svg = (
+            f'<svg width="{CARD_WIDTH}" height="{CARD_HEIGHT}" viewBox="0 0 {CARD_WIDTH} {CARD_HEIGHT}" '
+            f'xmlns="http://www.w3.org/2000/svg" role="img" aria-label="{esc(record.full_name)} project card">\n'
+            f"{card_defs(profile)}\n"
+            f"{card_body(record, trace, profile)}"
+            "</svg>\n"
+        )
+        attrs["bytes"] = len(svg)
+        return svg
 
-    for repo in repos:
-        full_name = str(repo["full_name"])
-        slug = slugify(full_name)
-        filename = f"{slug}.svg"
 
-        items.append(
-            {
-                "full_name": full_name,
-                "name": repo["name"],
-                "path": f"assets/projects/{filename}",
-                "html_url": repo.get("html_url"),
-                "status": repo.get("status"),
-                "language": repo.get("language"),
-                "stars": safe_int(repo.get("stars")),
-                "forks": safe_int(repo.get("forks")),
-                "open_issues": safe_int(repo.get("open_issues")),
-            }
+def atlas_fragment(repo: RepoRecord) -> str:
+    return f"card-{slugify(repo.full_name)}"
+
+
+def atlas_coordinates(repo: RepoRecord, offset: int) -> dict[str, Any]:
+    return {
+        "path": str(ATLAS_SVG.relative_to(ROOT)),
+        "fragment": atlas_fragment(repo),
+        "x": 0,
+        "y": offset * CARD_HEIGHT,
+        "width": CARD_WIDTH,
+        "height": CARD_HEIGHT,
+    }
+
+
+class AtlasWriter:
+    """Stream card bodies into atlas.svg; each card is addressable as atlas.svg#card-<slug>.
+
+    Bodies are spooled to a temporary file because the root element needs the
+    final height, so memory stays flat regardless of the card count.
+    """
+
+    def __init__(self, dry_run: bool = False, profile: str = DEFAULT_PROFILE) -> None:
+        self.dry_run = dry_run
+        self.profile = profile
+        self.count = 0
+        self._digest = hashlib.sha256()
+        self._body = None if dry_run else tempfile.TemporaryFile()
+
+    def add(self, repo: RepoRecord, trace: str, digest: str) -> dict[str, Any]:
+        coords = atlas_coordinates(repo, self.count)
+        y = coords["y"]
+
+        self._digest.update((("\n" if self.count else "") + digest).encode("utf-8"))
+        self.count += 1
+
+        if self._body is not None:
+            chunk = (
+                f'\n  <view id="{esc(coords["fragment"])}" viewBox="0 {y} {CARD_WIDTH} {CARD_HEIGHT}"/>\n'
+                f'  <g aria-label="{esc(repo.full_name)} project card" transform="translate(0 {y})">\n'
+                f"{card_body(repo, trace, self.profile)}"
+                "  </g>\n"
+            )
+            self._body.write(chunk.encode("utf-8"))
+
+        return coords
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+    def close(self, cached_hash: str | None) -> dict[str, Any]:
+        digest = self.hexdigest()
+        summary = {"path": str(ATLAS_SVG.relative_to(ROOT)), "hash": digest, "count": self.count}
+
+        if cached_hash == digest and ATLAS_SVG.exists():
+            if self._body is not None:
+                self._body.close()
+            summary["exists"] = True
+            return summary
+
+        height = CARD_HEIGHT * max(1, self.count)
+        writer = StagedWriter(ATLAS_SVG, dry_run=self.dry_run)
+        writer.write(
+            (
+                f'<svg width="{CARD_WIDTH}" height="{height}" viewBox="0 0 {CARD_WIDTH} {height}" '
+                'xmlns="http://www.w3.org/2000/svg" role="img" aria-label="project card atlas">\n'
+                f"{card_defs(self.profile)}"
+            ).encode("utf-8")
         )
 
+        if self._body is not None:
+            self._body.seek(0)
+            while True:
+                chunk = self._body.read(1 << 16)
+                if not chunk:
+                    break
+                writer.write(chunk)
+            self._body.close()
+
+        writer.write(b"</svg>\n")
+        writer.commit()
+        summary["exists"] = not self.dry_run or ATLAS_SVG.exists()
+        return summary
+
+
+def card_entry(repo: RepoRecord, digest: str) -> dict[str, Any]:
     return {
-        "source": "scripts/generate_project_cards.py",
-        "count": len(items),
-        "cards": items,
+        "full_name": repo.full_name,
+        "name": repo.name,
+        "path": f"assets/projects/{slugify(repo.full_name)}.svg",
+        "hash": digest,
+        "html_url": repo.html_url,
+        "status": repo.status or "tracked",
+        "language": repo.language or "Unknown",
+        "stars": repo.stars,
+        "forks": repo.forks,
+        "open_issues": repo.open_issues,
     }
 
 
-def remove_stale_cards(valid_filenames: set[str], dry_run: bool = False) -> None:
+def load_card_cache() -> dict[str, str | None]:
+    """Map every card path of the previous index (atlas included) -> its hash.
+
+    Entries without a hash (indexes written before the card cache) are kept
+    with None: they still count for stale-card removal but never as a cache hit.
+    """
+    cache: dict[str, str | None] = {}
+
+    for item in iter_records(INDEX_JSON, ("cards",)):
+        if isinstance(item, dict) and item.get("path"):
+            cache[str(item["path"])] = str(item["hash"]) if item.get("hash") else None
+
+    header = load_json(INDEX_JSON, {})
+    sprite = header.get("sprite") if isinstance(header, dict) else None
+    if isinstance(sprite, dict) and sprite.get("path"):
+        cache[str(sprite["path"])] = str(sprite["hash"]) if sprite.get("hash") else None
+
+    return cache
+
+
+def index_page_path(page: int) -> Path:
+    return INDEX_DIR / INDEX_PAGE_TEMPLATE.format(page=page)
+
+
+class IndexPages:
+    """Write index/head.json plus fixed-size index/page-NNNN.json shards.
+
+    The head holds the top INDEX_HEAD_LIMIT cards by stars, the totals and a
+    digest over every page entry, so readers that only need the top cards or
+    a change signal load one small file whatever the card count.
+    """
+
+    def __init__(self, dry_run: bool = False) -> None:
+        self.dry_run = dry_run
+        self.count = 0
+        self.pages = 0
+        self._page: JsonListWriter | None = None
+        self._digest = hashlib.sha256()
+        self._top = TopK(INDEX_HEAD_LIMIT)
+
+        previous = load_json(INDEX_HEAD, {}, strict=False)
+        self.previous_pages = previous.get("pages", 0) if isinstance(previous, dict) else 0
+
+    def append(self, repo: RepoRecord, entry: dict[str, Any]) -> None:
+        if self._page is None:
+            self.pages += 1
+            self._page = JsonListWriter(index_page_path(self.pages), "cards", dry_run=self.dry_run)
+
+        self._page.append(entry)
+        self._digest.update(encode_jsonl_line(entry))
+        self._top.push(repo, entry)
+        self.count += 1
+
+        if self._page.count >= INDEX_PAGE_SIZE:
+            self._close_page()
+
+    def _close_page(self) -> None:
+        if self._page is not None:
+            self._page.close({"count": self._page.count, "page": self.pages}, skip_unchanged=True)
+            self._page = None
+
+    def close(self, tail: dict[str, Any]) -> None:
+        self._close_page()
+
+        for page in range(self.pages + 1, int(self.previous_pages or 0) + 1):
+            remove_file(index_page_path(page), dry_run=self.dry_run)
+
+        head = dict(tail)
+        head.update(
+            {
+                "cards": self._top.items(),
+                "count": self.count,
+                "page_size": INDEX_PAGE_SIZE,
+                "page_template": str(INDEX_DIR.relative_to(ROOT) / INDEX_PAGE_TEMPLATE),
+                "pages": self.pages,
+                "pages_hash": self._digest.hexdigest(),
+            }
+        )
+        write_json(INDEX_HEAD, head, dry_run=self.dry_run, skip_unchanged=True)
+
+
+class IndexWriter:
+    """Write assets/projects/index.json (and/or index.jsonl) plus the paged index one card at a time."""
+
+    def __init__(self, output_format: str, dry_run: bool = False) -> None:
+        self.output_format = output_format
+        self.dry_run = dry_run
+        self.count = 0
+        self._document = JsonListWriter(INDEX_JSON, "cards", dry_run=dry_run) if output_format != "jsonl" else None
+        self._lines = JsonlWriter(INDEX_JSONL, dry_run=dry_run) if output_format != "json" else None
+        self._pages = IndexPages(dry_run=dry_run)
+
+    def append(self, repo: RepoRecord, entry: dict[str, Any]) -> None:
+        if self._document is not None:
+            self._document.append(entry)
+        if self._lines is not None:
+            self._lines.append(entry)
+        self._pages.append(repo, entry)
+        self.count += 1
+
+    def close(self, sprite: dict[str, Any] | None = None) -> None:
+        tail: dict[str, Any] = {
+            "source": "scripts/generate_project_cards.py",
+            "template_version": CARD_TEMPLATE_VERSION,
+            "count": self.count,
+        }
+
+        if sprite is not None:
+            tail["sprite"] = sprite
+
+        self._pages.close(tail)
+
+        if self._lines is not None:
+            self._lines.commit(skip_unchanged=True)
+        else:
+            remove_file(INDEX_JSONL, dry_run=self.dry_run)
+
+        if self._document is not None:
+            self._document.close(tail, skip_unchanged=True)
+            return
+
+        tail["format"] = "jsonl"
+        tail["records"] = str(INDEX_JSONL.relative_to(ROOT))
+        write_json(INDEX_JSON, tail, dry_run=self.dry_run, skip_unchanged=True)
+
+
+def remove_stale_cards(stale_paths: Iterable[str], dry_run: bool = False) -> None:
+    """Remove cards listed in the previous index that this run did not produce."""
+    for rel in sorted(stale_paths):
+        path = ROOT / rel
+        if path.parent == PROJECTS_DIR and path.suffix == ".svg":
+            remove_file(path, dry_run=dry_run)
+
+
+def sweep_unindexed_cards(valid_filenames: set[str], dry_run: bool = False) -> None:
     if not PROJECTS_DIR.exists():
         return
 
     for path in sorted(PROJECTS_DIR.glob("*.svg")):
         if path.name not in valid_filenames:
-            if dry_run:
-                print(f"DRY-RUN: would remove stale {path.relative_to(ROOT)}")
-            else:
-                path.unlink()
-                print(f"REMOVED: {path.relative_to(ROOT)}")
+            remove_file(path, dry_run=dry_run)
+
+
+def select_repositories(limit: int) -> Iterator[RepoRecord]:
+    """Top ``limit`` by stars (O(limit) memory), or every record streamed in key order when limit <= 0."""
+    records = normalize_repositories()
+
+    if limit > 0:
+        return iter(top_repos(records, limit))
+
+    return records
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true", help="print planned writes without mutating files")
-    parser.add_argument("--limit", type=int, default=12, help="maximum cards to generate")
+    parser.add_argument("--limit", type=int, default=12, help="maximum cards to generate; 0 streams every repository")
+    parser.add_argument("--force", action="store_true", help="ignore the card cache and re-render every card")
+    parser.add_argument(
+        "--atlas",
+        action="store_true",
+        default=default_atlas(),
+        help=f"also pack all cards into assets/projects/atlas.svg with shared defs (default from {ATLAS_ENV})",
+    )
+    add_profile_argument(parser)
+    parser.add_argument("--sweep", action="store_true", help="also remove card SVGs that no index ever listed (globs the directory)")
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="index representation: json document, jsonl cards with a small json header, or both",
+    )
     args = parser.parse_args()
 
-    repos = normalize_repositories()
+    previous = load_card_cache()
+    atlas = AtlasWriter(dry_run=args.dry_run, profile=args.profile) if args.atlas else None
+    index = IndexWriter(args.format, dry_run=args.dry_run)
+    valid_filenames: set[str] = set()
+    rendered = 0
 
-    repos = sorted(
-        repos,
-        key=lambda item: (
-            -safe_int(item.get("stars")),
-            str(item.get("full_name", "")).lower(),
-        ),
-    )[: args.limit]
+    for repo in select_repositories(args.limit):
+        with span("card", cat="render", repo=repo.full_name) as attrs:
+            trace = card_trace(card_fields(repo))
+            entry = card_entry(repo, card_hash(trace, args.profile))
+            path = ROOT / entry["path"]
+            cached = previous.pop(entry["path"], None)
 
-    valid_filenames: set[str] = set()
+            if args.sweep:
+                valid_filenames.add(path.name)
+
+            if atlas is not None:
+                entry["atlas"] = atlas.add(repo, trace, entry["hash"])
+
+            fresh = not args.force and cached == entry["hash"] and path.exists()
+            attrs["cache"] = "hit" if fresh else "miss"
+
+            if not fresh:
+                write_text(path, svg_card(repo, trace, args.profile), dry_run=args.dry_run)
+                rendered += 1
+
+            entry["exists"] = fresh or not args.dry_run
+            index.append(repo, entry)
+
+    sprite = None
+
+    if atlas is not None:
+        atlas_path = str(ATLAS_SVG.relative_to(ROOT))
+        cached = None if args.force else previous.get(atlas_path)
+        previous.pop(atlas_path, None)
+        sprite = atlas.close(cached)
+        valid_filenames.add(ATLAS_SVG.name)
 
-    for repo in repos:
-        slug = slugify(str(repo["full_name"]))
-        filename = f"{slug}.svg"
-        valid_filenames.add(filename)
-        write_text(PROJECTS_DIR / filename, svg_card(repo), dry_run=args.dry_run)
+    index.close(sprite)
 
-    remove_stale_cards(valid_filenames, dry_run=args.dry_run)
+    remove_stale_cards(previous.keys(), dry_run=args.dry_run)
 
-    index_payload = build_index(repos)
-    write_json(INDEX_JSON, index_payload, dry_run=args.dry_run)
+    if args.sweep:
+        sweep_unindexed_cards(valid_filenames, dry_run=args.dry_run)
 
-    print(f"SUMMARY: generated_cards={len(repos)} index={INDEX_JSON.relative_to(ROOT)}")
+    print(
+        f"SUMMARY: generated_cards={index.count} rendered={rendered} cached={index.count - rendered} "
+        f"index={INDEX_JSON.relative_to(ROOT)}"
+    )
 
     return 0
 
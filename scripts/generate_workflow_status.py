@@ -21,6 +21,8 @@ import html
 import json
 from pathlib import Path
 from typing import Any
+from render_profile import DEFAULT_PROFILE, add_profile_argument, filter_defs, glow_circle
+from surface_io import load_json
 ROOT = Path(__file__).resolve().parent.parent
 WORKFLOW = ROOT / ".github" / "workflows" / "readme-sync.yml"
 MANIFEST = ROOT / "dist" / "build-manifest.json"
@@ -34,13 +36,6 @@ def read_text(path: Path, default: str = "") -> str:
         return path.read_text(encoding="utf-8")
     except FileNotFoundError:
         return default
-def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return default
 def file_status(path: Path) -> str:
     return "present" if path.exists() else "missing"
 def bool_status(condition: bool) -> str:
@@ -69,8 +64,8 @@ def workflow_contract() -> dict[str, str]:
         "build_gate": bool_status("make build" in text),
     }
 def build_context() -> dict[str, str]:
-    manifest = load_json(MANIFEST, {})
-    health = load_json(HEALTH, {})
+    manifest = load_json(MANIFEST, {}, strict=False)
+    health = load_json(HEALTH, {}, strict=False)
     source_hash = "unknown"
     generator = "unknown"
     if isinstance(manifest, dict):
@@ -86,7 +81,7 @@ def build_context() -> dict[str, str]:
         "generator": generator,
     }
 def workflow_telemetry() -> dict[str, str]:
-    payload = load_json(TELEMETRY, {})
+    payload = load_json(TELEMETRY, {}, strict=False)
     if not isinstance(payload, dict):
         return {
             "telemetry": "missing",
@@ -127,7 +122,20 @@ def overall_status(contract: dict[str, str], context: dict[str, str], telemetry:
     if health in {"watch", "degraded", "unknown"}:
         return "watch"
     return "healthy"
-def svg(contract: dict[str, str], context: dict[str, str], telemetry: dict[str, str]) -> str:
+GLOW_FILTER = """    <filter id="glow">
+      <feGaussianBlur stdDeviation="3" result="blur"/>
+      <feMerge>
+        <feMergeNode in="blur"/>
+        <feMergeNode in="SourceGraphic"/>
+      </feMerge>
+    </filter>
+"""
+def svg(
+    contract: dict[str, str],
+    context: dict[str, str],
+    telemetry: dict[str, str],
+    profile: str = DEFAULT_PROFILE,
+) -> str:
     status = overall_status(contract, context, telemetry)
     trace_seed = json.dumps({"contract": contract, "context": context, "telemetry": telemetry}, sort_keys=True)
     trace = hashlib.sha256(trace_seed.encode("utf-8")).hexdigest()[:12]
@@ -170,25 +178,19 @@ def svg(contract: dict[str, str], context: dict[str, str], telemetry: dict[str,
       <stop offset="50%" stop-color="#bc8cff"/>
       <stop offset="100%" stop-color="#00ff9d"/>
     </linearGradient>
-    <filter id="glow">
-      <feGaussianBlur stdDeviation="3" result="blur"/>
-      <feMerge>
-        <feMergeNode in="blur"/>
-        <feMergeNode in="SourceGraphic"/>
-      </feMerge>
-    </filter>
-  </defs>
+{glow}  </defs>
   <rect width="560" height="430" rx="18" fill="#0d1117"/>
   <rect x="1" y="1" width="558" height="428" rx="18" fill="none" stroke="url(#border)" stroke-width="1.5" opacity="0.78"/>
   <text x="44" y="36" fill="#00f3ff" font-family="monospace" font-size="14" font-weight="700">WORKFLOW CONTROL</text>
-  <circle cx="490" cy="31" r="7" fill="{overall_color}" filter="url(#glow)"/>
+  {status_dot}
   {rows}
   <text x="44" y="382" fill="#8b949e" font-family="monospace" font-size="10">workflow:{workflow} · branch:{branch} · sha:{sha}</text>
   <text x="44" y="404" fill="#484f58" font-family="monospace" font-size="10">trace:{trace} · source:{source_hash}</text>
 </svg>
 '''.format(
         rows="\n  ".join(row_svg),
-        overall_color=overall_color,
+        glow=filter_defs(profile, GLOW_FILTER),
+        status_dot=glow_circle(profile, 490, 31, 7, overall_color),
         workflow=esc(telemetry.get("workflow", "unknown")),
         branch=esc(telemetry.get("branch", "unknown")),
         sha=esc(telemetry.get("sha", "unknown")),
@@ -205,11 +207,12 @@ def write_output(content: str, dry_run: bool) -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true")
+    add_profile_argument(parser)
     args = parser.parse_args()
     contract = workflow_contract()
     context = build_context()
     telemetry = workflow_telemetry()
-    write_output(svg(contract, context, telemetry), dry_run=args.dry_run)
+    write_output(svg(contract, context, telemetry, args.profile), dry_run=args.dry_run)
     print("SUMMARY: workflow_status={}".format(overall_status(contract, context, telemetry)))
     return 0
 if __name__ == "__main__":
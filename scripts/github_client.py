@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub REST client with pooled connections and rate-limit accounting.
+
+Used by:
+  - scripts/collect_repo_metrics.py
+  - scripts/sync_orchestrator.py
+  - scripts/dispatch_workflows.py
+  - scripts/collect_workflow_runs.py
+  - scripts/change_preflight.py      get_conditional() (ETag / If-None-Match)
+
+Reads / writes:
+  - tmp/github_rate_limit.json       last seen X-RateLimit-* state per resource
+
+Rules:
+  - keep-alive HTTPS connections are pooled and reused across requests and
+    threads; a connection is never used by two requests at once
+  - every response updates one process-wide RateLimit; the state is loaded
+    from and saved to tmp/ so consecutive tools share the same budget
+  - a request against an exhausted resource fails fast with status 429 and
+    never sleeps until the reset, so callers keep their own deadlines
+  - only idempotent methods (GET, HEAD) are retried on a dropped keep-alive
+    connection; a POST is sent once, so a workflow_dispatch never fires twice
+  - close() only closes idle connections; one still in use by a request is
+    closed when that request releases it, never underneath it
+  - get_conditional() sends If-None-Match; 304 means the stored ETag still
+    matches (and does not count against an authenticated rate limit)
+  - uses GITHUB_TOKEN / GH_TOKEN only if present; tokens are never written
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+from pipeline_trace import span
+from surface_io import load_json, write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+RATE_LIMIT_FILE = ROOT / "tmp" / "github_rate_limit.json"
+
+API_HOST = "api.github.com"
+DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "popdeuxrem-surface-telemetry",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+DEFAULT_POOL_SIZE = 8
+ERROR_BODY_LIMIT = 500
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+Response = tuple[int, Any, str | None]
+
+
+def github_token() -> str | None:
+    return os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+
+
+class RateLimit:
+    """Thread-safe X-RateLimit-* bookkeeping, keyed by resource (core, search, ...)."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.resources: dict[str, dict[str, int]] = {}
+        self.requests = 0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        with self.lock:
+            self.requests += 1
+            if remaining is None:
+                return
+            resource = headers.get("X-RateLimit-Resource", "core")
+            self.resources[resource] = {
+                key: int(headers.get(f"X-RateLimit-{key.title()}", 0) or 0)
+                for key in ("limit", "remaining", "reset", "used")
+            }
+
+    def exhausted_until(self, resource: str = "core") -> int:
+        """Epoch at which an exhausted resource resets, 0 when requests may proceed."""
+        with self.lock:
+            state = self.resources.get(resource)
+        if state and state["remaining"] <= 0 and state["reset"] > time.time():
+            return state["reset"]
+        return 0
+
+    def snapshot(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "resources": {name: dict(state) for name, state in sorted(self.resources.items())},
+            }
+
+    def load(self, path: Path = RATE_LIMIT_FILE) -> None:
+        stored = load_json(path, {}, strict=False)
+        resources = stored.get("resources") if isinstance(stored, dict) else None
+        if not isinstance(resources, dict):
+            return
+        now = time.time()
+        with self.lock:
+            for name, state in resources.items():
+                if isinstance(state, dict) and int(state.get("reset", 0)) > now:
+                    self.resources.setdefault(name, {key: int(state.get(key, 0)) for key in ("limit", "remaining", "reset", "used")})
+
+    def save(self, path: Path = RATE_LIMIT_FILE, dry_run: bool = False) -> None:
+        snapshot = self.snapshot()
+        if snapshot["resources"]:
+            write_json(path, {"resources": snapshot["resources"]}, dry_run=dry_run, skip_unchanged=True)
+
+
+RATE_LIMIT = RateLimit()
+
+
+class GitHubClient:
+    """Pooled keep-alive client; safe to share between threads and asyncio.to_thread calls."""
+
+    def __init__(
+        self,
+        token: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        rate_limit: RateLimit = RATE_LIMIT,
+    ) -> None:
+        self.headers = dict(DEFAULT_HEADERS)
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.authenticated = bool(token)
+        self.rate_limit = rate_limit
+        self.pool: queue.LifoQueue[http.client.HTTPSConnection] = queue.LifoQueue(maxsize=max(1, pool_size))
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def acquire(self, timeout: float) -> http.client.HTTPSConnection:
+        try:
+            connection = self.pool.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPSConnection(API_HOST, timeout=timeout)
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+    def release(self, connection: http.client.HTTPSConnection) -> None:
+        with self.lock:
+            if not self.closed:
+                try:
+                    self.pool.put_nowait(connection)
+                    return
+                except queue.Full:
+                    pass
+        connection.close()
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+        while True:
+            try:
+                self.pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        timeout: float = 15,
+        resource: str = "core",
+    ) -> Response:
+        """Return (status, parsed JSON body or None, error); status 0 means no response."""
+        with span("github.request", cat="http", method=method, path=path) as attrs:
+            result = self.send(method, path, payload, timeout, resource, attrs)
+            attrs["http_status"] = result[0]
+            attrs.pop("etag", None)
+            return result
+
+    def get_conditional(self, path: str, etag: str | None, timeout: float = 15) -> tuple[int, Any, str | None, str | None]:
+        """GET with If-None-Match; returns (status, body, error, etag). Status 304 means unchanged."""
+        with span("github.request", cat="http", method="GET", path=path, conditional=bool(etag)) as attrs:
+            status, body, error = self.send("GET", path, None, timeout, "core", attrs, {"If-None-Match": etag} if etag else None)
+            attrs["http_status"] = status
+            return status, body, error, attrs.pop("etag", None) or etag
+
+    def send(
+        self,
+        method: str,
+        path: str,
+        payload: Any,
+        timeout: float,
+        resource: str,
+        attrs: dict[str, Any],
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        reset = self.rate_limit.exhausted_until(resource)
+        if reset:
+            return 429, None, f"rate limit exhausted until {time.strftime('%H:%M:%SZ', time.gmtime(reset))}"
+
+        headers = dict(self.headers)
+        headers.update(extra_headers or {})
+        body = None
+        if payload is not None:
+            body = json.dumps(payload, sort_keys=True).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        # A pooled connection may have been closed by the server; retry once on a fresh one.
+        # Non-idempotent requests may already have reached the server, so they are not retried.
+        retry = method.upper() in IDEMPOTENT_METHODS
+        for fresh in (False, True):
+            connection = http.client.HTTPSConnection(API_HOST, timeout=timeout) if fresh else self.acquire(timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                connection.close()
+                if fresh or not retry:
+                    return 0, None, str(exc)
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                return 0, None, str(exc)
+            break
+
+        attrs["reconnected"] = fresh
+        attrs["bytes"] = len(data)
+        attrs["etag"] = response.headers.get("ETag")
+        self.rate_limit.update(response.headers)
+        if response.will_close:
+            connection.close()
+        else:
+            self.release(connection)
+
+        status = int(response.status)
+        text = data.decode("utf-8", errors="replace")
+        if status >= 400:
+            return status, None, text[:ERROR_BODY_LIMIT]
+        if not text.strip():
+            return status, None, None
+        try:
+            return status, json.loads(text), None
+        except json.JSONDecodeError as exc:
+            return status, None, str(exc)
+
+    def get(self, path: str, timeout: float = 15) -> Response:
+        return self.request("GET", path, timeout=timeout)
+
+    def post(self, path: str, payload: Any, timeout: float = 15) -> Response:
+        return self.request("POST", path, payload=payload, timeout=timeout)
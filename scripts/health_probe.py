@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Concurrent, cached system health probes (entry point: systems/scripts/system_health.sh).
+
+Reads:
+  - health/status.json, health/orchestrator.json, identity/repos.json   file probes
+  - metrics/                                                            directory probe
+  - logs/pipeline.jsonl                                                 ERROR event count
+  - git metadata, /proc/uptime                                          system probes
+
+Writes:
+  - health/system_health.json        components / system / status / timestamp / uptime,
+                                     plus "probes": per-probe latency_ms, cached, status
+  - tmp/health/probe-cache.json      cached results of the expensive probes
+  - logs/pipeline.jsonl              stage "health" events, one per probe with its ms
+
+Rules:
+  - every probe runs concurrently on a daemon thread with its own timeout; a
+    probe that times out or raises reports status "timeout" / "error" and
+    never holds the process open once the document is written
+  - the directory walk and the HEAD-derived git probes (branch, commit count)
+    are cached for --ttl seconds (HEALTH_PROBE_TTL, default 60); git entries
+    are also keyed by `git rev-parse HEAD`, so a commit or checkout re-probes
+  - uncommitted_changes tracks the working tree and is never cached;
+    --ttl 0 always re-probes
+  - overall status: any missing/failed component -> degraded, any
+    degraded/warning/unknown/timeout component -> watch, else healthy
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as ProbeTimeout
+from pathlib import Path
+from typing import Any, Callable
+
+from pipeline_log import LOG_FILE, PipelineLog
+from surface_io import dumps_json, load_json, write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+HEALTH_DIR = ROOT / "health"
+SYSTEM_HEALTH = HEALTH_DIR / "system_health.json"
+CACHE_FILE = ROOT / "tmp" / "health" / "probe-cache.json"
+
+TTL_ENV = "HEALTH_PROBE_TTL"
+DEFAULT_TTL = 60
+DEFAULT_TIMEOUT = 2.0
+GIT_TIMEOUT = 5.0
+
+EXECUTABLE_SCRIPTS = (
+    "systems/automation/bootstrap.sh",
+    "systems/automation/healthcheck.sh",
+    "systems/orchestrator/sync.sh",
+    "systems/orchestrator/dispatch.sh",
+    "scripts/build_readme.py",
+    "scripts/quantum_build.sh",
+)
+
+FAILED_STATUSES = {"missing", "fail", "failed", "error", "critical"}
+WATCH_STATUSES = {"degraded", "warn", "warning", "unknown", "timeout"}
+
+
+def iso_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).astimezone().isoformat(timespec="seconds")
+
+
+def check_file(rel: str, name: str) -> dict[str, Any]:
+    try:
+        stat = (ROOT / rel).stat()
+    except OSError:
+        return {"name": name, "status": "missing", "size": 0, "modified": None}
+
+    modified = dt.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+    return {"name": name, "status": "ok", "size": stat.st_size, "modified": modified}
+
+
+def check_directory(rel: str, name: str) -> dict[str, Any]:
+    path = ROOT / rel
+    if not path.is_dir():
+        return {"name": name, "status": "missing", "files": 0}
+
+    files = sum(len(filenames) for _, _, filenames in os.walk(path))
+    return {"name": name, "status": "ok", "files": files}
+
+
+def check_scripts(log: PipelineLog) -> dict[str, Any]:
+    errors = 0
+    for rel in EXECUTABLE_SCRIPTS:
+        if os.access(ROOT / rel, os.X_OK):
+            log("INFO", f"Script {rel} is executable")
+        else:
+            log("ERROR", f"Script {rel} is not executable")
+            errors += 1
+    return {"status": "degraded" if errors else "ok", "errors": errors}
+
+
+def check_logs() -> dict[str, Any]:
+    if not LOG_FILE.is_file():
+        return {"size": 0, "errors": 0}
+
+    with LOG_FILE.open("rb") as handle:
+        errors = sum(1 for line in handle if b'"level":"ERROR"' in line)
+    return {"size": LOG_FILE.stat().st_size, "errors": errors}
+
+
+def read_uptime() -> str:
+    try:
+        seconds = int(float(Path("/proc/uptime").read_text(encoding="ascii").split()[0]))
+    except (OSError, ValueError, IndexError):
+        return "unknown"
+
+    units = (("year", 365 * 86400), ("week", 7 * 86400), ("day", 86400), ("hour", 3600), ("minute", 60))
+    parts = []
+    for unit, size in units:
+        count, seconds = divmod(seconds, size)
+        if count:
+            parts.append(f"{count} {unit}{'s' if count != 1 else ''}")
+    return "up " + (", ".join(parts) or "0 minutes")
+
+
+def git(*args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(ROOT), *args],
+        capture_output=True,
+        text=True,
+        timeout=GIT_TIMEOUT,
+        check=True,
+    )
+    return result.stdout
+
+
+def git_head() -> str | None:
+    try:
+        return git("rev-parse", "HEAD").strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Probe:
+    __slots__ = ("name", "run", "fallback", "timeout", "cacheable", "cache_key")
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], Any],
+        fallback: Callable[[str], Any],
+        timeout: float = DEFAULT_TIMEOUT,
+        cacheable: bool = False,
+        cache_key: Callable[[], str | None] | None = None,
+    ) -> None:
+        self.name = name
+        self.run = run
+        self.fallback = fallback
+        self.timeout = timeout
+        self.cacheable = cacheable
+        self.cache_key = cache_key
+
+
+def probes(log: PipelineLog) -> list[Probe]:
+    def file_fallback(name: str) -> Callable[[str], Any]:
+        return lambda status: {"name": name, "status": status, "size": 0, "modified": None}
+
+    return [
+        Probe("automation", lambda: check_file("health/status.json", "automation"), file_fallback("automation")),
+        Probe("orchestrator", lambda: check_file("health/orchestrator.json", "orchestrator"), file_fallback("orchestrator")),
+        Probe(
+            "metrics",
+            lambda: check_directory("metrics", "metrics"),
+            lambda status: {"name": "metrics", "status": status, "files": 0},
+            cacheable=True,
+        ),
+        Probe("identity", lambda: check_file("identity/repos.json", "repos_registry"), file_fallback("repos_registry")),
+        Probe("scripts", lambda: check_scripts(log), lambda status: {"status": status, "errors": len(EXECUTABLE_SCRIPTS)}),
+        Probe("logs", check_logs, lambda status: {"size": 0, "errors": 0}),
+        Probe("uptime", read_uptime, lambda status: "unknown"),
+        Probe(
+            "git_branch",
+            lambda: git("rev-parse", "--abbrev-ref", "HEAD").strip() or "unknown",
+            lambda status: "unknown",
+            timeout=GIT_TIMEOUT,
+            cacheable=True,
+            cache_key=git_head,
+        ),
+        Probe(
+            "commit_count",
+            lambda: int(git("rev-list", "--count", "HEAD").strip() or 0),
+            lambda status: 0,
+            timeout=GIT_TIMEOUT,
+            cacheable=True,
+            cache_key=git_head,
+        ),
+        Probe(
+            "uncommitted_changes",
+            lambda: sum(1 for line in git("status", "--porcelain").splitlines() if line.strip()),
+            lambda status: 0,
+            timeout=GIT_TIMEOUT,
+        ),
+    ]
+
+
+def timed(run: Callable[[], Any]) -> tuple[Any, float]:
+    """Run a probe and measure its own wall time, excluding pool queueing."""
+    started = time.perf_counter()
+    value = run()
+    return value, (time.perf_counter() - started) * 1000
+
+
+def start(probe: Probe) -> Future[Any]:
+    """Run a probe on a daemon thread, so one that outlives its timeout cannot block exit."""
+    future: Future[Any] = Future()
+
+    def target() -> None:
+        try:
+            future.set_result(timed(probe.run))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name=f"probe-{probe.name}", daemon=True).start()
+    return future
+
+
+def run_probes(items: list[Probe], ttl: int, dry_run: bool = False) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Run uncached probes concurrently; returns (values, per-probe stats)."""
+    cache = load_json(CACHE_FILE, {}, strict=False) if ttl > 0 else {}
+    cache = cache if isinstance(cache, dict) else {}
+    now = time.time()
+
+    values: dict[str, Any] = {}
+    stats: dict[str, dict[str, Any]] = {}
+    keys: dict[Callable[[], str | None], str | None] = {}
+    pending: list[tuple[Probe, Future[Any], float, str | None]] = []
+
+    for probe in items:
+        key = None
+        if probe.cacheable and probe.cache_key is not None and ttl > 0:
+            if probe.cache_key not in keys:
+                keys[probe.cache_key] = probe.cache_key()
+            key = keys[probe.cache_key]
+        cached = cache.get(probe.name)
+        if (
+            probe.cacheable
+            and isinstance(cached, dict)
+            and now - float(cached.get("at", 0)) < ttl
+            and cached.get("key") == key
+        ):
+            values[probe.name] = cached.get("value")
+            stats[probe.name] = {"cached": True, "latency_ms": 0.0, "status": "ok"}
+            continue
+        pending.append((probe, start(probe), time.perf_counter(), key))
+
+    fresh: dict[str, dict[str, Any]] = {}
+    for probe, future, started, key in pending:
+        remaining = max(0.0, probe.timeout - (time.perf_counter() - started))
+        try:
+            values[probe.name], latency = future.result(timeout=remaining)
+            status = "ok"
+        except ProbeTimeout:
+            values[probe.name], latency = probe.fallback("timeout"), probe.timeout * 1000
+            status = "timeout"
+        except Exception:
+            values[probe.name], latency = probe.fallback("error"), (time.perf_counter() - started) * 1000
+            status = "error"
+
+        stats[probe.name] = {"cached": False, "latency_ms": round(latency, 3), "status": status}
+        if probe.cacheable and status == "ok":
+            fresh[probe.name] = {"at": now, "key": key, "value": values[probe.name]}
+
+    if ttl > 0 and fresh and not dry_run:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        cache.update(fresh)
+        write_json(CACHE_FILE, cache)
+
+    return values, stats
+
+
+def derive_overall_status(components: dict[str, Any]) -> str:
+    statuses = [str(value.get("status", "unknown")).lower() for value in components.values() if isinstance(value, dict)]
+
+    if any(status in FAILED_STATUSES for status in statuses):
+        return "degraded"
+    if any(status in WATCH_STATUSES for status in statuses):
+        return "watch"
+    return "healthy"
+
+
+def build_payload(values: dict[str, Any], stats: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    components = {name: values[name] for name in ("automation", "orchestrator", "metrics", "identity", "scripts", "logs")}
+    return {
+        "timestamp": iso_now(),
+        "uptime": values["uptime"],
+        "components": components,
+        "system": {
+            "git_branch": values["git_branch"],
+            "commit_count": values["commit_count"],
+            "uncommitted_changes": values["uncommitted_changes"],
+        },
+        "probes": stats,
+        "status": derive_overall_status(components),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="print the health document without writing it")
+    parser.add_argument(
+        "--ttl",
+        type=int,
+        default=int(os.environ.get(TTL_ENV, DEFAULT_TTL)),
+        help=f"seconds to reuse cached git/directory probe results (default from {TTL_ENV})",
+    )
+    args = parser.parse_args()
+
+    log = PipelineLog("health", echo=False, dry_run=args.dry_run)
+    log("INFO", "Generating system health")
+
+    values, stats = run_probes(probes(log), max(0, args.ttl), dry_run=args.dry_run)
+    payload = build_payload(values, stats)
+    for name, stat in stats.items():
+        log("WARN" if stat["status"] != "ok" else "INFO", f"Probe {name}", ms=stat["latency_ms"], cached=stat["cached"], status=stat["status"])
+
+    if not args.dry_run:
+        write_json(SYSTEM_HEALTH, payload)
+        log("INFO", f"System health generated: {SYSTEM_HEALTH}", status=payload["status"])
+    log.close()
+
+    sys.stdout.write(dumps_json(payload))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
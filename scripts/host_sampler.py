@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Low-overhead build host sampler feeding the system matrix panel.
+
+Reads:
+  - /proc/stat                       aggregate cpu jiffies (busy vs idle + iowait)
+  - /proc/meminfo                    MemTotal / MemAvailable
+  - /proc/diskstats                  io_ticks of whole disks (/sys/block, no loop/ram/zram)
+  - /proc/net/dev                    rx + tx packets of every interface except lo
+
+Writes:
+  - tmp/host/samples.json            ring buffer: capacity, last raw counters, samples
+
+Used by:
+  - scripts/quantum_build.sh         --watch in the background while generators run
+  - scripts/build_readme.py          load_summary() -> min/avg/max for the matrix SVG
+
+Rules:
+  - a sample is the delta between two counter reads: cpu/io busy %, packets/s,
+    plus the instantaneous ram used %
+  - the ring keeps the newest --capacity samples (default 120); older ones drop
+  - counters older than MAX_GAP seconds are not diffed against, so a sample
+    never averages over the idle time between pipeline runs
+  - load_summary() ignores samples older than MAX_AGE seconds and returns None
+    when nothing usable is left (non-Linux host, no run yet) so callers can
+    fall back to their deterministic values
+  - --watch stops on SIGTERM/SIGINT or --duration, taking one final sample
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from surface_io import display_path, dump_json, dumps_json, load_json, write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLES_FILE = ROOT / "tmp" / "host" / "samples.json"
+PROC = Path("/proc")
+SYS_BLOCK = Path("/sys/block")
+
+DEFAULT_CAPACITY = 120
+DEFAULT_INTERVAL = 0.5
+MIN_ELAPSED = 0.25
+MAX_GAP = 60.0
+MAX_AGE = 900.0
+
+METRICS = ("cpu", "ram", "io", "packets")
+SKIP_DISKS = ("loop", "ram", "zram")
+
+
+def read_cpu() -> tuple[int, int]:
+    """(total, idle) jiffies from the aggregate cpu line."""
+    with (PROC / "stat").open("rb") as handle:
+        fields = [int(value) for value in handle.readline().split()[1:]]
+    # user nice system idle iowait irq softirq steal; guest time is already in user/nice.
+    fields = fields[:8]
+    return sum(fields), fields[3] + (fields[4] if len(fields) > 4 else 0)
+
+
+def read_memory() -> float:
+    values: dict[bytes, int] = {}
+    with (PROC / "meminfo").open("rb") as handle:
+        for line in handle:
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemAvailable"):
+                values[key] = int(rest.split()[0])
+                if len(values) == 2:
+                    break
+    total = values.get(b"MemTotal", 0)
+    if not total or b"MemAvailable" not in values:
+        raise ValueError("meminfo lacks MemTotal/MemAvailable")
+    return 100.0 * (total - values[b"MemAvailable"]) / total
+
+
+def whole_disks() -> set[str]:
+    try:
+        names = {path.name for path in SYS_BLOCK.iterdir()}
+    except OSError:
+        return set()
+    return {name for name in names if not name.startswith(SKIP_DISKS)}
+
+
+def read_disks(disks: set[str]) -> dict[str, int]:
+    """io_ticks (ms spent doing I/O) per whole disk."""
+    ticks: dict[str, int] = {}
+    with (PROC / "diskstats").open("rb") as handle:
+        for line in handle:
+            fields = line.split()
+            name = fields[2].decode("ascii", "replace")
+            if name in disks and len(fields) > 12:
+                ticks[name] = int(fields[12])
+    return ticks
+
+
+def read_packets() -> int:
+    packets = 0
+    with (PROC / "net" / "dev").open("rb") as handle:
+        for line in handle.readlines()[2:]:
+            name, _, rest = line.partition(b":")
+            if name.strip() == b"lo":
+                continue
+            fields = rest.split()
+            packets += int(fields[1]) + int(fields[9])
+    return packets
+
+
+def read_counters(disks: set[str]) -> dict[str, Any]:
+    total, idle = read_cpu()
+    return {
+        "at": time.time(),
+        "cpu_total": total,
+        "cpu_idle": idle,
+        "ram": read_memory(),
+        "disk_ticks": read_disks(disks),
+        "packets": read_packets(),
+    }
+
+
+def delta(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, float] | None:
+    """One sample from two counter reads; None when they are too close or too far apart."""
+    elapsed = current["at"] - previous["at"]
+    if not MIN_ELAPSED <= elapsed <= MAX_GAP:
+        return None
+
+    total = current["cpu_total"] - previous["cpu_total"]
+    idle = current["cpu_idle"] - previous["cpu_idle"]
+    cpu = 100.0 * (total - idle) / total if total > 0 else 0.0
+
+    # Busiest disk: utilisation is per device, summing would exceed 100%.
+    busy_ms = max(
+        (ticks - previous["disk_ticks"].get(name, ticks) for name, ticks in current["disk_ticks"].items()),
+        default=0,
+    )
+    io = min(100.0, busy_ms / (elapsed * 10.0))
+
+    return {
+        "at": round(current["at"], 3),
+        "cpu": round(min(100.0, max(0.0, cpu)), 2),
+        "ram": round(current["ram"], 2),
+        "io": round(max(0.0, io), 2),
+        "packets": round(max(0, current["packets"] - previous["packets"]) / elapsed, 2),
+    }
+
+
+class SampleRing:
+    """Fixed-size ring of samples persisted with the last raw counters."""
+
+    __slots__ = ("samples", "last")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.samples: deque[dict[str, float]] = deque(maxlen=max(1, capacity))
+        self.last: dict[str, Any] | None = None
+
+    @classmethod
+    def load(cls, capacity: int | None = None) -> "SampleRing":
+        raw = load_json(SAMPLES_FILE, {}, strict=False)
+        raw = raw if isinstance(raw, dict) else {}
+        ring = cls(capacity or int(raw.get("capacity") or DEFAULT_CAPACITY))
+        ring.samples.extend(item for item in raw.get("samples", []) if isinstance(item, dict))
+        last = raw.get("last")
+        ring.last = last if isinstance(last, dict) and "at" in last else None
+        return ring
+
+    def record(self, counters: dict[str, Any]) -> dict[str, float] | None:
+        sample = delta(self.last, counters) if self.last is not None else None
+        if sample is not None:
+            self.samples.append(sample)
+        if sample is not None or self.last is None or counters["at"] - self.last["at"] > MAX_GAP:
+            self.last = counters
+        return sample
+
+    def payload(self) -> dict[str, Any]:
+        return {"capacity": self.samples.maxlen, "last": self.last, "samples": list(self.samples)}
+
+    def persist(self) -> None:
+        """Quiet atomic write used between samples so readers never see a partial ring."""
+        SAMPLES_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SAMPLES_FILE.with_name(SAMPLES_FILE.name + ".tmp")
+        with tmp.open("wb") as handle:
+            dump_json(self.payload(), handle)
+        os.replace(tmp, SAMPLES_FILE)
+
+    def save(self, dry_run: bool = False) -> None:
+        write_json(SAMPLES_FILE, self.payload(), dry_run=dry_run)
+
+    def summary(self, max_age: float = MAX_AGE) -> dict[str, Any] | None:
+        cutoff = time.time() - max_age
+        recent = [item for item in self.samples if float(item.get("at", 0)) >= cutoff]
+        if not recent:
+            return None
+
+        summary: dict[str, Any] = {"samples": len(recent), "window_s": round(recent[-1]["at"] - recent[0]["at"], 1)}
+        for metric in METRICS:
+            values = [float(item[metric]) for item in recent if metric in item]
+            if not values:
+                return None
+            summary[metric] = {
+                "min": round(min(values), 2),
+                "avg": round(sum(values) / len(values), 2),
+                "max": round(max(values), 2),
+            }
+        return summary
+
+
+def load_summary(max_age: float = MAX_AGE) -> dict[str, Any] | None:
+    """min/avg/max per metric over recent samples, or None when sampling is unavailable."""
+    return SampleRing.load().summary(max_age)
+
+
+def sample_once(ring: SampleRing, disks: set[str]) -> dict[str, float] | None:
+    try:
+        return ring.record(read_counters(disks))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def watch(ring: SampleRing, interval: float, duration: float, dry_run: bool = False) -> int:
+    disks = whole_disks()
+    stop = False
+
+    def request_stop(signum: int, frame: Any) -> None:
+        nonlocal stop
+        stop = True
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    taken = 0
+    deadline = time.monotonic() + duration if duration > 0 else None
+    sample_once(ring, disks)
+    while not stop and (deadline is None or time.monotonic() < deadline):
+        time.sleep(interval)
+        if sample_once(ring, disks) is not None:
+            taken += 1
+            if not dry_run:
+                ring.persist()
+
+    # Catch the tail of a short stage; record() drops it if under MIN_ELAPSED.
+    if sample_once(ring, disks) is not None:
+        taken += 1
+    ring.save(dry_run=dry_run)
+    return taken
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--watch", action="store_true", help="sample every --interval until SIGTERM or --duration")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between samples")
+    parser.add_argument("--duration", type=float, default=0, help="stop --watch after this many seconds (0: until signalled)")
+    parser.add_argument("--capacity", type=int, default=None, help=f"ring buffer size (default {DEFAULT_CAPACITY})")
+    parser.add_argument("--summary", action="store_true", help="print min/avg/max over recent samples")
+    parser.add_argument("--dry-run", action="store_true", help="sample without writing the ring buffer")
+    args = parser.parse_args()
+
+    ring = SampleRing.load(args.capacity)
+
+    if args.watch:
+        taken = watch(ring, max(MIN_ELAPSED, args.interval), args.duration, dry_run=args.dry_run)
+        print(f"SAMPLED: {taken} samples -> {display_path(SAMPLES_FILE)}")
+    elif not args.summary:
+        # One-shot: diff against the previous invocation's counters.
+        sample = sample_once(ring, whole_disks())
+        ring.save(dry_run=args.dry_run)
+        print(dumps_json(sample), end="")
+
+    if args.summary:
+        summary = ring.summary()
+        if summary is None:
+            print("UNAVAILABLE: no recent host samples")
+            return 1
+        print(dumps_json(summary), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Deterministic post-processing stage for generated surface artifacts.
+
+Reads / rewrites in place:
+  - index.html, site/**/*.html       HTML (inline <style> minified, <script> kept)
+  - site/assets/*.css                CSS
+  - assets/<panel>.svg               panels from build_readme.py / generate_workflow_status.py
+  - assets/projects/*.svg            project cards and atlas
+
+Writes:
+  - <artifact>.gz siblings (gzip -9, mtime 0)
+  - <artifact>.br siblings (when the optional brotli module is installed)
+  - dist/build-manifest.json "asset_sizes" (per file: bytes, gzip, br) / "asset_bytes" (totals)
+
+Rules:
+  - no network calls
+  - same input bytes -> same output bytes; re-running is a no-op
+  - text nodes are never touched; whitespace between two tags is dropped when either
+    side is a block-level HTML or non-text SVG element, and collapsed to one space
+    otherwise, so inline runs ("<b>a</b> <i>b</i>", <tspan>s) render unchanged
+  - SVG <defs> entries whose id is never referenced are pruned, duplicate <defs> blocks dropped
+  - files whose bytes did not change are not rewritten
+  - content-hashed site assets (name.<hash>.css/js) are compressed, never rewritten;
+    generate_pages_surface.py minifies them before fingerprinting
+  - run after the generators, before the Pages deploy
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import re
+from pathlib import Path
+from typing import Callable
+
+from surface_io import display_path, load_json, write_json
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional compressor
+    brotli = None
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST = ROOT / "dist" / "build-manifest.json"
+
+PANEL_SVGS = (
+    "assets/flow-line.svg",
+    "assets/section_quote.svg",
+    "assets/system-health.svg",
+    "assets/system-matrix.svg",
+    "assets/repo-metrics.svg",
+    "assets/workflow-status.svg",
+)
+
+TARGET_GLOBS = (
+    "index.html",
+    "site/**/*.html",
+    "site/assets/*.css",
+    "site/assets/*.js",
+    "site/*.json",
+    "site/chunks/*.json",
+    "assets/projects/*.svg",
+)
+
+# Tags around which inter-tag whitespace never renders. <svg> itself is left out
+# so an inline icon keeps its spacing; <text>/<tspan> are whitespace-sensitive.
+BLOCK_TAGS = frozenset(
+    """
+    address article aside blockquote body br dd details dialog div dl dt fieldset figcaption
+    figure footer form h1 h2 h3 h4 h5 h6 head header hr html li link main meta nav noscript
+    ol p script section style table tbody td template tfoot th thead title tr ul
+    circle clippath defs desc ellipse feblend fecolormatrix fecomposite fedropshadow feflood
+    fegaussianblur femerge femergenode feoffset filter g image line lineargradient marker mask
+    path pattern polygon polyline radialgradient rect stop symbol use view
+    """.split()
+)
+
+HASHED_ASSET = re.compile(r"\.[0-9a-f]{12}\.(css|js)$")
+COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+INTERTAG = re.compile(r"(<(/?)([A-Za-z][\w:-]*)[^<>]*>)\s+(?=</?([A-Za-z][\w:-]*))")
+RAW_BLOCK = re.compile(r"(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2>)", re.DOTALL | re.IGNORECASE)
+DEFS_BLOCK = re.compile(r"<defs>.*?</defs>", re.DOTALL)
+DEF_ENTRY = re.compile(
+    r"<(linearGradient|radialGradient|filter|pattern|clipPath|mask|marker|symbol)\b[^>]*\bid=\"([^\"]+)\"[^>]*?(?:/>|>.*?</\1>)",
+    re.DOTALL,
+)
+DEF_REF = re.compile(r"#([^\s\"'()]+)[)\"']")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_SPACE = re.compile(r"\s+")
+CSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+CSS_COLON = re.compile(r":\s+")
+
+
+def minify_css(text: str) -> str:
+    text = CSS_COMMENT.sub("", text)
+    text = CSS_SPACE.sub(" ", text)
+    text = CSS_PUNCT.sub(r"\1", text)
+    text = CSS_COLON.sub(":", text)
+    return text.replace(";}", "}").strip()
+
+
+def collapse_intertag(match: re.Match[str]) -> str:
+    if match.group(3).lower() in BLOCK_TAGS or match.group(4).lower() in BLOCK_TAGS:
+        return match.group(1)
+    return match.group(1) + " "
+
+
+def collapse_markup(text: str) -> str:
+    text = COMMENT.sub("", text)
+    text = INTERTAG.sub(collapse_intertag, text)
+    return text.strip() + "\n"
+
+
+def minify_html(text: str) -> str:
+    """Collapse markup outside raw blocks; <style> bodies are minified, others kept verbatim."""
+    blocks: list[str] = []
+
+    def stash(match: re.Match[str]) -> str:
+        body = match.group(3)
+        if match.group(2).lower() == "style":
+            body = minify_css(body)
+        blocks.append(body)
+        return f"{match.group(1)}\x00{len(blocks) - 1}\x00{match.group(4)}"
+
+    text = collapse_markup(RAW_BLOCK.sub(stash, text))
+    return re.sub(r"\x00(\d+)\x00", lambda match: blocks[int(match.group(1))], text)
+
+
+def prune_defs(text: str) -> str:
+    """Drop repeated <defs> blocks and defs entries whose id is never referenced."""
+    seen: set[str] = set()
+
+    def dedupe(match: re.Match[str]) -> str:
+        block = match.group(0)
+        if block in seen:
+            return ""
+        seen.add(block)
+        return block
+
+    text = DEFS_BLOCK.sub(dedupe, text)
+
+    referenced = set(DEF_REF.findall(text))
+
+    def prune(match: re.Match[str]) -> str:
+        return match.group(0) if match.group(2) in referenced else ""
+
+    text = DEFS_BLOCK.sub(lambda block: DEF_ENTRY.sub(prune, block.group(0)), text)
+    return re.sub(r"<defs>\s*</defs>", "", text)
+
+
+def minify_svg(text: str) -> str:
+    return collapse_markup(prune_defs(text))
+
+
+MINIFIERS: dict[str, Callable[[str], str]] = {
+    ".html": minify_html,
+    ".css": lambda text: minify_css(text) + "\n",
+    ".svg": minify_svg,
+}
+
+
+def minify_text(suffix: str, text: str) -> str:
+    minifier = MINIFIERS.get(suffix)
+    return minifier(text) if minifier else text
+
+
+def target_files() -> list[Path]:
+    paths: set[Path] = {ROOT / rel for rel in PANEL_SVGS}
+    for pattern in TARGET_GLOBS:
+        paths.update(ROOT.glob(pattern))
+    return sorted(path for path in paths if path.is_file())
+
+
+def write_bytes(path: Path, data: bytes, dry_run: bool = False) -> None:
+    if path.exists() and path.read_bytes() == data:
+        return
+
+    if dry_run:
+        print(f"DRY-RUN: would write {display_path(path)}")
+        return
+
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    print(f"WROTE: {display_path(path)}")
+
+
+def process(path: Path, dry_run: bool = False) -> tuple[int, dict[str, int]]:
+    """Minify, compress and return (bytes before this run, served sizes)."""
+    raw = path.read_bytes()
+    if HASHED_ASSET.search(path.name):
+        data = raw
+    else:
+        data = minify_text(path.suffix, raw.decode("utf-8")).encode("utf-8")
+        write_bytes(path, data, dry_run=dry_run)
+
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    write_bytes(path.with_name(path.name + ".gz"), gz, dry_run=dry_run)
+    sizes = {"bytes": len(data), "gzip": len(gz)}
+
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        write_bytes(path.with_name(path.name + ".br"), br, dry_run=dry_run)
+        sizes["br"] = len(br)
+
+    return len(raw), sizes
+
+
+def record_sizes(sizes: dict[str, dict[str, int]], dry_run: bool = False) -> None:
+    manifest = load_json(MANIFEST, None)
+    if not isinstance(manifest, dict):
+        print(f"SKIP: {display_path(MANIFEST)} missing; sizes not recorded")
+        return
+
+    totals: dict[str, int] = {}
+    for entry in sizes.values():
+        for key, value in entry.items():
+            totals[key] = totals.get(key, 0) + value
+
+    manifest["asset_sizes"] = sizes
+    manifest["asset_bytes"] = totals
+    write_json(MANIFEST, manifest, dry_run=dry_run, ensure_ascii=True, skip_unchanged=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="print planned writes without mutating files")
+    args = parser.parse_args()
+
+    sizes: dict[str, dict[str, int]] = {}
+    before = 0
+    for path in target_files():
+        raw, sizes[str(path.relative_to(ROOT))] = process(path, dry_run=args.dry_run)
+        before += raw
+
+    record_sizes(sizes, dry_run=args.dry_run)
+
+    minified = sum(entry["bytes"] for entry in sizes.values())
+    gz = sum(entry["gzip"] for entry in sizes.values())
+    print(
+        f"SUMMARY: files={len(sizes)} before={before} min={minified} gzip={gz} "
+        f"brotli={'on' if brotli is not None else 'unavailable'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
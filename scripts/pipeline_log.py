@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Structured, buffered and rotating pipeline log sink.
+
+Writes:
+  - logs/pipeline.jsonl              one event per line:
+                                     ts, run, stage, level, msg [, ms] [, fields...]
+  - logs/pipeline-*.jsonl.gz         rotated archives (newest PIPELINE_LOG_KEEP kept)
+
+Used by:
+  - scripts/sync_orchestrator.py / scripts/dispatch_workflows.py   stage "sync" / "dispatch"
+  - scripts/health_probe.py                                        stage "health"
+  - scripts/build_readme.py                                        stage "build"
+  - scripts/pipeline_log.sh                                        shell stages (sourced helper)
+
+Commands:
+  - query [--run ID|latest] [--stage S] [--level L] [--archives]   matching events as JSONL
+  - stats [--run ID|latest] [--archives]                           per-stage counts and ms percentiles
+  - rotate                                                         force a rotation now
+
+Rules:
+  - every process of one pipeline run shares PIPELINE_RUN_ID; the first
+    stage to start mints it and exports it to its children
+  - events are buffered in memory and appended in one write per flush
+    (every FLUSH_EVENTS events, on close and at exit); nothing is written
+    in dry-run mode
+  - before each flush the file is rotated and gzip-compressed once it
+    exceeds PIPELINE_LOG_MAX_BYTES (default 1 MiB) or its first event is
+    older than PIPELINE_LOG_MAX_DAYS (default 7)
+  - timed events carry "ms"; span() measures a block and logs it on exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import datetime as dt
+import gzip
+import os
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from surface_io import display_path, encode_jsonl_line, loads
+
+ROOT = Path(__file__).resolve().parent.parent
+LOG_DIR = ROOT / "logs"
+LOG_FILE = LOG_DIR / "pipeline.jsonl"
+ARCHIVE_GLOB = "pipeline-*.jsonl.gz"
+
+RUN_ID_ENV = "PIPELINE_RUN_ID"
+MAX_BYTES_ENV = "PIPELINE_LOG_MAX_BYTES"
+MAX_DAYS_ENV = "PIPELINE_LOG_MAX_DAYS"
+KEEP_ENV = "PIPELINE_LOG_KEEP"
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_MAX_DAYS = 7
+DEFAULT_KEEP = 8
+FLUSH_EVENTS = 64
+
+
+def env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def iso_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat(timespec="milliseconds")
+
+
+def run_id() -> str:
+    """The pipeline run id, minted once and inherited by child processes."""
+    value = os.environ.get(RUN_ID_ENV)
+    if not value:
+        value = "{}-{:x}".format(time.strftime("%Y%m%dT%H%M%S", time.gmtime()), os.getpid())
+        os.environ[RUN_ID_ENV] = value
+    return value
+
+
+def first_event_time(path: Path) -> float | None:
+    try:
+        with path.open("rb") as handle:
+            event = loads(handle.readline())
+        return dt.datetime.fromisoformat(event["ts"]).timestamp()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def rotate(path: Path = LOG_FILE, force: bool = False) -> Path | None:
+    """Archive ``path`` as pipeline-<stamp>.jsonl.gz when it is too big or too old."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return None
+    if not size:
+        return None
+
+    if not force:
+        born = first_event_time(path)
+        too_big = size >= env_number(MAX_BYTES_ENV, DEFAULT_MAX_BYTES)
+        too_old = born is not None and time.time() - born >= env_number(MAX_DAYS_ENV, DEFAULT_MAX_DAYS) * 86400
+        if not too_big and not too_old:
+            return None
+
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    staged = path.with_name(f"pipeline-{stamp}-{os.getpid()}.jsonl")
+    try:
+        # Rename first: a concurrent writer either appended before it or starts a new file.
+        os.rename(path, staged)
+    except FileNotFoundError:
+        return None
+
+    archive = staged.with_name(staged.name + ".gz")
+    with staged.open("rb") as source, gzip.open(archive, "wb") as target:
+        shutil.copyfileobj(source, target)
+    staged.unlink()
+
+    keep = int(env_number(KEEP_ENV, DEFAULT_KEEP))
+    for stale in sorted(path.parent.glob(ARCHIVE_GLOB))[:-keep or None]:
+        stale.unlink(missing_ok=True)
+    return archive
+
+
+class PipelineLog:
+    """Buffered JSONL event sink; call it like a ``log(level, message)`` function."""
+
+    def __init__(self, stage: str, echo: bool = True, dry_run: bool = False, path: Path = LOG_FILE) -> None:
+        self.stage = stage
+        self.echo = echo
+        self.dry_run = dry_run
+        self.path = path
+        self.run = run_id()
+        self.buffer: list[bytes] = []
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def __call__(self, level: str, message: str, ms: float | None = None, **fields: Any) -> None:
+        ts = iso_now()
+        if self.echo:
+            print(f"[{ts}] [{level}] {message}" + (f" ({ms:.1f}ms)" if ms is not None else ""))
+
+        event: dict[str, Any] = {"ts": ts, "run": self.run, "stage": self.stage, "level": level, "msg": message}
+        if ms is not None:
+            event["ms"] = round(ms, 3)
+        event.update(fields)
+
+        with self.lock:
+            self.buffer.append(encode_jsonl_line(event))
+            full = len(self.buffer) >= FLUSH_EVENTS
+        if full:
+            self.flush()
+
+    @contextmanager
+    def span(self, message: str, level: str = "INFO", **fields: Any) -> Iterator[dict[str, Any]]:
+        """Log ``message`` with the block's duration; the yielded dict adds fields."""
+        started = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self(level, message, ms=(time.perf_counter() - started) * 1000, **fields)
+
+    def flush(self) -> None:
+        with self.lock:
+            pending, self.buffer = self.buffer, []
+        if not pending or self.dry_run:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        rotate(self.path)
+        with self.path.open("ab") as handle:
+            handle.write(b"".join(pending))
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self) -> "PipelineLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def iter_events(archives: bool = False) -> Iterator[dict[str, Any]]:
+    paths = sorted(LOG_DIR.glob(ARCHIVE_GLOB)) if archives else []
+    if LOG_FILE.exists():
+        paths.append(LOG_FILE)
+
+    for path in paths:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rb") as handle:
+            for line in handle:
+                try:
+                    event = loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    yield event
+
+
+def select_events(run: str | None, stage: str | None, level: str | None, archives: bool) -> list[dict[str, Any]]:
+    events = list(iter_events(archives))
+    if run == "latest":
+        run = events[-1].get("run") if events else None
+    return [
+        event
+        for event in events
+        if (run is None or event.get("run") == run)
+        and (stage is None or event.get("stage") == stage)
+        and (level is None or event.get("level") == level.upper())
+    ]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def stats_table(events: list[dict[str, Any]]) -> str:
+    stages: dict[str, list[dict[str, Any]]] = {}
+    for event in events:
+        stages.setdefault(str(event.get("stage", "?")), []).append(event)
+
+    rows = [("STAGE", "EVENTS", "ERRORS", "TIMED", "P50_MS", "P95_MS", "MAX_MS")]
+    for stage, items in sorted(stages.items()):
+        timings = [float(item["ms"]) for item in items if isinstance(item.get("ms"), (int, float))]
+        errors = sum(1 for item in items if item.get("level") == "ERROR")
+        figures = (
+            (f"{percentile(timings, 0.5):.1f}", f"{percentile(timings, 0.95):.1f}", f"{max(timings):.1f}")
+            if timings
+            else ("-", "-", "-")
+        )
+        rows.append((stage, str(len(items)), str(errors), str(len(timings)), *figures))
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Query and rotate logs/pipeline.jsonl")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("query", "print matching events as JSONL"), ("stats", "per-stage counts and latency percentiles")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--run", help="run id, or 'latest'")
+        command.add_argument("--archives", action="store_true", help="include rotated .jsonl.gz archives")
+        if name == "query":
+            command.add_argument("--stage")
+            command.add_argument("--level")
+
+    commands.add_parser("rotate", help="archive and compress the current log now")
+    args = parser.parse_args()
+
+    if args.command == "rotate":
+        archive = rotate(force=True)
+        print(f"ROTATED: {display_path(archive)}" if archive else "UNCHANGED: nothing to rotate")
+        return 0
+
+    if args.command == "query":
+        events = select_events(args.run, args.stage, args.level, args.archives)
+        sys.stdout.buffer.write(b"".join(encode_jsonl_line(event) for event in events))
+        return 0
+
+    events = select_events(args.run, None, None, args.archives)
+    if not events:
+        print("NO EVENTS")
+        return 1
+    print(stats_table(events))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env bash
+# Shell side of the pipeline log sink (scripts/pipeline_log.py).
+#
+# Usage (sourced, not executed):
+#   . "$ROOT_DIR/scripts/pipeline_log.sh" <stage>
+#   plog INFO "message"              event without a duration
+#   plog_mark build                  remember "now" under a name
+#   plog INFO "built" build          event with ms since the mark
+#   plog_flush                       append buffered events
+#   trap plog_flush EXIT             the caller registers (or chains) the flush;
+#                                    sourcing never replaces an existing EXIT trap
+#
+# Events are the same JSONL shape the Python stages write to
+# logs/pipeline.jsonl and share PIPELINE_RUN_ID with every child process.
+# On bash >= 5 timestamps come from EPOCHREALTIME and printf %()T, so
+# logging a line never forks; older shells (macOS bash 3.2) fall back to
+# date(1) with millisecond fields of zero. Events are buffered and appended
+# in one write. Everything here is safe under set -u.
+# Rotation is left to the Python writers, which check it on every flush.
+
+PLOG_STAGE="${1:-shell}"
+PLOG_FILE="${PLOG_FILE:-$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/logs/pipeline.jsonl}"
+PLOG_FLUSH_EVENTS=64
+PLOG_BUFFER=()
+
+if (( BASH_VERSINFO[0] >= 5 )); then
+  PLOG_FAST=1
+else
+  PLOG_FAST=0
+fi
+
+if [[ -z "${PIPELINE_RUN_ID:-}" ]]; then
+  if (( PLOG_FAST )); then
+    TZ=UTC0 printf -v PIPELINE_RUN_ID '%(%Y%m%dT%H%M%S)T-%x' -1 "$$"
+  else
+    printf -v PIPELINE_RUN_ID '%s-%x' "$(date -u +%Y%m%dT%H%M%S)" "$$"
+  fi
+fi
+export PIPELINE_RUN_ID
+
+# "<seconds>.<microseconds>" for now.
+plog_epoch() {
+  if (( PLOG_FAST )); then
+    REPLY="$EPOCHREALTIME"
+  else
+    REPLY="$(date +%s).000000"
+  fi
+}
+
+plog_now_us() {
+  plog_epoch
+  REPLY="${REPLY%.*}${REPLY#*.}"
+}
+
+plog_json() {
+  local value="$1"
+  value="${value//\\/\\\\}"
+  value="${value//\"/\\\"}"
+  value="${value//$'\n'/\\n}"
+  value="${value//$'\r'/\\r}"
+  value="${value//$'\t'/\\t}"
+  REPLY="\"$value\""
+}
+
+# Marks live in PLOG_MARK_<name> variables; associative arrays need bash 4.
+plog_mark() {
+  plog_now_us
+  printf -v "PLOG_MARK_${1//[^A-Za-z0-9_]/_}" '%s' "$REPLY"
+}
+
+plog() {
+  local level="$1" message="$2" mark="${3:-}"
+  local now ts ms="" msg started=""
+
+  plog_epoch
+  now="$REPLY"
+  if (( PLOG_FAST )); then
+    TZ=UTC0 printf -v ts '%(%Y-%m-%dT%H:%M:%S)T' "${now%.*}"
+  else
+    ts="$(date -u +%Y-%m-%dT%H:%M:%S)"
+  fi
+  ts+=".${now:${#now}-6:3}+00:00"
+
+  if [[ -n "$mark" ]]; then
+    local name="PLOG_MARK_${mark//[^A-Za-z0-9_]/_}"
+    started="${!name:-}"
+  fi
+  if [[ -n "$started" ]]; then
+    local elapsed=$(( ${now%.*}${now#*.} - started ))
+    printf -v ms ',"ms":%d.%03d' $(( elapsed / 1000 )) $(( elapsed % 1000 ))
+  fi
+
+  plog_json "$message"
+  msg="$REPLY"
+  plog_json "$level"
+
+  # Keys in sorted order, matching encode_jsonl_line on the Python side.
+  PLOG_BUFFER+=("{\"level\":$REPLY${ms},\"msg\":$msg,\"run\":\"$PIPELINE_RUN_ID\",\"stage\":\"$PLOG_STAGE\",\"ts\":\"$ts\"}")
+
+  if (( ${#PLOG_BUFFER[@]} >= PLOG_FLUSH_EVENTS )); then
+    plog_flush
+  fi
+}
+
+plog_flush() {
+  (( ${#PLOG_BUFFER[@]} )) || return 0
+  mkdir -p "${PLOG_FILE%/*}" 2>/dev/null
+  printf '%s\n' "${PLOG_BUFFER[@]}" >> "$PLOG_FILE"
+  PLOG_BUFFER=()
+}
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Local tracing spans across the surface pipeline, exported as Chrome traces.
+
+Enable with PIPELINE_TRACE=1 (inherited by child processes, like PIPELINE_RUN_ID).
+
+Writes:
+  - tmp/trace/<run>/<stage>-<pid>.json   one Chrome trace fragment per traced process
+  - tmp/trace/<run>.json                 merged run timeline (merge command); open in
+                                         chrome://tracing, ui.perfetto.dev or speedscope
+
+Used by:
+  - scripts/github_client.py             github.request (path, http_status, bytes, reconnected)
+  - scripts/collect_repo_metrics.py      collect_repo (repo, status)
+  - scripts/collect_workflow_runs.py     collect_with_api (repo, http_status, runs)
+  - scripts/build_readme.py              build and its render/write phases (bytes)
+  - scripts/generate_project_cards.py    card (cache hit/miss), svg_card (bytes)
+  - scripts/validate_surfaces.py         validate_files, validate_file (cache, bytes)
+
+Commands:
+  - merge [--run ID|latest]              fragments + timed logs/pipeline.jsonl events
+                                         of the run -> tmp/trace/<run>.json
+  - top [--run ID|latest] [--limit N]    slowest spans by self time (critical path hints)
+
+Rules:
+  - span() is a bare yield when tracing is off; nothing is recorded or written
+  - spans are complete ("X") events with wall-clock microsecond timestamps, so
+    fragments from different processes line up on one timeline; nesting
+    follows timing per thread, so thread-pool workers get their own lanes
+  - the yielded dict carries attributes; fields set inside the block
+    (http_status, bytes, cache, ...) land in the event's "args"
+  - fragments are written at process exit; the stage name is the script stem
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import datetime as dt
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from pipeline_log import iter_events, run_id
+from surface_io import display_path, dumps_json, load_json, write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+TRACE_DIR = ROOT / "tmp" / "trace"
+TRACE_ENV = "PIPELINE_TRACE"
+# Pseudo process ids for log-derived lanes, clear of real pids.
+LOG_PID_BASE = 10_000_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def now_us() -> int:
+    return time.time_ns() // 1000
+
+
+class Tracer:
+    """Collects complete events for one process; exported once at exit."""
+
+    __slots__ = ("enabled", "stage", "events", "lock", "tids", "registered")
+
+    def __init__(self) -> None:
+        self.enabled = os.environ.get(TRACE_ENV, "") not in ("", "0")
+        self.stage = Path(sys.argv[0]).stem or "python"
+        self.events: list[dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.tids: dict[int, int] = {}
+        self.registered = False
+
+    def tid(self) -> int:
+        ident = threading.get_ident()
+        with self.lock:
+            if ident not in self.tids:
+                self.tids[ident] = len(self.tids) + 1
+                self.events.append(
+                    {
+                        "ph": "M",
+                        "name": "thread_name",
+                        "pid": os.getpid(),
+                        "tid": self.tids[ident],
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+            return self.tids[ident]
+
+    @contextmanager
+    def span(self, name: str, cat: str = "pipeline", **attrs: Any) -> Iterator[dict[str, Any]]:
+        if not self.enabled:
+            yield attrs
+            return
+
+        if not self.registered:
+            self.registered = True
+            atexit.register(self.export)
+
+        tid = self.tid()
+        started = now_us()
+        try:
+            yield attrs
+        except BaseException as exc:
+            attrs.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            event = {
+                "ph": "X",
+                "name": name,
+                "cat": cat,
+                "ts": started,
+                "dur": max(1, now_us() - started),
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {key: value for key, value in attrs.items() if value is not None},
+            }
+            with self.lock:
+                self.events.append(event)
+
+    def traced(self, name: str | None = None, cat: str = "pipeline") -> Callable[[F], F]:
+        """Decorator form of span() for functions without interesting attributes."""
+
+        def decorate(function: F) -> F:
+            label = name or function.__name__
+
+            @wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.span(label, cat):
+                    return function(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorate
+
+    def export(self) -> Path | None:
+        with self.lock:
+            events, self.events = self.events, []
+        if not any(event["ph"] == "X" for event in events):
+            return None
+
+        pid = os.getpid()
+        events.insert(0, {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": self.stage}})
+        path = TRACE_DIR / run_id() / f"{self.stage}-{pid}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Quiet write: fragments land at exit, after the stage's own stdout.
+        path.write_text(dumps_json({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        return path
+
+
+TRACER = Tracer()
+span = TRACER.span
+traced = TRACER.traced
+
+
+def resolve_run(run: str | None) -> str | None:
+    if run and run != "latest":
+        return run
+    runs = [path for path in TRACE_DIR.glob("*") if path.is_dir()]
+    return max(runs, key=lambda path: path.stat().st_mtime).name if runs else None
+
+
+def log_events(run: str) -> list[dict[str, Any]]:
+    """Timed pipeline log events of ``run`` (shell stages included) as complete events."""
+    events: list[dict[str, Any]] = []
+    lanes: dict[str, int] = {}
+    for record in iter_events():
+        if record.get("run") != run or not isinstance(record.get("ms"), (int, float)):
+            continue
+        stage = str(record.get("stage", "log"))
+        if stage not in lanes:
+            lanes[stage] = len(lanes) + 1
+            events.append({"ph": "M", "name": "process_name", "pid": LOG_PID_BASE + lanes[stage], "tid": 0, "args": {"name": f"log:{stage}"}})
+        try:
+            ended = int(dt.datetime.fromisoformat(record["ts"]).timestamp() * 1_000_000)
+        except (KeyError, TypeError, ValueError):
+            continue
+        duration = int(record["ms"] * 1000)
+        events.append(
+            {
+                "ph": "X",
+                "name": str(record.get("msg", "")),
+                "cat": "log",
+                "ts": ended - duration,
+                "dur": max(1, duration),
+                "pid": LOG_PID_BASE + lanes[stage],
+                "tid": 1,
+                "args": {"level": record.get("level")},
+            }
+        )
+    return events
+
+
+def collect(run: str) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for fragment in sorted((TRACE_DIR / run).glob("*.json")):
+        payload = load_json(fragment, {}, strict=False)
+        if isinstance(payload, dict):
+            events.extend(payload.get("traceEvents", []))
+    events.extend(log_events(run))
+    events.sort(key=lambda event: (event["ph"] != "M", event.get("ts", 0)))
+    return events
+
+
+def merge(run: str) -> Path:
+    path = TRACE_DIR / f"{run}.json"
+    write_json(path, {"traceEvents": collect(run), "displayTimeUnit": "ms", "otherData": {"run": run}})
+    return path
+
+
+def self_times(events: list[dict[str, Any]]) -> list[tuple[float, float, dict[str, Any]]]:
+    """(self ms, total ms, event) per span; children are spans nested in time on the same lane."""
+    lanes: dict[tuple[Any, Any], list[dict[str, Any]]] = {}
+    for event in events:
+        if event.get("ph") == "X":
+            lanes.setdefault((event["pid"], event["tid"]), []).append(event)
+
+    rows: list[tuple[float, float, dict[str, Any]]] = []
+    for lane in lanes.values():
+        lane.sort(key=lambda event: (event["ts"], -event["dur"]))
+        # Stack of [event, child time]; a span closes once the next one starts after its end.
+        stack: list[list[Any]] = []
+
+        def close_until(ts: float) -> None:
+            while stack and ts >= stack[-1][0]["ts"] + stack[-1][0]["dur"]:
+                done, child = stack.pop()
+                rows.append(((done["dur"] - child) / 1000, done["dur"] / 1000, done))
+
+        for event in lane:
+            close_until(event["ts"])
+            if stack:
+                stack[-1][1] += event["dur"]
+            stack.append([event, 0])
+        close_until(float("inf"))
+    return sorted(rows, key=lambda row: row[0], reverse=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=f"Merge and inspect pipeline traces ({TRACE_ENV}=1)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("merge", "merge a run into one Chrome trace"), ("top", "slowest spans by self time")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--run", default="latest", help="run id, or 'latest'")
+        if name == "top":
+            command.add_argument("--limit", type=int, default=15)
+    args = parser.parse_args()
+
+    run = resolve_run(args.run)
+    if run is None or not (TRACE_DIR / run).is_dir():
+        print(f"NO TRACE: run {args.run} (set {TRACE_ENV}=1)")
+        return 1
+
+    if args.command == "merge":
+        path = merge(run)
+        print(f"TRACE: {display_path(path)}")
+        return 0
+
+    events = collect(run)
+    processes = {event["pid"]: event["args"]["name"] for event in events if event.get("name") == "process_name"}
+    for self_ms, total_ms, event in self_times(events)[: max(1, args.limit)]:
+        attrs = " ".join(f"{key}={value}" for key, value in sorted(event.get("args", {}).items()))
+        print(f"{self_ms:9.1f}ms self {total_ms:9.1f}ms total  {processes.get(event['pid'], event['pid'])}: {event['name']}  {attrs}".rstrip())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,9 @@ fi
 
 mkdir -p "$ROOT_DIR/dist"
 
+. "$ROOT_DIR/scripts/pipeline_log.sh" quantum_build
+trap plog_flush EXIT
+
 : > "$LOG_FILE"
 
 ERRORS=0
@@ -37,6 +40,8 @@ pass() {
 
   log "[PASS] $1"
 
+  plog INFO "$1"
+
 }
 
 warn() {
@@ -45,6 +50,8 @@ warn() {
 
   log "[WARN] $1"
 
+  plog WARN "$1"
+
 }
 
 fail() {
@@ -53,6 +60,8 @@ fail() {
 
   log "[FAIL] $1"
 
+  plog ERROR "$1"
+
 }
 
 section() {
@@ -67,10 +76,12 @@ section() {
 
 limited() {
 
-  local seconds="$1"
+  local seconds="$1" status
 
   shift
 
+  plog_mark limited
+
   if command -v timeout >/dev/null 2>&1; then
 
     timeout "$seconds" "$@"
@@ -81,6 +92,12 @@ limited() {
 
   fi
 
+  status=$?
+
+  plog INFO "exit $status: $*" limited
+
+  return "$status"
+
 }
 
 check_python() {
@@ -135,53 +152,47 @@ check_bash() {
 
 }
 
-check_json() {
+check_surfaces() {
 
-  local file="$1"
+  local kind="$1"
 
-  if [[ ! -f "$file" ]]; then
+  shift
 
-    warn "Missing optional JSON: $file"
+  local status file detail
 
-    return 0
+  : > /tmp/popdeuxrem-qb.out
 
-  fi
+  limited "$COMMAND_TIMEOUT" python3 scripts/validate_surfaces.py --paths "$@" >/tmp/popdeuxrem-qb.out 2>/tmp/popdeuxrem-qb.err
 
-  if limited "$COMMAND_TIMEOUT" python3 -m json.tool "$file" >/dev/null 2>/tmp/popdeuxrem-qb.err; then
+  if [[ ! -s /tmp/popdeuxrem-qb.out ]]; then
 
-    pass "Valid JSON: $file"
-
-  else
-
-    fail "Invalid JSON: $file"
+    fail "Surface validator failed: $kind"
 
     cat /tmp/popdeuxrem-qb.err >> "$LOG_FILE"
 
-  fi
-
-}
+    return 0
 
-check_svg() {
+  fi
 
-  local file="$1"
+  while read -r status file detail; do
 
-  if [[ ! -f "$file" ]]; then
+    case "$status:$kind" in
 
-    fail "Missing SVG: $file"
+      PASS::JSON) pass "Valid JSON: $file" ;;
 
-    return 0
+      PASS::SVG) pass "SVG root: $file" ;;
 
-  fi
+      FAIL::JSON) fail "Invalid JSON: $file"; log "        $detail" ;;
 
-  if grep -q '<svg' "$file"; then
+      FAIL::SVG) fail "Invalid SVG: $file"; log "        $detail" ;;
 
-    pass "SVG root: $file"
+      SKIP::JSON) warn "Missing optional JSON: $file" ;;
 
-  else
+      SKIP::SVG) fail "Missing SVG: $file" ;;
 
-    fail "Invalid SVG: $file"
+    esac
 
-  fi
+  done < /tmp/popdeuxrem-qb.out
 
 }
 
@@ -215,20 +226,56 @@ section "VALIDATING SCRIPTS"
 
 PYTHON_FILES=(
 
+  "scripts/artifact_store.py"
+
   "scripts/build_readme.py"
 
+  "scripts/change_preflight.py"
+
   "scripts/collect_repo_metrics.py"
 
+  "scripts/dispatch_workflows.py"
+
   "scripts/generate_project_cards.py"
 
   "scripts/generate_workflow_status.py"
 
+  "scripts/github_client.py"
+
+  "scripts/health_probe.py"
+
+  "scripts/host_sampler.py"
+
+  "scripts/minify_surface.py"
+
+  "scripts/pipeline_log.py"
+
+  "scripts/pipeline_trace.py"
+
+  "scripts/registry_index.py"
+
+  "scripts/render_profile.py"
+
+  "scripts/repo_aggregate.py"
+
+  "scripts/repo_record.py"
+
+  "scripts/surface_io.py"
+
+  "scripts/sync_orchestrator.py"
+
+  "scripts/validate_surfaces.py"
+
+  "scripts/webhook_receiver.py"
+
 )
 
 BASH_FILES=(
 
   "scripts/quantum_build.sh"
 
+  "scripts/pipeline_log.sh"
+
   "scripts/update_readme.sh"
 
   "scripts/rollback_surface.sh"
@@ -277,15 +324,13 @@ JSON_FILES=(
 
   "assets/projects/index.json"
 
+  "assets/projects/index/head.json"
+
   "dist/build-manifest.json"
 
 )
 
-for file in "${JSON_FILES[@]}"; do
-
-  check_json "$file"
-
-done
+check_surfaces JSON "${JSON_FILES[@]}"
 
 section "VALIDATING README TEMPLATE"
 
@@ -325,28 +370,18 @@ SVG_FILES=(
 
 )
 
-for file in "${SVG_FILES[@]}"; do
-
-  check_svg "$file"
-
-done
-
 if [[ -d assets/projects ]]; then
 
   shopt -s nullglob
 
-  PROJECT_SVGS=(assets/projects/*.svg)
+  SVG_FILES+=(assets/projects/*.svg)
 
   shopt -u nullglob
 
-  for file in "${PROJECT_SVGS[@]}"; do
-
-    check_svg "$file"
-
-  done
-
 fi
 
+check_surfaces SVG "${SVG_FILES[@]}"
+
 section "GENERATOR CHECK"
 
 if [[ "$MODE" == "--check" ]]; then
@@ -367,6 +402,10 @@ if [[ "$MODE" == "--check" ]]; then
 
 else
 
+  python3 scripts/host_sampler.py --watch --duration "$COMMAND_TIMEOUT" >/dev/null 2>&1 &
+
+  SAMPLER_PID=$!
+
   if limited "$COMMAND_TIMEOUT" bash systems/scripts/system_health.sh >/dev/null 2>/tmp/popdeuxrem-health.err; then
 
     pass "System health generated"
@@ -403,6 +442,20 @@ else
 
   fi
 
+  kill "$SAMPLER_PID" 2>/dev/null
+
+  wait "$SAMPLER_PID" 2>/dev/null
+
+  if python3 scripts/host_sampler.py --summary >/dev/null 2>&1; then
+
+    pass "Host samples recorded"
+
+  else
+
+    warn "Host sampler unavailable; system matrix uses seeded values"
+
+  fi
+
   if limited "$COMMAND_TIMEOUT" python3 scripts/build_readme.py >/tmp/popdeuxrem-generator.out 2>/tmp/popdeuxrem-generator.err; then
 
     cat /tmp/popdeuxrem-generator.out
@@ -453,6 +506,14 @@ done
 
 section "BUILD SUMMARY"
 
+if [[ "${PIPELINE_TRACE:-0}" != "0" ]]; then
+
+  plog_flush
+
+  python3 scripts/pipeline_trace.py merge --run "$PIPELINE_RUN_ID" | sed 's/^/[TRACE] /'
+
+fi
+
 log "Mode: $MODE"
 
 log "Errors: $ERRORS"
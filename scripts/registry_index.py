@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Compiled repository registry shared by collectors, orchestrator and renderers.
+
+Reads:
+  - identity/repos.json              "repositories" / "repos" / list + "sync_settings"
+  - data/projects.json               canonical project list (list or {"projects": [...]})
+
+Writes:
+  - dist/registry-index.json         merged entries, lookup maps, source hashes, fingerprint
+
+Used by:
+  - scripts/collect_repo_metrics.py
+  - scripts/sync_orchestrator.py / scripts/dispatch_workflows.py
+  - scripts/fetch_github_telemetry.py
+  - scripts/build_readme.py / scripts/generate_pages_surface.py
+
+Rules:
+  - one registry entry per repository, keyed by lower-case owner/name
+    (full_name, repo, slug or name, as collect_repo_metrics always accepted)
+  - one project entry per project, keyed by its lower-case id; several
+    projects may share a repository
+  - by_full_name maps lower-case owner/name to every entry position for that
+    repository (registry entry first); by_name / by_id map to one position,
+    so every lookup is a dict hit on an index loaded in one read
+  - the index is rebuilt only when a source's sha256 changes; source stat
+    (size, mtime) is checked first so unchanged sources are not re-hashed
+  - invalid entries are skipped and listed under "warnings"; invalid source
+    JSON stops the build
+  - load_index(write=False) compiles in memory (dry-run / --check friendly)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+from pathlib import Path
+from typing import Any, Iterator
+
+from repo_record import DEFAULT_OWNER, safe_int
+from surface_io import display_path, dumps_json, encode_jsonl_line, load_json, write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+INDEX_JSON = ROOT / "dist" / "registry-index.json"
+REGISTRY_SOURCE = "identity/repos.json"
+PROJECTS_SOURCE = "data/projects.json"
+SOURCES = (REGISTRY_SOURCE, PROJECTS_SOURCE)
+
+# Bump whenever the compiled entry shape changes.
+INDEX_VERSION = "2"
+GITHUB_PREFIXES = ("https://github.com/", "http://github.com/", "github.com/")
+
+DEFAULT_SYNC_SETTINGS = {
+    "interval_minutes": 60,
+    "retry_attempts": 3,
+    "retry_delay_seconds": 5,
+    "timeout_seconds": 60,
+}
+
+
+def source_stat(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {"sha256": None, "size": 0, "mtime_ns": 0}
+
+    stat = path.stat()
+    return {
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def fingerprint(sources: dict[str, dict[str, Any]]) -> str:
+    hashes = {rel: state["sha256"] for rel, state in sorted(sources.items())}
+    return hashlib.sha256(encode_jsonl_line({"version": INDEX_VERSION, "sources": hashes})).hexdigest()
+
+
+def split_full_name(value: str, default_owner: str = DEFAULT_OWNER) -> tuple[str, str] | None:
+    value = value.strip()
+    for prefix in GITHUB_PREFIXES:
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+            break
+    value = value.strip("/")
+
+    if "/" in value:
+        owner, name = (part.strip() for part in value.split("/", 1))
+    else:
+        owner, name = default_owner, value
+
+    if not owner or not name or name == "unknown":
+        return None
+    return owner, name
+
+
+def registry_items(raw: Any) -> list[Any]:
+    if isinstance(raw, dict):
+        raw = raw.get("repos") or raw.get("repositories") or []
+    return raw if isinstance(raw, list) else []
+
+
+def project_items(raw: Any) -> list[Any]:
+    if isinstance(raw, dict):
+        raw = raw.get("projects") or []
+    return raw if isinstance(raw, list) else []
+
+
+def sync_settings(raw: Any) -> dict[str, int]:
+    settings = dict(DEFAULT_SYNC_SETTINGS)
+    values = raw.get("sync_settings") if isinstance(raw, dict) else None
+    if isinstance(values, dict):
+        for key, default in DEFAULT_SYNC_SETTINGS.items():
+            settings[key] = max(0, safe_int(values.get(key, default)))
+    settings["retry_attempts"] = max(1, settings["retry_attempts"])
+    return settings
+
+
+def repository_fields(full_name: str) -> dict[str, str] | None:
+    parsed = split_full_name(full_name)
+    if parsed is None:
+        return None
+    owner, name = parsed
+    return {"full_name": f"{owner}/{name}", "owner": owner, "name": name}
+
+
+def compile_index(sources: dict[str, dict[str, Any]] | None = None) -> dict[str, Any]:
+    """Validate every source into the index payload."""
+    sources = sources or {rel: source_stat(ROOT / rel) for rel in SOURCES}
+    registry_raw = load_json(ROOT / REGISTRY_SOURCE, [])
+    projects_raw = load_json(ROOT / PROJECTS_SOURCE, [])
+
+    registry: dict[str, dict[str, Any]] = {}
+    projects: dict[str, dict[str, Any]] = {}
+    warnings: list[str] = []
+
+    for position, item in enumerate(registry_items(registry_raw)):
+        if isinstance(item, str):
+            item = {"name": item}
+        if not isinstance(item, dict):
+            warnings.append(f"{REGISTRY_SOURCE}[{position}]: not an object")
+            continue
+
+        raw_name = str(item.get("full_name") or item.get("repo") or item.get("slug") or item.get("name") or "")
+        parsed = split_full_name(raw_name, str(item.get("owner") or DEFAULT_OWNER))
+        if parsed is None:
+            warnings.append(f"{REGISTRY_SOURCE}[{position}]: missing owner/name")
+            continue
+
+        owner, name = parsed
+        key = f"{owner}/{name}".lower()
+        if key in registry:
+            warnings.append(f"{REGISTRY_SOURCE}[{position}]: duplicate {registry[key]['full_name']}")
+            continue
+
+        registry[key] = {
+            "key": key,
+            "full_name": f"{owner}/{name}",
+            "owner": owner,
+            "name": name,
+            "enabled": item.get("enabled") is True,
+            "sources": [REGISTRY_SOURCE],
+            "registry": item,
+        }
+
+    for position, item in enumerate(project_items(projects_raw)):
+        if not isinstance(item, dict):
+            warnings.append(f"{PROJECTS_SOURCE}[{position}]: not an object")
+            continue
+
+        repository = repository_fields(str(item.get("repo") or item.get("id") or item.get("name") or ""))
+        project_id = str(item.get("id") or item.get("name") or (repository or {}).get("full_name") or "").strip()
+        if not project_id or repository is None:
+            warnings.append(f"{PROJECTS_SOURCE}[{position}]: missing repo/id")
+            continue
+
+        key = project_id.lower()
+        if key in projects:
+            warnings.append(f"{PROJECTS_SOURCE}[{position}]: duplicate id {project_id}")
+            continue
+
+        projects[key] = {"key": key, **repository, "enabled": False, "sources": [PROJECTS_SOURCE], "project": item}
+
+    ordered = [registry[key] for key in sorted(registry)] + list(projects.values())
+
+    by_full_name: dict[str, list[int]] = {}
+    by_name: dict[str, int] = {}
+    by_id: dict[str, int] = {}
+    for position, entry in enumerate(ordered):
+        by_full_name.setdefault(entry["full_name"].lower(), []).append(position)
+        by_name.setdefault(entry["name"].lower(), position)
+        project = entry.get("project")
+        if project is None:
+            continue
+        by_id[entry["key"]] = position
+        if project.get("name"):
+            by_name.setdefault(str(project["name"]).lower(), position)
+
+    return {
+        "version": INDEX_VERSION,
+        "fingerprint": fingerprint(sources),
+        "sources": sources,
+        "sync_settings": sync_settings(registry_raw),
+        "entries": ordered,
+        "projects": list(range(len(registry), len(ordered))),
+        "by_full_name": by_full_name,
+        "by_name": by_name,
+        "by_id": by_id,
+        "warnings": warnings,
+    }
+
+
+def current_sources(previous: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Source states, re-hashing only files whose size or mtime moved."""
+    states: dict[str, dict[str, Any]] = {}
+    for rel in SOURCES:
+        path = ROOT / rel
+        known = previous.get(rel) if isinstance(previous, dict) else None
+        if isinstance(known, dict) and path.exists():
+            stat = path.stat()
+            if known.get("size") == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns:
+                states[rel] = known
+                continue
+        states[rel] = source_stat(path)
+    return states
+
+
+class RegistryIndex:
+    __slots__ = ("fingerprint", "entries", "project_positions", "settings", "by_full_name", "by_name", "by_id", "warnings")
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.fingerprint: str = payload["fingerprint"]
+        self.entries: list[dict[str, Any]] = payload["entries"]
+        self.project_positions: list[int] = payload["projects"]
+        self.settings: dict[str, int] = payload["sync_settings"]
+        self.by_full_name: dict[str, list[int]] = payload["by_full_name"]
+        self.by_name: dict[str, int] = payload["by_name"]
+        self.by_id: dict[str, int] = payload["by_id"]
+        self.warnings: list[str] = payload["warnings"]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look an entry up by owner/name, project id or name (case-insensitive)."""
+        key = key.strip().lower()
+        positions = self.by_full_name.get(key)
+        if positions:
+            return self.entries[positions[0]]
+        for table in (self.by_id, self.by_name):
+            position = table.get(key)
+            if position is not None:
+                return self.entries[position]
+        return None
+
+    def repository(self, key: str) -> dict[str, Any] | None:
+        """The identity/repos.json entry behind an owner/name, project id or name."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        first = self.entries[self.by_full_name[entry["full_name"].lower()][0]]
+        return first if REGISTRY_SOURCE in first["sources"] else None
+
+    def registry(self, enabled_only: bool = False) -> Iterator[dict[str, Any]]:
+        """identity/repos.json entries in key order."""
+        for entry in self.entries:
+            if REGISTRY_SOURCE in entry["sources"] and (entry["enabled"] or not enabled_only):
+                yield entry
+
+    def projects(self) -> list[dict[str, Any]]:
+        """data/projects.json records in their original file order."""
+        return [self.entries[position]["project"] for position in self.project_positions]
+
+
+def load_index(write: bool = True, rebuild: bool = False) -> RegistryIndex:
+    """Load the compiled index, recompiling when any source hash changed."""
+    cached = load_json(INDEX_JSON, None, strict=False)
+    previous = cached if isinstance(cached, dict) and cached.get("version") == INDEX_VERSION else {}
+
+    sources = current_sources(previous.get("sources", {}))
+    if not rebuild and previous and previous.get("fingerprint") == fingerprint(sources):
+        if previous.get("sources") != sources and write:
+            previous["sources"] = sources
+            write_json(INDEX_JSON, previous, skip_unchanged=True)
+        return RegistryIndex(previous)
+
+    payload = compile_index(sources)
+    if write:
+        write_json(INDEX_JSON, payload)
+    return RegistryIndex(payload)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild", action="store_true", help="recompile even when no source hash changed")
+    parser.add_argument("--dry-run", action="store_true", help="compile in memory without writing the index")
+    parser.add_argument("--lookup", metavar="KEY", help="print the entry for an owner/name, project id or name")
+    args = parser.parse_args()
+
+    index = load_index(write=not args.dry_run, rebuild=args.rebuild)
+
+    for warning in index.warnings:
+        print(f"WARN: {warning}")
+
+    if args.lookup:
+        entry = index.get(args.lookup)
+        if entry is None:
+            print(f"NOT FOUND: {args.lookup}")
+            return 1
+        print(dumps_json(entry), end="")
+
+    registry = sum(1 for _ in index.registry())
+    print(
+        f"SUMMARY: entries={len(index.entries)} registry={registry} projects={len(index.project_positions)} "
+        f"fingerprint={index.fingerprint[:16]} index={display_path(INDEX_JSON)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
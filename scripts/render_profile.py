@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+SVG render profiles shared by the panel and card generators.
+
+Used by:
+  - scripts/build_readme.py
+  - scripts/generate_project_cards.py
+  - scripts/generate_workflow_status.py
+
+Profiles:
+  - full  feGaussianBlur glow filters (original output, byte-identical)
+  - lite  no <filter> elements; each glow is pre-baked as a wider, low-opacity
+          layer drawn under the element, which browsers composite without
+          per-frame rasterization
+
+Rules:
+  - --profile on each script, else SURFACE_RENDER_PROFILE, else full
+  - helpers return full-profile markup unchanged
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+RENDER_PROFILES = ("full", "lite")
+DEFAULT_PROFILE = "full"
+PROFILE_ENV = "SURFACE_RENDER_PROFILE"
+
+HALO_OPACITY = "0.22"
+HALO_SPREAD = 3
+
+
+def default_profile() -> str:
+    profile = os.environ.get(PROFILE_ENV, DEFAULT_PROFILE).strip().lower()
+    return profile if profile in RENDER_PROFILES else DEFAULT_PROFILE
+
+
+def add_profile_argument(parser: Any) -> None:
+    parser.add_argument(
+        "--profile",
+        choices=RENDER_PROFILES,
+        default=default_profile(),
+        help=f"SVG render profile: full glow filters or filter-free lite (default from {PROFILE_ENV})",
+    )
+
+
+def filter_defs(profile: str, markup: str) -> str:
+    """A <filter> definition block, dropped entirely in the lite profile."""
+    return markup if profile == "full" else ""
+
+
+def glow_circle(profile: str, cx: Any, cy: Any, r: int, fill: str, filter_id: str = "glow") -> str:
+    if profile == "full":
+        return f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{fill}" filter="url(#{filter_id})"/>'
+
+    return (
+        f'<circle cx="{cx}" cy="{cy}" r="{r + HALO_SPREAD}" fill="{fill}" opacity="{HALO_OPACITY}"/>'
+        f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{fill}"/>'
+    )
+
+
+def glow_rect(
+    profile: str,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    rx: int,
+    fill: str,
+    opacity: str,
+    filter_id: str = "glow",
+) -> str:
+    if profile == "full":
+        return (
+            f'<rect x="{x}" y="{y}" width="{width}" height="{height}" rx="{rx}" '
+            f'fill="{fill}" opacity="{opacity}" filter="url(#{filter_id})"/>'
+        )
+
+    spread = HALO_SPREAD - 1
+    return (
+        f'<rect x="{x - spread}" y="{y - spread}" width="{width + 2 * spread}" height="{height + 2 * spread}" '
+        f'rx="{rx + spread}" fill="{fill}" opacity="{HALO_OPACITY}"/>'
+        f'<rect x="{x}" y="{y}" width="{width}" height="{height}" rx="{rx}" fill="{fill}" opacity="{opacity}"/>'
+    )
+
+
+def glow_path(profile: str, d: str, stroke: str, stroke_width: int, filter_id: str = "glow") -> str:
+    if profile == "full":
+        return f'<path d="{d}" fill="none" stroke="{stroke}" stroke-width="{stroke_width}" filter="url(#{filter_id})"/>'
+
+    return (
+        f'<path d="{d}" fill="none" stroke="{stroke}" stroke-width="{stroke_width + 2 * HALO_SPREAD}" '
+        f'stroke-linecap="round" opacity="{HALO_OPACITY}"/>'
+        f'<path d="{d}" fill="none" stroke="{stroke}" stroke-width="{stroke_width}"/>'
+    )
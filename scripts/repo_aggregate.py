@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Streaming repository aggregation.
+
+Shared by:
+  - scripts/collect_repo_metrics.py
+  - scripts/generate_project_cards.py
+  - scripts/build_readme.py
+
+Rules:
+  - single pass over repository records
+  - bounded top-k heap, O(k) extra memory
+  - accepts any iterable of RepoRecord, including generators
+  - deterministic ordering: RepoRecord.sort_key()
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Iterable, Iterator
+
+from repo_record import RepoRecord
+
+DEFAULT_TOP_LIMIT = 8
+
+
+class _Ranked:
+    """Heap entry ordered worst-first so heap[0] is the eviction candidate."""
+
+    __slots__ = ("key", "seq", "item")
+
+    def __init__(self, key: tuple[int, str], seq: int, item: Any) -> None:
+        self.key = key
+        self.seq = seq
+        self.item = item
+
+    def __lt__(self, other: "_Ranked") -> bool:
+        return (self.key, self.seq) > (other.key, other.seq)
+
+
+class TopK:
+    """Bounded heap keeping the ``limit`` best repos by ``RepoRecord.sort_key``.
+
+    ``item`` is what items() returns for a kept repo; it defaults to the record.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(0, limit)
+        self._heap: list[_Ranked] = []
+        self._seq = 0
+
+    def push(self, repo: RepoRecord, item: Any = None) -> None:
+        if self.limit == 0:
+            return
+
+        entry = _Ranked(repo.sort_key(), self._seq, repo if item is None else item)
+        self._seq += 1
+
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> list[Any]:
+        ranked = sorted(self._heap, key=lambda entry: (entry.key, entry.seq))
+        return [entry.item for entry in ranked]
+
+
+def top_repos(records: Iterable[RepoRecord], limit: int) -> list[RepoRecord]:
+    top = TopK(limit)
+    for repo in records:
+        top.push(repo)
+    return top.items()
+
+
+class RepoAggregator:
+    """Single-pass counters plus top-k over tracked repositories."""
+
+    def __init__(self, top_limit: int = DEFAULT_TOP_LIMIT) -> None:
+        self.repo_count = 0
+        self.tracked_count = 0
+        self.total_stars = 0
+        self.total_forks = 0
+        self.total_open_issues = 0
+        self.languages: dict[str, int] = {}
+        self._top = TopK(top_limit)
+
+    def add(self, repo: RepoRecord) -> None:
+        self.repo_count += 1
+
+        if repo.status != "tracked":
+            return
+
+        self.tracked_count += 1
+        self.total_stars += repo.stars
+        self.total_forks += repo.forks
+        self.total_open_issues += repo.open_issues
+
+        language = repo.language or "Unknown"
+        self.languages[language] = self.languages.get(language, 0) + 1
+
+        self._top.push(repo)
+
+    def consume(self, records: Iterable[RepoRecord]) -> "RepoAggregator":
+        for repo in records:
+            self.add(repo)
+        return self
+
+    def passthrough(self, records: Iterable[RepoRecord]) -> Iterator[RepoRecord]:
+        """Aggregate while yielding records, so a stream can be written and counted at once."""
+        for repo in records:
+            self.add(repo)
+            yield repo
+
+    @property
+    def unavailable_count(self) -> int:
+        return self.repo_count - self.tracked_count
+
+    def top(self) -> list[RepoRecord]:
+        return self._top.items()
+
+    def sorted_languages(self) -> dict[str, int]:
+        return dict(sorted(self.languages.items(), key=lambda item: item[0].lower()))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compact repository record shared by collectors and renderers.
+
+Used by:
+  - scripts/collect_repo_metrics.py
+  - scripts/generate_project_cards.py
+  - scripts/build_readme.py
+
+Rules:
+  - normalize once at load time; github.com URLs reduce to owner/name
+  - __slots__ only, no per-record dict
+  - to_json() emits the metrics/metrics.json repository shape
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+DEFAULT_OWNER = "popdeuxrem"
+GITHUB_PREFIXES = ("https://github.com/", "http://github.com/", "github.com/")
+
+
+def safe_int(value: Any) -> int:
+    try:
+        return int(value)
+    except Exception:
+        return 0
+
+
+def _first(item: dict[str, Any], *keys: str) -> Any:
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
+class RepoRecord:
+    __slots__ = (
+        "full_name",
+        "owner",
+        "name",
+        "html_url",
+        "status",
+        "description",
+        "language",
+        "stars",
+        "forks",
+        "watchers",
+        "open_issues",
+        "default_branch",
+        "archived",
+        "disabled",
+        "private",
+        "pushed_at",
+        "updated_at",
+        "collected_at",
+        "error",
+    )
+
+    def __init__(self, owner: str, name: str, full_name: str | None = None) -> None:
+        self.owner = owner
+        self.name = name
+        self.full_name = full_name or f"{owner}/{name}"
+        self.html_url = f"https://github.com/{self.full_name}"
+        self.status: str | None = None
+        self.description: str | None = None
+        self.language: str | None = None
+        self.stars = 0
+        self.forks = 0
+        self.watchers = 0
+        self.open_issues = 0
+        self.default_branch: str | None = None
+        self.archived = False
+        self.disabled = False
+        self.private = False
+        self.pushed_at: str | None = None
+        self.updated_at: str | None = None
+        self.collected_at: str | None = None
+        self.error: str | None = None
+
+    @classmethod
+    def from_json(cls, item: Any, default_owner: str = DEFAULT_OWNER) -> "RepoRecord | None":
+        """Build a record from a registry string, registry entry, metrics record or card."""
+        if isinstance(item, str):
+            full_name = item.strip()
+            item = {}
+        elif isinstance(item, dict):
+            full_name = str(_first(item, "full_name", "repo", "slug", "name") or "").strip()
+        else:
+            return None
+
+        for prefix in GITHUB_PREFIXES:
+            if full_name.startswith(prefix):
+                full_name = full_name[len(prefix):].strip("/")
+                break
+
+        if "/" in full_name:
+            owner, short_name = (part.strip() for part in full_name.split("/", 1))
+        else:
+            owner = str(item.get("owner") or default_owner).strip()
+            short_name = full_name
+
+        if not short_name or short_name == "unknown":
+            return None
+
+        record = cls(owner, short_name)
+
+        if not item:
+            return record
+
+        record.html_url = str(item.get("html_url") or record.html_url)
+        record.status = _first(item, "status", "state")
+        record.description = item.get("description")
+        record.language = item.get("language")
+        record.stars = safe_int(_first(item, "stars", "stargazers_count", "stargazers", "star_count"))
+        record.forks = safe_int(_first(item, "forks", "forks_count"))
+        record.watchers = safe_int(_first(item, "watchers", "watchers_count"))
+        record.open_issues = safe_int(_first(item, "open_issues", "open_issues_count"))
+        record.default_branch = item.get("default_branch")
+        record.archived = bool(item.get("archived"))
+        record.disabled = bool(item.get("disabled"))
+        record.private = bool(item.get("private"))
+        record.pushed_at = item.get("pushed_at")
+        record.updated_at = item.get("updated_at")
+        record.collected_at = item.get("collected_at")
+        record.error = item.get("error")
+
+        return record
+
+    @property
+    def key(self) -> str:
+        return self.full_name.lower()
+
+    def sort_key(self) -> tuple[int, str]:
+        """Stars descending, then full_name. Shared by aggregates, cards and panels."""
+        return (-self.stars, self.key)
+
+    def to_json(self) -> dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"RepoRecord({self.full_name!r}, stars={self.stars}, status={self.status!r})"
@@ -5,11 +5,13 @@
 #   --list
 #   --from-backup <backup_dir> [--yes]
 #   --revert-commit <commit_sha> [--yes]
+#   --to-build <build_id|previous> [--yes]
 #
 # Examples:
 #   bash scripts/rollback_surface.sh --list
 #   bash scripts/rollback_surface.sh --from-backup .backups/pre-release-20260511T000000Z --yes
 #   bash scripts/rollback_surface.sh --revert-commit abc1234 --yes
+#   bash scripts/rollback_surface.sh --to-build previous --yes
 
 set -euo pipefail
 
@@ -19,6 +21,9 @@ LOG_FILE="$LOG_DIR/rollback_surface.log"
 
 mkdir -p "$LOG_DIR"
 
+. "$ROOT_DIR/scripts/pipeline_log.sh" rollback
+trap plog_flush EXIT
+
 MODE=""
 TARGET=""
 ASSUME_YES="no"
@@ -29,10 +34,11 @@ Usage:
   bash scripts/rollback_surface.sh --list
   bash scripts/rollback_surface.sh --from-backup <backup_dir> [--yes]
   bash scripts/rollback_surface.sh --revert-commit <commit_sha> [--yes]
+  bash scripts/rollback_surface.sh --to-build <build_id|previous> [--yes]
 
 Modes:
   --list
-      List available .backups directories.
+      List available .backups directories and stored builds.
 
   --from-backup <backup_dir>
       Restore tracked surface files from a backup directory.
@@ -40,6 +46,10 @@ Modes:
   --revert-commit <commit_sha>
       Run git revert against a specific commit.
 
+  --to-build <build_id|previous>
+      Restore generated outputs from the content-addressed build store
+      (.surface-store). Only files whose content differs are rewritten.
+
 Safety:
   --yes
       Skip interactive confirmation.
@@ -55,9 +65,11 @@ log() {
   local level="$1"
   shift
   local msg="$*"
-  local ts
-  ts="$(date -u +"%Y-%m-%dT%H:%M:%SZ")"
-  printf '[%s] [%s] %s\n' "$ts" "$level" "$msg" | tee -a "$LOG_FILE"
+  local line
+  TZ=UTC0 printf -v line '[%(%Y-%m-%dT%H:%M:%SZ)T] [%s] %s' -1 "$level" "$msg"
+  printf '%s\n' "$line"
+  printf '%s\n' "$line" >> "$LOG_FILE"
+  plog "${level/#FAIL/ERROR}" "$msg"
 }
 
 fail() {
@@ -104,6 +116,11 @@ list_backups() {
   find "$ROOT_DIR/.backups" -mindepth 1 -maxdepth 1 -type d | sort | sed "s#^$ROOT_DIR/##"
 }
 
+list_builds() {
+  log "INFO" "Listing builds under .surface-store"
+  python3 "$ROOT_DIR/scripts/artifact_store.py" list
+}
+
 validate_after_rollback() {
   log "INFO" "Running validation after rollback"
 
@@ -198,6 +215,29 @@ revert_commit() {
   log "INFO" "This script does not push. Push manually after review."
 }
 
+restore_build() {
+  local build="$1"
+
+  [[ -n "$build" ]] || fail "Missing build id"
+
+  log "INFO" "Preparing build restore: $build"
+  python3 "$ROOT_DIR/scripts/artifact_store.py" checkout "$build" --dry-run | tee -a "$LOG_FILE" || fail "Build not restorable: $build"
+
+  confirm "Restore generated outputs from build '$build'?"
+
+  plog_mark checkout
+  if python3 "$ROOT_DIR/scripts/artifact_store.py" checkout "$build" | tee -a "$LOG_FILE"; then
+    plog INFO "Build checkout finished" checkout
+  else
+    fail "Build checkout failed: $build"
+  fi
+
+  validate_after_rollback
+
+  log "PASS" "Build restore completed"
+  log "INFO" "Review changes with: git status --short && git diff --stat"
+}
+
 parse_args() {
   if [[ "$#" -eq 0 ]]; then
     usage
@@ -220,6 +260,11 @@ parse_args() {
         TARGET="${2:-}"
         shift 2
         ;;
+      --to-build)
+        MODE="to-build"
+        TARGET="${2:-}"
+        shift 2
+        ;;
       --yes)
         ASSUME_YES="yes"
         shift
@@ -248,6 +293,7 @@ main() {
   case "$MODE" in
     list)
       list_backups
+      list_builds
       ;;
     from-backup)
       restore_from_backup "$TARGET"
@@ -255,6 +301,9 @@ main() {
     revert-commit)
       revert_commit "$TARGET"
       ;;
+    to-build)
+      restore_build "$TARGET"
+      ;;
     *)
       usage
       fail "No valid mode selected"
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Shared surface data I/O.
+
+JSON documents:
+  - canonical encoding: sorted keys, 2-space indent, trailing newline
+  - orjson is used when installed, stdlib json otherwise; both produce the
+    same bytes for str/int/bool/null/list/dict payloads. Floats are not
+    covered (orjson writes 1e16 where json writes 1e+16), so any payload
+    holding a float is encoded by stdlib json
+  - documents are streamed to the file handle, then atomically renamed
+
+JSON Lines companions:
+  - metrics/metrics.jsonl        one repository record per line
+  - assets/projects/index.jsonl  one project card per line
+
+Rules:
+  - readers are iterators; a JSONL file is never fully parsed into memory
+  - readers prefer the JSONL companion and fall back to the JSON document
+  - one canonical line per record: sorted keys, compact separators, UTF-8
+  - writes go through a temporary file and an atomic rename
+
+Incremental writers:
+  - StagedWriter / JsonlWriter / JsonListWriter append one item at a time,
+    so large indexes are produced without holding every entry in memory
+  - JsonListWriter emits the same bytes as write_json for the full document
+"""
+
+from __future__ import annotations
+
+import filecmp
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+ROOT = Path(__file__).resolve().parent.parent
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+OUTPUT_FORMATS = ("json", "jsonl", "both")
+
+
+def display_path(path: Path) -> Path:
+    try:
+        return path.relative_to(ROOT)
+    except ValueError:
+        return path
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path, default: Any, strict: bool = True) -> Any:
+    """Parse a JSON document; invalid input exits unless ``strict`` is false."""
+    if not path.exists():
+        return default
+
+    try:
+        return loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        if not strict:
+            return default
+        raise SystemExit(f"Invalid JSON: {display_path(path)}: {exc}") from exc
+
+
+def _has_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_has_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_float(item) for item in value)
+    return False
+
+
+def _fast_path(payload: Any, ensure_ascii: bool) -> bytes | None:
+    if orjson is None or ensure_ascii or _has_float(payload):
+        return None
+
+    try:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    except TypeError:
+        return None
+
+
+def dump_json(payload: Any, handle: BinaryIO, ensure_ascii: bool = False) -> None:
+    """Stream the canonical encoding of ``payload`` to a binary handle."""
+    encoded = _fast_path(payload, ensure_ascii)
+
+    if encoded is not None:
+        handle.write(encoded)
+        return
+
+    encoder = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=ensure_ascii)
+    for chunk in encoder.iterencode(payload):
+        handle.write(chunk.encode("utf-8"))
+    handle.write(b"\n")
+
+
+def dumps_json(payload: Any, ensure_ascii: bool = False) -> str:
+    encoded = _fast_path(payload, ensure_ascii)
+
+    if encoded is not None:
+        return encoded.decode("utf-8")
+
+    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=ensure_ascii) + "\n"
+
+
+def write_json(
+    path: Path,
+    payload: Any,
+    dry_run: bool = False,
+    ensure_ascii: bool = False,
+    skip_unchanged: bool = False,
+) -> None:
+    if dry_run:
+        print(f"DRY-RUN: would write {display_path(path)}")
+        return
+
+    if skip_unchanged and path.exists():
+        encoded = dumps_json(payload, ensure_ascii=ensure_ascii).encode("utf-8")
+        if path.read_bytes() == encoded:
+            print(f"UNCHANGED: {display_path(path)}")
+            return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+
+    with tmp.open("wb") as handle:
+        dump_json(payload, handle, ensure_ascii=ensure_ascii)
+
+    os.replace(tmp, path)
+    print(f"WROTE: {display_path(path)}")
+
+
+def jsonl_path(path: Path) -> Path:
+    return path.with_suffix(".jsonl")
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    with path.open("r", encoding="utf-8") as handle:
+        for lineno, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield loads(line)
+            except json.JSONDecodeError as exc:
+                raise SystemExit(f"Invalid JSONL: {display_path(path)}:{lineno}: {exc}") from exc
+
+
+def encode_jsonl_line(record: Any) -> bytes:
+    if orjson is not None and not _has_float(record):
+        try:
+            return orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+
+    return (json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class StagedWriter:
+    """Append bytes to ``<path>.tmp``; commit() renames it into place."""
+
+    def __init__(self, path: Path, dry_run: bool = False) -> None:
+        self.path = path
+        self.dry_run = dry_run
+        self.tmp = path.with_name(path.name + ".tmp")
+        self._handle: BinaryIO | None = None
+
+        if not dry_run:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.tmp.open("wb")
+
+    def write(self, data: bytes) -> None:
+        if self._handle is not None:
+            self._handle.write(data)
+
+    def commit(self, skip_unchanged: bool = False, quiet: bool = False) -> bool:
+        """Finish the file; returns False when nothing on disk changed."""
+        if self._handle is None:
+            if not quiet:
+                print(f"DRY-RUN: would write {display_path(self.path)}")
+            return True
+
+        self._handle.close()
+        self._handle = None
+
+        if skip_unchanged and self.path.exists() and filecmp.cmp(self.tmp, self.path, shallow=False):
+            self.tmp.unlink()
+            if not quiet:
+                print(f"UNCHANGED: {display_path(self.path)}")
+            return False
+
+        os.replace(self.tmp, self.path)
+        if not quiet:
+            print(f"WROTE: {display_path(self.path)}")
+        return True
+
+    def discard(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self.tmp.unlink()
+
+
+class JsonlWriter(StagedWriter):
+    def __init__(self, path: Path, dry_run: bool = False) -> None:
+        super().__init__(path, dry_run=dry_run)
+        self.count = 0
+
+    def append(self, record: Any) -> None:
+        self.write(encode_jsonl_line(record))
+        self.count += 1
+
+
+def _indent_json(value: Any, indent: int) -> str:
+    return dumps_json(value).rstrip("\n").replace("\n", "\n" + " " * indent)
+
+
+class JsonListWriter(StagedWriter):
+    """Stream a canonical JSON object whose largest value is the list under ``list_key``.
+
+    ``head`` keys must sort before ``list_key`` and ``tail`` keys after it, so the
+    result matches write_json's sorted-key output byte for byte.
+    """
+
+    def __init__(self, path: Path, list_key: str, head: dict[str, Any] | None = None, dry_run: bool = False) -> None:
+        super().__init__(path, dry_run=dry_run)
+        self.list_key = list_key
+        self.count = 0
+
+        self.write(b"{\n")
+        for key in sorted(head or {}):
+            if key >= list_key:
+                raise ValueError(f"head key {key!r} must sort before {list_key!r}")
+            self.write(f"  {json.dumps(key)}: {_indent_json(head[key], 2)},\n".encode("utf-8"))
+        self.write(f"  {json.dumps(list_key)}: [".encode("utf-8"))
+
+    def append(self, item: Any) -> None:
+        prefix = "\n    " if self.count == 0 else ",\n    "
+        self.write((prefix + _indent_json(item, 4)).encode("utf-8"))
+        self.count += 1
+
+    def close(self, tail: dict[str, Any] | None = None, skip_unchanged: bool = False) -> bool:
+        self.write(b"\n  ]" if self.count else b"]")
+        for key in sorted(tail or {}):
+            if key <= self.list_key:
+                raise ValueError(f"tail key {key!r} must sort after {self.list_key!r}")
+            self.write(f",\n  {json.dumps(key)}: {_indent_json(tail[key], 2)}".encode("utf-8"))
+        self.write(b"\n}\n")
+        return self.commit(skip_unchanged=skip_unchanged)
+
+
+def write_jsonl(path: Path, records: Iterable[Any]) -> int:
+    writer = JsonlWriter(path)
+    for record in records:
+        writer.append(record)
+    writer.commit(quiet=True)
+    return writer.count
+
+
+def write_jsonl_file(path: Path, records: Iterable[Any], dry_run: bool = False) -> None:
+    if dry_run:
+        print(f"DRY-RUN: would write {display_path(path)}")
+        return
+
+    write_jsonl(path, records)
+    print(f"WROTE: {display_path(path)}")
+
+
+def remove_file(path: Path, dry_run: bool = False) -> None:
+    if not path.exists():
+        return
+
+    if dry_run:
+        print(f"DRY-RUN: would remove stale {display_path(path)}")
+        return
+
+    path.unlink()
+    print(f"REMOVED: {display_path(path)}")
+
+
+def iter_document_records(path: Path, keys: tuple[str, ...]) -> Iterator[Any]:
+    """Yield items of the first non-empty list under ``keys`` in a JSON document."""
+    payload = load_json(path, {})
+
+    if not isinstance(payload, dict):
+        return
+
+    for key in keys:
+        values = payload.get(key)
+        if isinstance(values, list) and values:
+            yield from values
+            return
+
+
+def iter_records(path: Path, keys: tuple[str, ...]) -> Iterator[Any]:
+    """Stream records from ``path``'s JSONL companion, else from the JSON document."""
+    companion = jsonl_path(path)
+
+    if companion.exists():
+        yield from iter_jsonl(companion)
+        return
+
+    yield from iter_document_records(path, keys)
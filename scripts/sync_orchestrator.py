@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Concurrent repository sync orchestrator (entry point: systems/orchestrator/sync.sh).
+
+Reads:
+  - identity/repos.json              "repositories" (enabled only) + "sync_settings",
+                                     through the compiled registry index
+
+Writes:
+  - metrics/{owner}_{repo}.json      repo, owner, stargazers, watchers, forks, timestamp
+  - health/orchestrator.json         status, repos_synced, failures, last_sync, github_auth
+  - tmp/orchestrator/*.lock          epoch of the last successful sync per repo
+  - logs/pipeline.jsonl              stage "sync" events (scripts/pipeline_log.py)
+
+Rules:
+  - the registry is parsed once; every enabled repo is synced concurrently
+    on one event loop, bounded by --concurrency
+  - sync_settings drive the run:
+      interval_minutes     repos synced more recently than this are skipped
+      retry_attempts       attempts per repo before it counts as a failure
+      retry_delay_seconds  pause between attempts
+      timeout_seconds      per-request timeout
+  - requests share one pooled GitHubClient and its rate-limit accounting
+    (scripts/github_client.py); no secrets written to disk
+  - metrics/aggregate.json is owned by scripts/collect_repo_metrics.py and
+    is not touched here
+  - --repo limits the run to the named repositories and ignores their
+    interval locks (webhook-driven updates)
+  - exit status 1 when any repo fails (health status "degraded")
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from github_client import RATE_LIMIT, GitHubClient, github_token
+from pipeline_log import PipelineLog
+from registry_index import load_index
+from repo_record import safe_int
+from surface_io import write_json
+
+ROOT = Path(__file__).resolve().parent.parent
+METRICS_DIR = ROOT / "metrics"
+HEALTH_FILE = ROOT / "health" / "orchestrator.json"
+LOCK_DIR = ROOT / "tmp" / "orchestrator"
+
+DEFAULT_CONCURRENCY = 8
+
+
+def iso_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+
+
+def load_registry(enabled_only: bool = True, dry_run: bool = False) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Registry entries (owner, name, enabled + the raw "registry" record) and sync_settings."""
+    index = load_index(write=not dry_run)
+    return list(index.registry(enabled_only=enabled_only)), dict(index.settings)
+
+
+def lock_path(owner: str, repo: str) -> Path:
+    return LOCK_DIR / f"{owner}_{repo}.lock"
+
+
+def metrics_path(owner: str, repo: str) -> Path:
+    return METRICS_DIR / f"{owner}_{repo}.json"
+
+
+def recently_synced(owner: str, repo: str, interval_minutes: int) -> bool:
+    try:
+        synced_at = int(lock_path(owner, repo).read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return False
+    return time.time() - synced_at < interval_minutes * 60
+
+
+async def fetch_metrics(owner: str, repo: str, client: GitHubClient, settings: dict[str, int], log: PipelineLog) -> dict[str, Any] | None:
+    attempts = settings["retry_attempts"]
+
+    for attempt in range(1, attempts + 1):
+        started = time.perf_counter()
+        status, payload, error = await asyncio.to_thread(
+            client.get, f"/repos/{owner}/{repo}", settings["timeout_seconds"] or 60
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if status == 200 and isinstance(payload, dict):
+            return {
+                "repo": repo,
+                "owner": owner,
+                "stargazers": safe_int(payload.get("stargazers_count")),
+                "watchers": safe_int(payload.get("watchers_count")),
+                "forks": safe_int(payload.get("forks_count")),
+                "timestamp": iso_now(),
+            }
+
+        log(
+            "WARN",
+            f"Attempt {attempt}/{attempts} failed for {owner}/{repo} (HTTP {status}): {error or 'unexpected payload'}",
+            ms=elapsed_ms,
+            repo=f"{owner}/{repo}",
+            http_status=status,
+        )
+        if attempt < attempts:
+            await asyncio.sleep(settings["retry_delay_seconds"])
+
+    return None
+
+
+async def sync_repository(
+    item: dict[str, Any],
+    client: GitHubClient,
+    settings: dict[str, int],
+    gate: asyncio.Semaphore,
+    log: PipelineLog,
+    force: bool = False,
+    dry_run: bool = False,
+) -> bool:
+    owner, repo = str(item["owner"]), str(item["name"])
+
+    if not force and recently_synced(owner, repo, settings["interval_minutes"]):
+        log("INFO", f"Skipping {owner}/{repo} - recently synced")
+        return True
+
+    async with gate:
+        log("INFO", f"Fetching metrics from {owner}/{repo}")
+        started = time.perf_counter()
+        metrics = await fetch_metrics(owner, repo, client, settings, log)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if metrics is None:
+        log("ERROR", f"Failed to sync {owner}/{repo}", ms=elapsed_ms, repo=f"{owner}/{repo}")
+        return False
+
+    write_json(metrics_path(owner, repo), metrics, dry_run=dry_run)
+    if not dry_run:
+        LOCK_DIR.mkdir(parents=True, exist_ok=True)
+        lock_path(owner, repo).write_text(f"{int(time.time())}\n", encoding="utf-8")
+
+    log("INFO", f"Synced {owner}/{repo}: stars={metrics['stargazers']}", ms=elapsed_ms, repo=f"{owner}/{repo}")
+    return True
+
+
+def update_health(status: str, repos_synced: int, failures: int, github_auth: bool, dry_run: bool = False) -> None:
+    payload = {
+        "status": status,
+        "repos_synced": repos_synced,
+        "failures": failures,
+        "last_sync": iso_now(),
+        "github_auth": github_auth,
+    }
+    write_json(HEALTH_FILE, payload, dry_run=dry_run)
+
+
+async def run(args: argparse.Namespace, log: PipelineLog) -> int:
+    registry, settings = load_registry(dry_run=args.dry_run)
+    targets = {name.strip().lower() for name in args.repo}
+    repos = [item for item in registry if not targets or item["key"] in targets]
+    force = args.force or bool(targets)
+    concurrency = max(1, args.concurrency)
+    client = GitHubClient(github_token(), pool_size=concurrency)
+    auth = client.authenticated
+    RATE_LIMIT.load()
+
+    for name in sorted(targets - {item["key"] for item in repos}):
+        log("WARN", f"Not an enabled registry repo: {name}")
+
+    log("INFO", f"Starting repository sync: {len(repos)} enabled repos")
+    update_health("running", 0, 0, auth, dry_run=args.dry_run)
+
+    gate = asyncio.Semaphore(concurrency)
+    try:
+        outcomes = await asyncio.gather(
+            *(sync_repository(item, client, settings, gate, log, force=force, dry_run=args.dry_run) for item in repos)
+        )
+    finally:
+        client.close()
+        RATE_LIMIT.save(dry_run=args.dry_run)
+
+    failed = outcomes.count(False)
+    synced = sum(1 for item in registry if metrics_path(str(item["owner"]), str(item["name"])).exists())
+
+    if failed:
+        update_health("degraded", synced, failed, auth, dry_run=args.dry_run)
+        log("WARN", f"Sync completed with {failed} failures")
+        return 1
+
+    update_health("healthy", synced, 0, auth, dry_run=args.dry_run)
+    log("INFO", "Sync completed successfully")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="fetch but print planned writes without mutating files")
+    parser.add_argument("--force", action="store_true", help="ignore interval_minutes locks and sync every enabled repo")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="maximum in-flight GitHub requests")
+    parser.add_argument("--repo", action="append", default=[], metavar="OWNER/NAME", help="sync only this repository (repeatable); implies --force for it")
+    args = parser.parse_args()
+
+    with PipelineLog("sync", dry_run=args.dry_run) as log, log.span("Sync run"):
+        return asyncio.run(run(args, log))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,108 +1,211 @@
 #!/usr/bin/env python3
 """
-Surface validation script.
-Validates SVG XML, HTML structure, JSON schemas.
+Surface validation engine.
+
+Checks every generated artifact in one process:
+  - *.svg    well-formed XML with an <svg> root (iterparse above ITERPARSE_MIN_BYTES)
+  - *.json   parses as JSON
+  - *.jsonl  every non-empty line parses as JSON
+  - *.html   DOCTYPE and closing </html> present
+
+Reads:
+  - SURFACE_GLOBS                    every generated asset, not a fixed list
+  - REQUIRED_FILES                   deploy surface that must exist
+  - README.md                        Pages CTA / duplicate catalog checks
+
+Writes:
+  - dist/validate-cache.json         per file: content hash + result
+
+Rules:
+  - file checks run concurrently (--jobs)
+  - results are cached by sha256 of the file bytes + CHECK_VERSION;
+    unchanged files are not re-parsed, cached failures are still reported
+  - --paths checks only the listed files and prints one PASS/FAIL/SKIP line
+    per file (used by the Makefile and scripts/quantum_build.sh)
+  - exit status 1 when any check fails
 """
+
 from __future__ import annotations
-import json
+
+import argparse
+import hashlib
+import os
 import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
+
+from pipeline_trace import span
+from surface_io import display_path, load_json, loads, write_json
 
 ROOT = Path(__file__).resolve().parent.parent
+CACHE_FILE = ROOT / "dist" / "validate-cache.json"
+
+# Bump whenever a checker changes so every cached result is re-evaluated.
+CHECK_VERSION = "1"
+ITERPARSE_MIN_BYTES = 256 * 1024
+HASH_CHUNK = 1024 * 1024
+
+SURFACE_GLOBS = (
+    "index.html",
+    "site/**/*.html",
+    "site/**/*.json",
+    "assets/*.svg",
+    "assets/projects/**/*.svg",
+    "assets/projects/**/*.json",
+    "assets/projects/*.jsonl",
+    "data/*.json",
+    "health/*.json",
+    "identity/*.json",
+    "metrics/*.json",
+    "metrics/*.jsonl",
+    "telemetry/*.json",
+    "dist/*.json",
+)
 
-SVG_ASSETS = [
+REQUIRED_FILES = (
     "assets/system-health.svg",
     "assets/workflow-status.svg",
     "assets/repo-metrics.svg",
     "assets/system-matrix.svg",
     "assets/flow-line.svg",
     "assets/section_quote.svg",
-]
-
-JSON_SCHEMAS = [
-    "data/projects.json",
-    "metrics/github_telemetry.json",
-    "data/portfolio.json",
+    "assets/pages-surface-badge.svg",
     "health/system_health.json",
-]
+    "index.html",
+    ".nojekyll",
+    ".github/workflows/deploy-pages.yml",
+)
+
 
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256(CHECK_VERSION.encode("utf-8"))
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-def validate_svg(path: Path) -> bool:
+
+def check_svg(path: Path) -> str | None:
     try:
-        ET.parse(path)
-        return True
-    except ET.ParseError as e:
-        print(f"INVALID SVG: {path} - {e}")
-        return False
+        if path.stat().st_size < ITERPARSE_MIN_BYTES:
+            root_tag = ET.parse(path).getroot().tag
+        else:
+            root_tag = ""
+            for event, elem in ET.iterparse(path, events=("start", "end")):
+                if event == "start":
+                    root_tag = root_tag or elem.tag
+                else:
+                    elem.clear()
+    except ET.ParseError as exc:
+        return str(exc)
+
+    if root_tag.rsplit("}", 1)[-1] != "svg":
+        return f"root element is <{root_tag}>, expected <svg>"
+    return None
 
 
-def validate_json(path: Path) -> bool:
+def check_json(path: Path) -> str | None:
     try:
-        with open(path, encoding="utf-8") as f:
-            json.load(f)
-        return True
-    except json.JSONDecodeError as e:
-        print(f"INVALID JSON: {path} - {e}")
-        return False
+        loads(path.read_bytes())
+    except (ValueError, UnicodeDecodeError) as exc:
+        return str(exc)
+    return None
+
 
+def check_jsonl(path: Path) -> str | None:
+    with path.open("rb") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                loads(line)
+            except (ValueError, UnicodeDecodeError) as exc:
+                return f"line {number}: {exc}"
+    return None
 
-def validate_html(path: Path) -> bool:
+
+def check_html(path: Path) -> str | None:
     try:
         content = path.read_text(encoding="utf-8")
-        # Basic structure check
-        if "<!DOCTYPE html>" not in content:
-            print(f"MISSING DOCTYPE: {path}")
-            return False
-        if "</html>" not in content:
-            print(f"MISSING CLOSING TAG: {path}")
-            return False
-        return True
-    except Exception as e:
-        print(f"INVALID HTML: {path} - {e}")
-        return False
+    except UnicodeDecodeError as exc:
+        return str(exc)
 
+    if "<!DOCTYPE html>" not in content:
+        return "missing DOCTYPE"
+    if "</html>" not in content:
+        return "missing closing </html>"
+    return None
+
+
+CHECKERS: dict[str, Callable[[Path], str | None]] = {
+    ".svg": check_svg,
+    ".json": check_json,
+    ".jsonl": check_jsonl,
+    ".html": check_html,
+}
+
+
+def surface_files() -> list[Path]:
+    paths: set[Path] = set()
+    for pattern in SURFACE_GLOBS:
+        paths.update(ROOT.glob(pattern))
+    paths.discard(CACHE_FILE)
+    return sorted(path for path in paths if path.is_file() and path.suffix in CHECKERS)
+
+
+def load_cache() -> dict[str, dict[str, str | None]]:
+    cache = load_json(CACHE_FILE, {}, strict=False)
+    results = cache.get("results") if isinstance(cache, dict) else None
+    return results if isinstance(results, dict) else {}
+
+
+def validate_file(path: Path, cache: dict[str, dict[str, str | None]], use_cache: bool) -> tuple[str, str | None]:
+    """Return (content hash, error); the checker only runs on a cache miss."""
+    rel = str(display_path(path))
+    with span("validate_file", cat="validate", path=rel) as attrs:
+        digest = file_digest(path)
+        cached = cache.get(rel)
+        attrs["bytes"] = path.stat().st_size
+
+        if use_cache and isinstance(cached, dict) and cached.get("hash") == digest:
+            attrs["cache"] = "hit"
+            return digest, cached.get("error")
+
+        attrs["cache"] = "miss"
+        error = CHECKERS[path.suffix](path)
+        attrs["valid"] = error is None
+        return digest, error
+
+
+def validate_files(
+    paths: list[Path],
+    jobs: int,
+    use_cache: bool = True,
+) -> dict[str, str | None]:
+    """Check files concurrently; returns relative path -> error (None when valid)."""
+    cache = load_cache()
+
+    with span("validate_files", cat="validate", files=len(paths), jobs=jobs), ThreadPoolExecutor(max_workers=jobs) as pool:
+        outcomes = list(pool.map(lambda path: validate_file(path, cache, use_cache), paths))
+
+    results: dict[str, str | None] = {}
+    fresh = {rel: entry for rel, entry in cache.items() if (ROOT / rel).is_file()}
+    for path, (digest, error) in zip(paths, outcomes):
+        rel = str(display_path(path))
+        results[rel] = error
+        fresh[rel] = {"hash": digest, "error": error}
+
+    if fresh != cache:
+        write_json(CACHE_FILE, {"check_version": CHECK_VERSION, "results": fresh})
+
+    return results
+
+
+def surface_errors() -> list[str]:
+    errors = [f"MISSING: {rel}" for rel in REQUIRED_FILES if not (ROOT / rel).exists()]
 
-def main() -> int:
-    errors = []
-
-    # Validate SVGs
-    for svg in SVG_ASSETS:
-        path = ROOT / svg
-        if not path.exists():
-            errors.append(f"MISSING: {svg}")
-        elif not validate_svg(path):
-            errors.append(f"SVG FAIL: {svg}")
-
-    # Validate JSON schemas
-    for js in JSON_SCHEMAS:
-        path = ROOT / js
-        if path.exists() and not validate_json(path):
-            errors.append(f"JSON FAIL: {js}")
-
-    # Validate index.html
-    index_path = ROOT / "index.html"
-    if not index_path.exists():
-        errors.append("MISSING: index.html")
-    elif not validate_html(index_path):
-        errors.append("HTML FAIL: index.html")
-
-    # Validate .nojekyll
-    nojekyll_path = ROOT / ".nojekyll"
-    if not nojekyll_path.exists():
-        errors.append("MISSING: .nojekyll")
-
-    # Validate deploy-pages.yml
-    pages_workflow = ROOT / ".github/workflows/deploy-pages.yml"
-    if not pages_workflow.exists():
-        errors.append("MISSING: .github/workflows/deploy-pages.yml")
-
-    # Validate pages-surface-badge.svg
-    badge_svg = ROOT / "assets/pages-surface-badge.svg"
-    if not badge_svg.exists():
-        errors.append("MISSING: assets/pages-surface-badge.svg")
-
-    # Validate README has Pages CTA and no duplicate Deployed Systems
     readme_path = ROOT / "README.md"
     if readme_path.exists():
         readme_content = readme_path.read_text(encoding="utf-8")
@@ -112,14 +215,50 @@ def main() -> int:
         if "## ◆ Deployed Systems" in readme_content and "Operational repositories and active build pipelines" in readme_content:
             errors.append("README: Duplicate Deployed Systems catalog detected")
 
+    return errors
+
+
+def validate_paths(names: list[str], jobs: int, use_cache: bool) -> int:
+    paths: list[Path] = []
+    for name in names:
+        path = (ROOT / name).resolve()
+        if not path.is_file() or path == CACHE_FILE:
+            print(f"SKIP: {name}")
+        elif path.suffix not in CHECKERS:
+            print(f"SKIP: {name} (no checker for {path.suffix or 'extensionless'} files)")
+        else:
+            paths.append(path)
+
+    results = validate_files(paths, jobs, use_cache=use_cache)
+    for rel, error in results.items():
+        print(f"PASS: {rel}" if error is None else f"FAIL: {rel} - {error}")
+
+    return 1 if any(error is not None for error in results.values()) else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paths", nargs="+", metavar="FILE", help="check only these files (missing files are skipped)")
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1), help="concurrent file checks")
+    parser.add_argument("--no-cache", action="store_true", help="re-check every file regardless of the result cache")
+    args = parser.parse_args()
+
+    jobs = max(1, args.jobs)
+    if args.paths:
+        return validate_paths(args.paths, jobs, use_cache=not args.no_cache)
+
+    results = validate_files(surface_files(), jobs, use_cache=not args.no_cache)
+    errors = [f"INVALID: {rel} - {error}" for rel, error in results.items() if error is not None]
+    errors.extend(surface_errors())
+
     if errors:
         for err in errors:
             print(f"ERROR: {err}")
         return 1
 
-    print("VALIDATION PASS: All surfaces valid")
+    print(f"VALIDATION PASS: {len(results)} surfaces valid")
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Local GitHub webhook receiver that triggers targeted incremental rebuilds.
+
+Reads:
+  - POST bodies of GitHub push, workflow_run, star and fork deliveries
+  - dist/registry-index.json         event repository -> registry entry
+
+Writes:
+  - nothing directly; runs the stages an event needs as child processes
+  - logs/pipeline.jsonl              stage "webhook" events (scripts/pipeline_log.py)
+
+Stages (run in this order, only the ones a batch needs):
+  - sync                             sync_orchestrator.py --repo R
+  - metrics                          collect_repo_metrics.py --repo R
+  - workflow                         collect_workflow_runs.py
+  - workflow_panel                   generate_workflow_status.py
+  - cards                            generate_project_cards.py build_arguments() (card cache;
+                                     same limit, profile and atlas as make build)
+  - readme                           build_readme.py (stores the build, see artifact_store.py)
+
+Used by:
+  - scripts/change_preflight.py      run_stages() / surface_repo() for scheduled syncs
+
+Commands:
+  - serve [--host H] [--port P]      listen until SIGTERM/SIGINT; GET /healthz reports state
+  - plan <event> <payload.json>      print the repo and stages a delivery maps to
+
+Rules:
+  - push re-collects the repo; star and fork also refresh its sync metrics;
+    both then re-render cards and the README
+  - workflow_run counts only when completed on the surface repository
+    (WEBHOOK_SURFACE_REPO, else GITHUB_REPOSITORY, else the origin remote);
+    other repos have no workflow panel
+  - repositories outside identity/repos.json are acknowledged and ignored
+  - deliveries are answered at once with 202; work is debounced: a batch
+    runs --debounce seconds after the last delivery, or --max-wait seconds
+    after the first, with every pending repo and stage merged
+  - one batch runs at a time and shares a fresh PIPELINE_RUN_ID; a failing
+    stage is logged and the rest still run, rendering the data already on disk
+  - with WEBHOOK_SECRET set, X-Hub-Signature-256 is required and checked
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from collect_workflow_runs import infer_repo_slug
+from generate_project_cards import build_arguments
+from pipeline_log import RUN_ID_ENV, PipelineLog
+from registry_index import REGISTRY_SOURCE, SOURCES, RegistryIndex, load_index
+from surface_io import dumps_json, load_json, loads
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SECRET_ENV = "WEBHOOK_SECRET"
+SURFACE_REPO_ENV = "WEBHOOK_SURFACE_REPO"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+DEFAULT_DEBOUNCE = 5.0
+DEFAULT_MAX_WAIT = 30.0
+STAGE_TIMEOUT = 300
+MAX_BODY = 1024 * 1024
+
+# name, command, takes --repo; the cards arguments are resolved per batch (stage_commands)
+STAGES: tuple[tuple[str, tuple[str, ...], bool], ...] = (
+    ("sync", ("scripts/sync_orchestrator.py",), True),
+    ("metrics", ("scripts/collect_repo_metrics.py",), True),
+    ("workflow", ("scripts/collect_workflow_runs.py",), False),
+    ("workflow_panel", ("scripts/generate_workflow_status.py",), False),
+    ("cards", ("scripts/generate_project_cards.py",), False),
+    ("readme", ("scripts/build_readme.py",), False),
+)
+
+EVENT_STAGES = {
+    "push": ("metrics", "cards", "readme"),
+    "star": ("sync", "metrics", "cards", "readme"),
+    "fork": ("sync", "metrics", "cards", "readme"),
+    "workflow_run": ("workflow", "workflow_panel", "readme"),
+}
+
+
+def surface_repo() -> str | None:
+    """owner/name of the repository this surface is published from."""
+    return os.environ.get(SURFACE_REPO_ENV) or os.environ.get("GITHUB_REPOSITORY") or infer_repo_slug()
+
+
+# "index" -> (source stamp, RegistryIndex); replaced as one value so threads never see a torn pair.
+INDEX_CACHE: dict[str, tuple[list[Any], RegistryIndex]] = {}
+
+
+def cached_index() -> RegistryIndex:
+    """The compiled index, reloaded only when a source's size or mtime moves."""
+    stamp = []
+    for rel in SOURCES:
+        try:
+            stat = (ROOT / rel).stat()
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((stat.st_size, stat.st_mtime_ns))
+    cached = INDEX_CACHE.get("index")
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, load_index(write=False))
+        INDEX_CACHE["index"] = cached
+    return cached[1]
+
+
+def plan_event(event: str, payload: Any, surface_repo: str | None) -> tuple[str | None, tuple[str, ...], str]:
+    """(repo key, stages, reason) for one delivery; no stages means nothing to rebuild."""
+    if event not in EVENT_STAGES:
+        return None, (), f"unhandled event {event}"
+
+    repository = payload.get("repository") if isinstance(payload, dict) else None
+    full_name = str(repository.get("full_name") or "") if isinstance(repository, dict) else ""
+    if not full_name:
+        return None, (), "payload has no repository.full_name"
+    key = full_name.lower()
+
+    if event == "workflow_run":
+        if payload.get("action") != "completed":
+            return key, (), f"workflow_run {payload.get('action')} (waiting for completed)"
+        if surface_repo is None or key != surface_repo.lower():
+            return key, (), "workflow_run outside the surface repository"
+        return key, EVENT_STAGES[event], "workflow run completed"
+
+    entry = cached_index().get(key)
+    if entry is None or entry["key"] != key or REGISTRY_SOURCE not in entry["sources"]:
+        return key, (), "repository is not in identity/repos.json"
+
+    stages = EVENT_STAGES[event]
+    if not entry["enabled"]:
+        # sync_orchestrator only tracks enabled repositories.
+        stages = tuple(stage for stage in stages if stage != "sync")
+    return key, stages, f"{event} {payload.get('action') or ''}".strip()
+
+
+def signature_ok(secret: str, body: bytes, header: str | None) -> bool:
+    if not header or not header.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header[len("sha256="):])
+
+
+class Debouncer:
+    """Pending repo -> stages, released once deliveries go quiet (or max_wait passes)."""
+
+    __slots__ = ("delay", "max_wait", "pending", "first_at", "last_at", "condition", "stopped")
+
+    def __init__(self, delay: float = DEFAULT_DEBOUNCE, max_wait: float = DEFAULT_MAX_WAIT) -> None:
+        self.delay = delay
+        self.max_wait = max(delay, max_wait)
+        self.pending: dict[str, set[str]] = {}
+        self.first_at = 0.0
+        self.last_at = 0.0
+        self.condition = threading.Condition()
+        self.stopped = False
+
+    def add(self, repo: str, stages: tuple[str, ...]) -> None:
+        with self.condition:
+            now = time.monotonic()
+            if not self.pending:
+                self.first_at = now
+            self.last_at = now
+            self.pending.setdefault(repo, set()).update(stages)
+            self.condition.notify()
+
+    def take(self) -> dict[str, set[str]] | None:
+        """Block until a batch is due; None once stopped with nothing pending."""
+        with self.condition:
+            while True:
+                if self.pending:
+                    now = time.monotonic()
+                    due = min(self.last_at + self.delay, self.first_at + self.max_wait)
+                    if now >= due or self.stopped:
+                        batch, self.pending = self.pending, {}
+                        return batch
+                    self.condition.wait(due - now)
+                elif self.stopped:
+                    return None
+                else:
+                    self.condition.wait()
+
+    def stop(self) -> None:
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    def size(self) -> int:
+        with self.condition:
+            return len(self.pending)
+
+
+def stage_commands(batch: dict[str, set[str]], dry_run: bool = False) -> list[tuple[str, list[str]]]:
+    """Ordered (stage, argv) for a batch; per-repo stages get one --repo per repo that needs them."""
+    commands: list[tuple[str, list[str]]] = []
+    for name, command, per_repo in STAGES:
+        repos = sorted(repo for repo, stages in batch.items() if name in stages)
+        if not repos:
+            continue
+        argv = [sys.executable, *command]
+        if name == "cards":
+            argv += build_arguments()
+        if per_repo:
+            for repo in repos:
+                argv += ["--repo", repo]
+        if dry_run:
+            argv.append("--dry-run")
+        commands.append((name, argv))
+    return commands
+
+
+def run_stages(batch: dict[str, set[str]], log: PipelineLog, run: str, dry_run: bool = False) -> bool:
+    """Run a batch's stages in order as child processes sharing PIPELINE_RUN_ID ``run``."""
+    env = {**os.environ, RUN_ID_ENV: run}
+    ok = True
+    for stage, argv in stage_commands(batch, dry_run=dry_run):
+        started = time.perf_counter()
+        try:
+            result = subprocess.run(argv, cwd=ROOT, env=env, capture_output=True, text=True, timeout=STAGE_TIMEOUT, check=False)
+            status, detail = result.returncode, (result.stderr or result.stdout).strip()
+        except subprocess.TimeoutExpired:
+            status, detail = 124, f"timed out after {STAGE_TIMEOUT}s"
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if status != 0:
+            log("ERROR", f"Stage {stage} exited {status}: {detail[-300:]}", ms=elapsed_ms, batch=run)
+            ok = False
+            continue
+        log("INFO", f"Stage {stage} done", ms=elapsed_ms, batch=run)
+    return ok
+
+
+class Receiver:
+    """Queues planned deliveries and runs their batches on one worker thread."""
+
+    def __init__(self, log: PipelineLog, debounce: Debouncer, surface_repo: str | None, dry_run: bool = False) -> None:
+        self.log = log
+        self.debounce = debounce
+        self.surface_repo = surface_repo
+        self.dry_run = dry_run
+        self.secret = os.environ.get(SECRET_ENV) or None
+        self.running: str | None = None
+        self.batches = 0
+        self.last_batch: dict[str, Any] | None = None
+        self.worker = threading.Thread(target=self.work, name="webhook-worker", daemon=True)
+
+    def accept(self, event: str, delivery: str, payload: Any) -> dict[str, Any]:
+        repo, stages, reason = plan_event(event, payload, self.surface_repo)
+        accepted = bool(repo and stages)
+        self.log("INFO", f"{event} {delivery}: {reason}", repo=repo, stages=list(stages), accepted=accepted)
+        if accepted:
+            self.debounce.add(repo, stages)
+        return {"accepted": accepted, "repo": repo, "stages": list(stages), "reason": reason}
+
+    def work(self) -> None:
+        while True:
+            batch = self.debounce.take()
+            if batch is None:
+                return
+            self.run_batch(batch)
+
+    def run_batch(self, batch: dict[str, set[str]]) -> bool:
+        self.batches += 1
+        batch_run = "{}-webhook{}".format(time.strftime("%Y%m%dT%H%M%S", time.gmtime()), self.batches)
+        repos = sorted(batch)
+
+        self.running = batch_run
+        with self.log.span("Batch", batch=batch_run, repos=repos) as fields:
+            fields["ok"] = ok = run_stages(batch, self.log, batch_run, dry_run=self.dry_run)
+        self.running = None
+        self.last_batch = {"run": batch_run, "repos": repos, "ok": ok}
+        return ok
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "pending": self.debounce.size(),
+            "running": self.running,
+            "batches": self.batches,
+            "last_batch": self.last_batch,
+            "surface_repo": self.surface_repo,
+        }
+
+
+def make_handler(receiver: Receiver) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "surface-webhook/1"
+
+        def reply(self, code: int, payload: dict[str, Any]) -> None:
+            body = dumps_json(payload).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") == "/healthz":
+                self.reply(200, receiver.status())
+            else:
+                self.reply(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY:
+                self.reply(413, {"error": "payload too large"})
+                return
+            body = self.rfile.read(length)
+
+            if receiver.secret and not signature_ok(receiver.secret, body, self.headers.get("X-Hub-Signature-256")):
+                receiver.log("WARN", "Rejected delivery with a bad signature", delivery=self.headers.get("X-GitHub-Delivery"))
+                self.reply(401, {"error": "bad signature"})
+                return
+
+            event = self.headers.get("X-GitHub-Event") or ""
+            if event == "ping":
+                self.reply(200, {"pong": True})
+                return
+
+            try:
+                payload = loads(body)
+            except ValueError:
+                self.reply(400, {"error": "body is not JSON"})
+                return
+
+            self.reply(202, receiver.accept(event, self.headers.get("X-GitHub-Delivery") or "-", payload))
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Deliveries are logged once, structured, by Receiver.accept().
+            pass
+
+    return Handler
+
+
+def serve(args: argparse.Namespace) -> int:
+    log = PipelineLog("webhook", dry_run=args.dry_run)
+    surface = surface_repo()
+    receiver = Receiver(log, Debouncer(args.debounce, args.max_wait), surface, dry_run=args.dry_run)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(receiver))
+    server.daemon_threads = True
+
+    def request_stop(signum: int, frame: Any) -> None:
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    receiver.worker.start()
+    log("INFO", f"Listening on http://{args.host}:{server.server_port} (surface repo: {surface or 'unknown'})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        # Run what is already queued before exiting.
+        receiver.debounce.stop()
+        receiver.worker.join()
+        log("INFO", f"Stopped after {receiver.batches} batches")
+        log.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local GitHub webhook receiver for targeted rebuilds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listen = commands.add_parser("serve", help="accept deliveries and run debounced rebuilds")
+    listen.add_argument("--host", default=DEFAULT_HOST)
+    listen.add_argument("--port", type=int, default=DEFAULT_PORT)
+    listen.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="quiet seconds before a batch runs")
+    listen.add_argument("--max-wait", type=float, default=DEFAULT_MAX_WAIT, help="longest a delivery waits during a burst")
+    listen.add_argument("--dry-run", action="store_true", help="pass --dry-run to every stage")
+
+    preview = commands.add_parser("plan", help="print the stages a delivery would run")
+    preview.add_argument("event", help="X-GitHub-Event value (push, workflow_run, star, fork)")
+    preview.add_argument("payload", type=Path, help="delivery body as a JSON file")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        return serve(args)
+
+    repo, stages, reason = plan_event(args.event, load_json(args.payload, {}), surface_repo())
+    print(dumps_json({"repo": repo, "stages": list(stages), "reason": reason}), end="")
+    if not stages:
+        return 1
+    for _stage, argv in stage_commands({repo or "": set(stages)}):
+        print(" ".join(["python3", *argv[1:]]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""Make the standalone scripts in scripts/ importable as modules."""
+
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
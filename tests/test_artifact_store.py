@@ -0,0 +1,90 @@
+import pytest
+
+import artifact_store as store
+import surface_io
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    for module in (store, surface_io):
+        monkeypatch.setattr(module, "ROOT", tmp_path)
+    monkeypatch.setattr(store, "STORE", tmp_path / ".surface-store")
+    monkeypatch.setattr(store, "OBJECTS", tmp_path / ".surface-store" / "objects")
+    monkeypatch.setattr(store, "BUILDS", tmp_path / ".surface-store" / "builds")
+    monkeypatch.setattr(store, "HEAD", tmp_path / ".surface-store" / "HEAD")
+    return tmp_path
+
+
+def write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def commit(**meta):
+    snapshot = store.capture()
+    snapshot.commit(**meta)
+    return snapshot
+
+
+def test_capture_skips_hand_made_assets(tree):
+    write(tree, "README.md", "readme")
+    write(tree, "assets/system-health.svg", "<svg>health</svg>")
+    write(tree, "assets/projects/me__alpha.svg", "<svg>alpha</svg>")
+    write(tree, "assets/hero_banner.svg", "<svg>banner</svg>")
+
+    snapshot = commit()
+    assert sorted(snapshot.files) == ["README.md", "assets/projects/me__alpha.svg", "assets/system-health.svg"]
+    assert snapshot.new_blobs == 3
+
+
+def test_identical_outputs_share_build_id_and_blobs(tree):
+    write(tree, "README.md", "readme")
+    first = commit()
+    second = commit()
+    assert second.build_id == first.build_id
+    assert second.new_blobs == 0
+
+
+def test_checkout_restores_and_removes_only_recorded_outputs(tree):
+    write(tree, "README.md", "v1")
+    old = commit()
+    write(tree, "README.md", "v2")
+    write(tree, "assets/projects/me__beta.svg", "<svg>beta</svg>")
+    commit()
+
+    # Matches STORE_GLOBS but no build ever recorded it.
+    stray = write(tree, "assets/projects/hand-drawn.svg", "<svg>mine</svg>")
+    banner = write(tree, "assets/hero_banner.svg", "<svg>banner</svg>")
+
+    build = store.resolve_build("previous")
+    assert build["build_id"] == old.build_id
+    assert store.checkout(build) == (1, 1, 0)
+
+    assert (tree / "README.md").read_text(encoding="utf-8") == "v1"
+    assert not (tree / "assets/projects/me__beta.svg").exists()
+    assert stray.exists() and banner.exists()
+    assert store.head_id() == old.build_id
+
+
+def test_checkout_dry_run_changes_nothing(tree):
+    write(tree, "README.md", "v1")
+    commit()
+    write(tree, "README.md", "v2")
+    head = commit()
+
+    assert store.checkout(store.resolve_build("previous"), dry_run=True) == (1, 0, 0)
+    assert (tree / "README.md").read_text(encoding="utf-8") == "v2"
+    assert store.head_id() == head.build_id
+
+
+def test_gc_keeps_head_and_drops_unreferenced_blobs(tree):
+    for version in ("v1", "v2", "v3"):
+        write(tree, "README.md", version)
+        commit()
+    assert store.verify(store.resolve_build(store.head_id())) == []
+
+    assert store.gc(keep=1) == (2, 2)
+    assert [build["build_id"] for build in store.load_builds()] == [store.head_id()]
+    assert sum(1 for _ in store.OBJECTS.glob("*/*")) == 1
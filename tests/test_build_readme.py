@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+import build_readme
+import registry_index
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_readme, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "INDEX_JSON", tmp_path / "dist" / "registry-index.json")
+
+    def write(rel, payload):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    return write
+
+
+def panel(limit=build_readme.REPO_PANEL_LIMIT):
+    return [(repo.key, repo.stars) for repo in build_readme.load_repo_metrics(limit)]
+
+
+def test_metrics_records_update_registry_entries(sources):
+    sources("identity/repos.json", {"repositories": [{"full_name": "me/alpha", "enabled": True}]})
+    sources("metrics/metrics.json", {"repositories": [{"full_name": "me/alpha", "stars": 7}]})
+
+    assert panel() == [("me/alpha", 7)]
+
+
+def test_case_and_url_forms_merge_into_one_repo(sources):
+    sources(
+        "identity/repos.json",
+        {"repositories": ["https://github.com/Me/Alpha", {"repo": "ME/alpha"}, {"name": "beta", "owner": "me"}]},
+    )
+    sources("metrics/metrics.json", {"repositories": [{"full_name": "me/ALPHA", "stars": 2}]})
+
+    assert panel() == [("me/alpha", 2), ("me/beta", 0)]
+
+
+def test_registry_only_repos_are_listed_without_stars(sources):
+    sources("identity/repos.json", {"repositories": ["me/zeta", "me/eta"]})
+    sources("metrics/metrics.json", {"repositories": [{"full_name": "me/theta", "stars": 1}]})
+
+    assert panel() == [("me/theta", 1), ("me/eta", 0), ("me/zeta", 0)]
+
+
+def test_panel_keeps_top_eight_by_stars_then_name(sources):
+    stars = {"a": 5, "b": 9, "c": 5, "d": 0, "e": 3, "f": 9, "g": 1, "h": 5, "i": 2, "j": 0, "k": 4}
+    sources("identity/repos.json", {"repositories": [f"me/{name}" for name in stars]})
+    sources("metrics/metrics.json", {"repositories": [{"full_name": f"me/{name}", "stars": count} for name, count in stars.items()]})
+
+    assert panel() == [
+        ("me/b", 9),
+        ("me/f", 9),
+        ("me/a", 5),
+        ("me/c", 5),
+        ("me/h", 5),
+        ("me/k", 4),
+        ("me/e", 3),
+        ("me/i", 2),
+    ]
+
+
+def test_aggregate_seeds_the_panel_when_the_registry_is_empty(sources):
+    sources("identity/repos.json", [])
+    sources("metrics/aggregate.json", {"repositories": [{"full_name": "me/solo", "stars": 4}]})
+
+    assert panel() == [("me/solo", 4)]
@@ -0,0 +1,154 @@
+import sys
+
+import pytest
+
+import change_preflight as preflight
+
+SURFACE = "me/surface"
+ALPHA = {
+    "full_name": "me/alpha",
+    "owner": {"type": "User"},
+    "description": "alpha",
+    "stargazers_count": 3,
+    "forks_count": 1,
+    "watchers_count": 3,
+    "pushed_at": "2026-10-01T00:00:00Z",
+    "html_url": "https://github.com/me/alpha",
+}
+ENTRY = {"key": "me/alpha", "full_name": "me/alpha", "owner": "me", "name": "alpha", "enabled": True}
+RUNS = {
+    "workflow_runs": [
+        {"id": 900, "path": ".github/workflows/readme-sync.yml", "status": "completed", "conclusion": "success"},
+        {"id": 800, "path": ".github/workflows/deploy-pages.yml", "status": "completed", "conclusion": "success"},
+    ]
+}
+
+
+class FakeClient:
+    """Answers from a path -> (status, body) table; replays 304 when the ETag matches."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def get_conditional(self, path, etag, timeout=15):
+        self.calls.append((path, etag))
+        status, body = self.answers.get(path, (404, None))
+        if etag == f'"{path}"' and status == 200:
+            return 304, None, None, etag
+        return status, body, None, f'"{path}"' if status == 200 else None
+
+    def close(self):
+        pass
+
+
+def answers(**overrides):
+    table = {
+        preflight.listing_path("me"): (200, [ALPHA]),
+        preflight.events_path("me", {}): (200, []),
+        preflight.workflow_path(SURFACE): (200, RUNS),
+    }
+    table.update(overrides)
+    return table
+
+
+def empty_state():
+    return {"etags": {}, "owners": {}, "repos": {}}
+
+
+def test_fingerprints_split_by_output():
+    base = preflight.fingerprints(ALPHA)
+    pushed = preflight.fingerprints({**ALPHA, "pushed_at": "2026-10-02T00:00:00Z"})
+    starred = preflight.fingerprints({**ALPHA, "stargazers_count": 4})
+
+    assert pushed["collect"] != base["collect"] and pushed["card"] != base["card"]
+    assert pushed["sync"] == base["sync"]
+    assert starred["sync"] != base["sync"]
+    assert preflight.fingerprints(dict(ALPHA)) == base
+
+
+def test_first_run_marks_everything_then_304_is_quiet():
+    first = preflight.Preflight(FakeClient(answers()), empty_state(), SURFACE)
+    assert first.plan([ENTRY]) == {
+        "me/alpha": {"metrics", "sync", "cards", "readme"},
+        "me/surface": {"workflow", "workflow_panel", "readme"},
+    }
+
+    second = preflight.Preflight(FakeClient(answers()), first.next_state, SURFACE)
+    assert second.plan([ENTRY]) == {}
+
+
+def test_moved_field_marks_only_dependent_stages():
+    first = preflight.Preflight(FakeClient(answers()), empty_state(), SURFACE)
+    first.plan([ENTRY])
+    state = {**first.next_state, "etags": {}}
+
+    moved = answers(**{preflight.listing_path("me"): (200, [{**ALPHA, "description": "new"}])})
+    assert preflight.Preflight(FakeClient(moved), state, SURFACE).plan([ENTRY]) == {"me/alpha": {"metrics", "cards", "readme"}}
+
+
+def test_failed_probe_counts_as_changed():
+    first = preflight.Preflight(FakeClient(answers()), empty_state(), SURFACE)
+    first.plan([ENTRY])
+
+    failing = answers(**{preflight.listing_path("me"): (502, None)})
+    batch = preflight.Preflight(FakeClient(failing), first.next_state, SURFACE).plan([ENTRY])
+    assert batch["me/alpha"] == {"metrics", "sync", "cards", "readme"}
+
+
+def test_workflow_probe_skips_current_run_and_readme_sync(monkeypatch):
+    assert "status=completed" in preflight.workflow_path(SURFACE)
+
+    monkeypatch.setenv("GITHUB_RUN_ID", "800")
+    assert preflight.latest_foreign_run(RUNS["workflow_runs"]) == {}
+
+    monkeypatch.delenv("GITHUB_RUN_ID")
+    assert preflight.latest_foreign_run(RUNS["workflow_runs"])["id"] == 800
+
+
+def test_new_readme_sync_run_stays_quiet():
+    first = preflight.Preflight(FakeClient(answers()), empty_state(), SURFACE)
+    first.plan([ENTRY])
+    state = {**first.next_state, "etags": {}}
+
+    newer = {"workflow_runs": [{"id": 901, "path": ".github/workflows/readme-sync.yml", "status": "completed"}, *RUNS["workflow_runs"]]}
+    assert preflight.Preflight(FakeClient(answers(**{preflight.workflow_path(SURFACE): (200, newer)})), state, SURFACE).plan([ENTRY]) == {}
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    monkeypatch.setattr(preflight, "ROOT", tmp_path)
+    monkeypatch.setattr(preflight, "STATE_FILE", tmp_path / "tmp" / "preflight" / "state.json")
+    monkeypatch.setattr(preflight, "PENDING_FILE", tmp_path / "tmp" / "preflight" / "pending.json")
+    monkeypatch.setattr(preflight.RATE_LIMIT, "load", lambda *args, **kwargs: None)
+    monkeypatch.setattr(preflight.RATE_LIMIT, "save", lambda *args, **kwargs: None)
+    monkeypatch.setattr(preflight, "surface_repo", lambda: SURFACE)
+    monkeypatch.setattr(preflight, "GitHubClient", lambda *args, **kwargs: FakeClient(answers()))
+
+    class Index:
+        def registry(self):
+            return iter([ENTRY])
+
+    monkeypatch.setattr(preflight, "load_index", lambda write=True: Index())
+    output = tmp_path / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+
+    def run(*args):
+        output.write_text("", encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["change_preflight.py", *args])
+        assert preflight.main() == 0
+        return output.read_text(encoding="utf-8").strip()
+
+    return run
+
+
+def test_unchanged_repo_reports_quiet_after_accept(cli):
+    assert cli("check", "--record") == "quiet=false"
+    assert preflight.PENDING_FILE.exists()
+    assert not preflight.STATE_FILE.exists()
+
+    cli("accept")
+    assert preflight.STATE_FILE.exists()
+    assert not preflight.PENDING_FILE.exists()
+
+    assert cli("check", "--record") == "quiet=true"
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+
+import dispatch_workflows
+import github_client
+
+SETTINGS = {"retry_attempts": 3, "retry_delay_seconds": 0, "timeout_seconds": 60}
+TARGETS = [{"owner": "me", "name": name} for name in ("alpha", "beta")]
+
+
+class FakeClient:
+    """Stands in for GitHubClient; replays scripted statuses and records each POST's timeout."""
+
+    authenticated = True
+
+    def __init__(self, statuses, delay=0.0):
+        self.statuses = list(statuses)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.timeouts = []
+        self.finished = 0
+        self.closed_after = None
+
+    def __call__(self, token=None, pool_size=None):
+        return self
+
+    def post(self, path, payload, timeout=15):
+        with self.lock:
+            self.timeouts.append(timeout)
+            status = self.statuses.pop(0) if self.statuses else 204
+        time.sleep(self.delay)
+        with self.lock:
+            self.finished += 1
+        return status, None, None if status in (200, 204) else f"HTTP {status}"
+
+    def close(self):
+        self.closed_after = self.finished
+
+
+def dispatch(monkeypatch, fake, targets=TARGETS, deadline=5.0):
+    monkeypatch.setattr(dispatch_workflows, "GitHubClient", fake)
+    monkeypatch.setattr(dispatch_workflows, "RATE_LIMIT", github_client.RateLimit())
+    return asyncio.run(
+        dispatch_workflows.dispatch_all(targets, "ci.yml", settings=SETTINGS, deadline=deadline, concurrency=2)
+    )
+
+
+def test_retries_use_the_time_left_before_the_deadline(monkeypatch):
+    fake = FakeClient([503, 502], delay=0.05)
+
+    [result] = dispatch(monkeypatch, fake, targets=TARGETS[:1], deadline=5.0)
+
+    assert (result.status, result.attempts) == ("dispatched", 3)
+    assert all(timeout <= 5.0 for timeout in fake.timeouts)
+    assert fake.timeouts == sorted(fake.timeouts, reverse=True) and fake.timeouts[0] > fake.timeouts[-1]
+
+
+def test_deadline_reports_timeout_without_a_late_post(monkeypatch):
+    fake = FakeClient([503, 503, 503], delay=0.2)
+
+    [result] = dispatch(monkeypatch, fake, targets=TARGETS[:1], deadline=0.1)
+
+    assert result.status == "timeout" and result.attempts == 1
+    assert len(fake.timeouts) == fake.finished == 1
+    assert fake.closed_after == 1
+
+
+def test_non_transient_failures_are_not_retried(monkeypatch):
+    fake = FakeClient([404])
+
+    [result] = dispatch(monkeypatch, fake, targets=TARGETS[:1])
+
+    assert (result.status, result.http_status, result.attempts) == ("failed", 404, 1)
+
+
+def test_client_closes_after_every_post_finished(monkeypatch):
+    fake = FakeClient([], delay=0.05)
+
+    results = dispatch(monkeypatch, fake)
+
+    assert [item.repo for item in results] == ["me/alpha", "me/beta"]
+    assert all(item.ok for item in results)
+    assert fake.closed_after == 2
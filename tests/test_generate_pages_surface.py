@@ -0,0 +1,183 @@
+import base64
+import hashlib
+import json
+import sys
+
+import pytest
+
+import generate_pages_surface as pages
+import minify_surface
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site"
+    monkeypatch.setattr(pages, "ROOT", tmp_path)
+    monkeypatch.setattr(pages, "METRICS_JSON", tmp_path / "metrics" / "github_telemetry.json")
+    monkeypatch.setattr(pages, "OUTPUT_HTML", tmp_path / "index.html")
+    monkeypatch.setattr(pages, "SITE_DIR", site_dir)
+    monkeypatch.setattr(pages, "SITE_ASSETS", site_dir / "assets")
+    monkeypatch.setattr(pages, "SITE_MANIFEST", site_dir / "manifest.json")
+    monkeypatch.setattr(pages, "SEARCH_JSON", site_dir / "search.json")
+    monkeypatch.setattr(pages, "SITE_CHUNKS", site_dir / "chunks")
+    monkeypatch.setattr(minify_surface, "ROOT", tmp_path)
+    monkeypatch.setattr(minify_surface, "MANIFEST", tmp_path / "dist" / "build-manifest.json")
+    return tmp_path
+
+
+def use_projects(monkeypatch, count):
+    projects = [{"id": f"proj-{n:03d}", "name": f"Project {n}", "status": "ACTIVE"} for n in range(count)]
+    monkeypatch.setattr(pages, "load_projects", lambda dry_run=False: projects)
+
+
+def run(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["generate_pages_surface.py", *args])
+    assert pages.main() == 0
+    summary = [line for line in capsys.readouterr().out.splitlines() if line.startswith("SUMMARY:")][0]
+    return dict(part.split("=", 1) for part in summary.split()[1:])
+
+
+def manifest(root):
+    return json.loads((root / "site" / "manifest.json").read_text(encoding="utf-8"))
+
+
+def test_paged_output_splits_listing_and_details(site, monkeypatch, capsys):
+    use_projects(monkeypatch, pages.PAGE_SIZE + 1)
+    summary = run(monkeypatch, capsys)
+
+    assert summary["pages"] == str(2 + pages.PAGE_SIZE + 1)
+    assert (site / "index.html").exists()
+    assert (site / "site" / "page" / "2.html").exists()
+    assert not (site / "site" / "page" / "3.html").exists()
+    assert len(list((site / "site" / "projects").glob("*.html"))) == pages.PAGE_SIZE + 1
+
+    detail = manifest(site)["pages"]["site/projects/proj-024.html"]
+    assert detail["kind"] == "detail"
+    assert 'href="../page/2.html"' in (site / "site" / "projects" / "proj-024.html").read_text(encoding="utf-8")
+
+
+def test_paged_output_is_incremental(site, monkeypatch, capsys):
+    use_projects(monkeypatch, 3)
+    run(monkeypatch, capsys)
+
+    again = run(monkeypatch, capsys)
+    assert again["rewritten"] == "0"
+
+    use_projects(monkeypatch, 2)
+    run(monkeypatch, capsys)
+    assert not (site / "site" / "projects" / "proj-002.html").exists()
+    assert "site/projects/proj-002.html" not in manifest(site)["pages"]
+
+
+def test_colliding_slugs_get_distinct_detail_pages(site, monkeypatch, capsys):
+    projects = [{"id": "foo-bar", "name": "Dashed"}, {"id": "Foo Bar", "name": "Spaced"}, {"id": "FOO_bar", "name": "Other"}]
+    monkeypatch.setattr(pages, "load_projects", lambda dry_run=False: projects)
+    run(monkeypatch, capsys)
+
+    slugs = {view["id"]: view["slug"] for view in pages.project_views(projects, {})}
+    details = sorted(path.stem for path in (site / "site" / "projects").glob("*.html"))
+
+    assert len(set(slugs.values())) == 3
+    assert details == sorted(slugs.values())
+    assert slugs["foo-bar"] == "foo-bar"
+    assert slugs == {view["id"]: view["slug"] for view in pages.project_views(list(reversed(projects)), {})}
+
+
+def members(encoded, size):
+    data = base64.b64decode(encoded)
+    return [n for n in range(size) if data[n >> 3] & (1 << (n & 7))]
+
+
+FACETED = [
+    {"id": f"p{n:02d}", "name": f"Tool {n}", "status": status, "domain": domain, "language": language}
+    for n, (status, domain, language) in enumerate(
+        [
+            ("SHIP", "infra", "Python"),
+            ("BUILD", "infra", "Go"),
+            ("SHIP", "design", "Python"),
+            ("DESIGN", "infra", "Rust"),
+            ("SHIP", "ops", "Go"),
+            ("BUILD", "ops", "Python"),
+            ("SHIP", "infra", "Python"),
+            ("ARCHIVE", "design", "Go"),
+            ("SHIP", "ops", "Rust"),
+        ]
+    )
+]
+
+
+def test_facet_bitsets_match_a_linear_scan():
+    views = pages.project_views(FACETED, {})
+    index = pages.build_search_index(views)
+    size = len(views)
+
+    assert [doc[0] for doc in index["docs"]] == [view["name"] for view in views]
+    for facet in pages.SEARCH_FACETS:
+        assert set(index["facets"][facet]) == {str(view[facet]) for view in views}
+        for value, encoded in index["facets"][facet].items():
+            assert len(base64.b64decode(encoded)) == (size + 7) // 8
+            assert members(encoded, size) == [n for n, view in enumerate(views) if str(view[facet]) == value]
+
+
+def test_search_tokens_post_ascending_doc_numbers():
+    views = pages.project_views(FACETED, {})
+    index = pages.build_search_index(views)
+
+    assert index["tokens"]["tool"] == list(range(len(views)))
+    assert index["tokens"]["p03"] == [3]
+    assert index["tokens"]["rust"] == [3, 8]
+    assert index["docs"][3][1] == "projects/p03.html"
+
+
+def test_search_index_is_kept_when_bytes_are_unchanged(site, monkeypatch, capsys):
+    monkeypatch.setattr(pages, "load_projects", lambda dry_run=False: FACETED)
+    run(monkeypatch, capsys)
+    search = site / "site" / "search.json"
+    before = search.stat().st_mtime_ns
+
+    run(monkeypatch, capsys)
+    assert search.stat().st_mtime_ns == before
+    assert json.loads(search.read_text(encoding="utf-8")) == pages.build_search_index(pages.project_views(FACETED, {}))
+
+
+def test_grid_script_only_in_virtual_mode(site, monkeypatch, capsys):
+    use_projects(monkeypatch, 3)
+    run(monkeypatch, capsys)
+    assert "grid.js" not in manifest(site)["assets"]
+    assert not list((site / "site" / "assets").glob("grid.*.js"))
+
+    run(monkeypatch, capsys, "--grid", "virtual")
+    assert "grid.js" in manifest(site)["assets"]
+    assert list((site / "site" / "assets").glob("grid.*.js"))
+
+    run(monkeypatch, capsys)
+    assert not list((site / "site" / "assets").glob("grid.*.js"))
+
+
+def test_virtual_grid_inlines_the_first_screen_and_chunks_the_rest(site, monkeypatch, capsys):
+    total = pages.CHUNK_SIZE + 5
+    use_projects(monkeypatch, total)
+    run(monkeypatch, capsys, "--grid", "virtual")
+
+    index = (site / "index.html").read_text(encoding="utf-8")
+    chunks = sorted((site / "site" / "chunks").iterdir())
+    cards = [card for path in chunks for card in json.loads(path.read_text(encoding="utf-8"))["cards"]]
+
+    assert index.count('class="sys-card"') == pages.FIRST_SCREEN
+    assert f'data-total="{total}"' in index
+    assert len(chunks) == 2
+    assert len(cards) == total
+    assert not (site / "site" / "page").exists()
+
+
+def test_hashed_assets_match_their_names_after_minify(site, monkeypatch, capsys):
+    use_projects(monkeypatch, 3)
+    run(monkeypatch, capsys, "--grid", "virtual")
+
+    monkeypatch.setattr(sys, "argv", ["minify_surface.py"])
+    assert minify_surface.main() == 0
+
+    hashed = [path for path in (site / "site" / "assets").iterdir() if path.suffix in (".css", ".js")]
+    assert len(hashed) == 3
+    for path in hashed:
+        assert path.name.split(".")[1] == hashlib.sha256(path.read_bytes()).hexdigest()[:12]
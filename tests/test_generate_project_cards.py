@@ -0,0 +1,203 @@
+import json
+import re
+import sys
+
+import pytest
+
+import build_readme
+import generate_project_cards as cards
+
+
+@pytest.fixture
+def surface(tmp_path, monkeypatch):
+    projects = tmp_path / "assets" / "projects"
+    monkeypatch.setattr(cards, "ROOT", tmp_path)
+    monkeypatch.setattr(cards, "METRICS_JSON", tmp_path / "metrics" / "metrics.json")
+    monkeypatch.setattr(cards, "AGGREGATE_JSON", tmp_path / "metrics" / "aggregate.json")
+    monkeypatch.setattr(cards, "PROJECTS_DIR", projects)
+    monkeypatch.setattr(cards, "INDEX_JSON", projects / "index.json")
+    monkeypatch.setattr(cards, "INDEX_JSONL", projects / "index.jsonl")
+    monkeypatch.setattr(cards, "ATLAS_SVG", projects / "atlas.svg")
+    monkeypatch.setattr(cards, "INDEX_DIR", projects / "index")
+    monkeypatch.setattr(cards, "INDEX_HEAD", projects / "index" / "head.json")
+    return tmp_path
+
+
+def write_metrics(root, *repos):
+    path = root / "metrics" / "metrics.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    records = [{"full_name": name, "stars": stars, "status": "tracked"} for name, stars in repos]
+    path.write_text(json.dumps({"repositories": records}), encoding="utf-8")
+
+
+def run(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["generate_project_cards.py", *args])
+    assert cards.main() == 0
+    summary = [line for line in capsys.readouterr().out.splitlines() if line.startswith("SUMMARY:")][0]
+    return dict(part.split("=", 1) for part in summary.split()[1:])
+
+
+def card(root, full_name):
+    return root / "assets" / "projects" / f"{cards.slugify(full_name)}.svg"
+
+
+def test_unchanged_cards_are_cache_hits(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    assert run(monkeypatch, capsys)["rendered"] == "2"
+
+    second = run(monkeypatch, capsys)
+    assert second["rendered"] == "0"
+    assert second["cached"] == "2"
+
+
+def test_unchanged_index_is_not_rewritten(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5))
+    run(monkeypatch, capsys)
+    index = surface / "assets" / "projects" / "index.json"
+    before = index.stat().st_mtime_ns
+
+    monkeypatch.setattr(sys, "argv", ["generate_project_cards.py"])
+    cards.main()
+    assert "UNCHANGED:" in capsys.readouterr().out
+    assert index.stat().st_mtime_ns == before
+
+
+def test_changed_card_is_rerendered(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    run(monkeypatch, capsys)
+
+    write_metrics(surface, ("me/alpha", 6), ("me/beta", 3))
+    assert run(monkeypatch, capsys)["rendered"] == "1"
+
+
+def test_missing_svg_is_rerendered(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    run(monkeypatch, capsys)
+
+    card(surface, "me/beta").unlink()
+    assert run(monkeypatch, capsys)["rendered"] == "1"
+    assert card(surface, "me/beta").exists()
+
+
+def test_template_version_and_force_invalidate_the_cache(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    run(monkeypatch, capsys)
+
+    assert run(monkeypatch, capsys, "--force")["rendered"] == "2"
+
+    monkeypatch.setattr(cards, "CARD_TEMPLATE_VERSION", cards.CARD_TEMPLATE_VERSION + "-next")
+    assert run(monkeypatch, capsys)["rendered"] == "2"
+    assert run(monkeypatch, capsys)["rendered"] == "0"
+
+
+def test_dropped_repo_card_is_removed(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    run(monkeypatch, capsys)
+    assert card(surface, "me/beta").exists()
+
+    write_metrics(surface, ("me/alpha", 5))
+    run(monkeypatch, capsys)
+    assert card(surface, "me/alpha").exists()
+    assert not card(surface, "me/beta").exists()
+
+
+def test_index_without_hashes_still_removes_stale_cards(surface, monkeypatch, capsys):
+    # Index written before the card cache: paths only, no "hash".
+    stale = card(surface, "me/gone")
+    kept = card(surface, "me/alpha")
+    stale.parent.mkdir(parents=True)
+    stale.write_text("<svg/>", encoding="utf-8")
+    kept.write_text("<svg/>", encoding="utf-8")
+    index = {"cards": [{"path": f"assets/projects/{p.name}"} for p in (kept, stale)]}
+    (surface / "assets" / "projects" / "index.json").write_text(json.dumps(index), encoding="utf-8")
+
+    write_metrics(surface, ("me/alpha", 5))
+    summary = run(monkeypatch, capsys)
+
+    assert not stale.exists()
+    # A hashless entry is never a cache hit: the old card is re-rendered.
+    assert summary["rendered"] == "1"
+    assert kept.read_text(encoding="utf-8") != "<svg/>"
+
+
+def test_atlas_views_match_index_coordinates(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3), ("me/gamma", 1))
+    run(monkeypatch, capsys, "--atlas")
+
+    atlas = (surface / "assets" / "projects" / "atlas.svg").read_text(encoding="utf-8")
+    index = json.loads((surface / "assets" / "projects" / "index.json").read_text(encoding="utf-8"))
+    views = re.findall(r'<view id="([^"]+)" viewBox="0 (\d+) 760 240"/>', atlas)
+
+    assert views == [(item["atlas"]["fragment"], str(item["atlas"]["y"])) for item in index["cards"]]
+    assert [fragment for fragment, _ in views] == ["card-me__alpha", "card-me__beta", "card-me__gamma"]
+    assert atlas.count("<defs>") == 1
+    assert atlas.count('transform="translate(0 ') == 3
+    assert index["sprite"]["count"] == 3
+
+
+def test_single_cards_are_unchanged_by_atlas(surface, monkeypatch, capsys):
+    write_metrics(surface, ("me/alpha", 5))
+    run(monkeypatch, capsys)
+    single = card(surface, "me/alpha").read_text(encoding="utf-8")
+
+    run(monkeypatch, capsys, "--atlas", "--force")
+    assert card(surface, "me/alpha").read_text(encoding="utf-8") == single
+
+
+def test_readme_links_atlas_fragments_until_atlas_is_dropped(surface, monkeypatch, capsys):
+    monkeypatch.setattr(build_readme, "ROOT", surface)
+    write_metrics(surface, ("me/alpha", 5))
+    run(monkeypatch, capsys, "--atlas")
+
+    assert [item["src"] for item in build_readme.load_project_cards()] == ["assets/projects/atlas.svg#card-me__alpha"]
+
+    run(monkeypatch, capsys)
+    assert not (surface / "assets" / "projects" / "atlas.svg").exists()
+    assert [item["src"] for item in build_readme.load_project_cards()] == ["assets/projects/me__alpha.svg"]
+
+
+def read_json(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_index_is_sharded_at_page_size(surface, monkeypatch, capsys):
+    monkeypatch.setattr(cards, "INDEX_PAGE_SIZE", 2)
+    monkeypatch.setattr(cards, "INDEX_HEAD_LIMIT", 2)
+    index_dir = surface / "assets" / "projects" / "index"
+
+    write_metrics(surface, ("me/a", 1), ("me/b", 5), ("me/c", 3), ("me/d", 4))
+    run(monkeypatch, capsys)
+    head = read_json(index_dir / "head.json")
+    pages = [read_json(index_dir / f"page-{page:04d}.json") for page in range(1, head["pages"] + 1)]
+
+    assert (head["count"], head["pages"], head["page_size"]) == (4, 2, 2)
+    assert not (index_dir / "page-0003.json").exists()
+    assert [page["count"] for page in pages] == [2, 2]
+    assert [item for page in pages for item in page["cards"]] == read_json(surface / "assets/projects/index.json")["cards"]
+    assert [item["full_name"] for item in head["cards"]] == ["me/b", "me/d"]
+    assert all(item["exists"] for item in head["cards"])
+
+    write_metrics(surface, ("me/a", 1), ("me/b", 5), ("me/c", 3), ("me/d", 4), ("me/e", 2))
+    run(monkeypatch, capsys)
+    grown = read_json(index_dir / "head.json")
+    assert (grown["pages"], read_json(index_dir / "page-0003.json")["count"]) == (3, 1)
+    assert grown["pages_hash"] != head["pages_hash"]
+
+    write_metrics(surface, ("me/b", 5))
+    run(monkeypatch, capsys)
+    assert read_json(index_dir / "head.json")["pages"] == 1
+    assert sorted(path.name for path in index_dir.iterdir()) == ["head.json", "page-0001.json"]
+
+
+def test_readme_reads_cards_from_the_head(surface, monkeypatch, capsys):
+    monkeypatch.setattr(cards, "INDEX_PAGE_SIZE", 1)
+    monkeypatch.setattr(build_readme, "ROOT", surface)
+    write_metrics(surface, ("me/alpha", 5), ("me/beta", 3))
+    run(monkeypatch, capsys)
+    (surface / "assets/projects/index.json").unlink()
+
+    head = build_readme.load_project_cards_head()
+    assert [item["full_name"] for item in build_readme.load_project_cards(head=head)] == ["me/alpha", "me/beta"]
+    manifest = build_readme.project_cards_manifest(head)
+    assert (manifest["index"], manifest["count"]) == (build_readme.PROJECT_CARDS_HEAD, 2)
+    assert (manifest["pages"]["count"], manifest["pages"]["hash"]) == (2, head["pages_hash"])
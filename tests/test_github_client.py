@@ -0,0 +1,82 @@
+import http.client
+
+import pytest
+
+import github_client
+
+
+class FakeResponse:
+    status = 200
+    will_close = False
+
+    def __init__(self, body=b'{"ok": true}'):
+        self.body = body
+        self.headers = http.client.HTTPMessage()
+
+    def read(self):
+        return self.body
+
+
+class FakeConnection:
+    """Fails with RemoteDisconnected while `drops` is positive; counts every request."""
+
+    drops = 0
+    sent: list[str] = []
+
+    def __init__(self, host, timeout=None):
+        self.sock = None
+        self.timeout = timeout
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        FakeConnection.sent.append(method)
+
+    def getresponse(self):
+        if FakeConnection.drops:
+            FakeConnection.drops -= 1
+            raise http.client.RemoteDisconnected("Remote end closed connection without response")
+        return FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(http.client, "HTTPSConnection", FakeConnection)
+    FakeConnection.sent = []
+    FakeConnection.drops = 0
+    return github_client.GitHubClient(rate_limit=github_client.RateLimit())
+
+
+def test_get_is_retried_on_a_fresh_connection(client):
+    FakeConnection.drops = 1
+    status, body, error = client.get("/repos/me/alpha")
+    assert (status, body, error) == (200, {"ok": True}, None)
+    assert FakeConnection.sent == ["GET", "GET"]
+
+
+def test_post_is_sent_once(client):
+    FakeConnection.drops = 1
+    status, body, error = client.post("/repos/me/alpha/actions/workflows/x.yml/dispatches", {"ref": "main"})
+    assert status == 0 and body is None and "closed" in error
+    assert FakeConnection.sent == ["POST"]
+
+
+def test_retry_gives_up_after_one_fresh_connection(client):
+    FakeConnection.drops = 2
+    status, _, _ = client.get("/repos/me/alpha")
+    assert status == 0
+    assert FakeConnection.sent == ["GET", "GET"]
+
+
+def test_close_leaves_in_use_connections_to_their_request(client):
+    idle, busy = client.acquire(5), client.acquire(5)
+    client.release(idle)
+
+    client.close()
+    assert idle.closed and not busy.closed
+
+    client.release(busy)
+    assert busy.closed
+    assert client.pool.empty()
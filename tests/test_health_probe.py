@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+import health_probe
+from health_probe import Probe
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Patch git() with a counting fake whose HEAD and working tree the test controls."""
+    monkeypatch.setattr(health_probe, "ROOT", tmp_path)
+    monkeypatch.setattr(health_probe, "CACHE_FILE", tmp_path / "tmp/health/probe-cache.json")
+    state = {"head": "a" * 40, "count": 3, "dirty": 1, "calls": []}
+
+    def git(*args):
+        state["calls"].append(args[0])
+        if args[:2] == ("rev-parse", "HEAD"):
+            return state["head"] + "\n"
+        if args[0] == "rev-parse":
+            return "main\n"
+        if args[0] == "rev-list":
+            return f"{state['count']}\n"
+        return " M file\n" * state["dirty"]
+
+    monkeypatch.setattr(health_probe, "git", git)
+    return state
+
+
+def git_probes():
+    names = ("git_branch", "commit_count", "uncommitted_changes")
+    log = health_probe.PipelineLog("health", echo=False, dry_run=True)
+    return [probe for probe in health_probe.probes(log) if probe.name in names]
+
+
+def test_working_tree_is_probed_every_run(repo):
+    values, _ = health_probe.run_probes(git_probes(), ttl=60)
+    assert (values["commit_count"], values["uncommitted_changes"]) == (3, 1)
+
+    repo["dirty"] = 4
+    values, stats = health_probe.run_probes(git_probes(), ttl=60)
+
+    assert values["uncommitted_changes"] == 4
+    assert stats["uncommitted_changes"]["cached"] is False
+    assert stats["commit_count"]["cached"] is True
+
+
+def test_git_cache_is_keyed_by_head(repo):
+    health_probe.run_probes(git_probes(), ttl=60)
+
+    repo["head"], repo["count"] = "b" * 40, 4
+    values, stats = health_probe.run_probes(git_probes(), ttl=60)
+
+    assert values["commit_count"] == 4
+    assert stats["commit_count"]["cached"] is False
+    assert repo["calls"].count("rev-list") == 2
+
+
+def test_slow_probe_times_out_on_a_daemon_thread():
+    release = threading.Event()
+    slow = Probe("slow", lambda: release.wait(5), lambda status: status, timeout=0.1)
+    quick = Probe("quick", lambda: "done", lambda status: status)
+
+    started = time.monotonic()
+    values, stats = health_probe.run_probes([slow, quick], ttl=0)
+
+    assert time.monotonic() - started < 1
+    assert values == {"slow": "timeout", "quick": "done"}
+    assert stats["slow"]["status"] == "timeout"
+    assert all(thread.daemon for thread in threading.enumerate() if thread.name == "probe-slow")
+    release.set()
+
+
+def test_failing_probe_reports_error():
+    values, stats = health_probe.run_probes([Probe("broken", lambda: 1 / 0, lambda status: status)], ttl=0)
+
+    assert values["broken"] == "error"
+    assert stats["broken"]["status"] == "error"
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+import build_readme
+import host_sampler
+from host_sampler import MAX_AGE, MAX_GAP, SampleRing
+
+
+@pytest.fixture
+def proc(tmp_path, monkeypatch):
+    """Write fixed /proc counter files under tmp_path and point the sampler at them."""
+    monkeypatch.setattr(host_sampler, "PROC", tmp_path / "proc")
+    monkeypatch.setattr(host_sampler, "SAMPLES_FILE", tmp_path / "tmp/host/samples.json")
+    (tmp_path / "proc/net").mkdir(parents=True)
+
+    def write(busy, idle, ticks, rx, tx, available=400):
+        root = tmp_path / "proc"
+        # user nice system idle iowait irq softirq steal guest guest_nice
+        (root / "stat").write_text(f"cpu  {busy} 0 0 {idle} 0 0 0 0 50 0\ncpu0 1 2 3 4\n", encoding="ascii")
+        (root / "meminfo").write_text(
+            f"MemTotal:       1000 kB\nMemFree:         100 kB\nMemAvailable:    {available} kB\n", encoding="ascii"
+        )
+        (root / "diskstats").write_text(
+            f"   8       0 sda 1 2 3 4 5 6 7 8 0 {ticks} 0\n   8       1 sda1 1 2 3 4 5 6 7 8 0 99999 0\n",
+            encoding="ascii",
+        )
+        (root / "net/dev").write_text(
+            "Inter-|   Receive\n face |bytes packets\n"
+            "    lo: 10 5000 0 0 0 0 0 0 10 5000 0 0 0 0 0 0\n"
+            f"  eth0: 10 {rx} 0 0 0 0 0 0 10 {tx} 0 0 0 0 0 0\n",
+            encoding="ascii",
+        )
+
+    return write
+
+
+def counters(at, busy=0, idle=0, ticks=0, packets=0, ram=50.0):
+    return {"at": at, "cpu_total": busy + idle, "cpu_idle": idle, "ram": ram, "disk_ticks": {"sda": ticks}, "packets": packets}
+
+
+def test_counters_are_parsed_from_proc(proc):
+    proc(busy=100, idle=300, ticks=1000, rx=10, tx=20)
+    first = host_sampler.read_counters({"sda"})
+    proc(busy=150, idle=350, ticks=1500, rx=30, tx=40, available=250)
+    second = host_sampler.read_counters({"sda"})
+    first["at"], second["at"] = 100.0, 101.0
+
+    assert (first["cpu_total"], first["cpu_idle"], first["disk_ticks"], first["packets"]) == (400, 300, {"sda": 1000}, 30)
+    assert host_sampler.delta(first, second) == {"at": 101.0, "cpu": 50.0, "ram": 75.0, "io": 50.0, "packets": 40.0}
+
+
+def test_ring_keeps_the_newest_capacity_samples(proc):
+    ring = SampleRing(capacity=3)
+    for step in range(6):
+        ring.record(counters(1000.0 + step, busy=10 * step, idle=10 * step, packets=step))
+
+    assert [sample["at"] for sample in ring.samples] == [1003.0, 1004.0, 1005.0]
+
+    ring.save()
+    reloaded = SampleRing.load()
+    assert reloaded.samples.maxlen == 3
+    assert list(reloaded.samples) == list(ring.samples)
+    assert reloaded.last["at"] == 1005.0
+
+
+def test_counters_past_max_gap_are_not_diffed():
+    ring = SampleRing()
+    ring.record(counters(1000.0))
+
+    later = counters(1000.0 + MAX_GAP + 1, busy=500, idle=500)
+    assert ring.record(later) is None
+    assert ring.last is later
+    assert ring.record(counters(later["at"] + 0.1)) is None
+    assert ring.last is later
+    assert ring.record(counters(later["at"] + 1, busy=600, idle=600)) is not None
+
+
+def test_summary_ignores_samples_older_than_max_age():
+    now = time.time()
+    ring = SampleRing()
+    ring.samples.extend(
+        [
+            {"at": now - MAX_AGE - 5, "cpu": 99.0, "ram": 99.0, "io": 99.0, "packets": 99.0},
+            {"at": now - 2, "cpu": 10.0, "ram": 40.0, "io": 0.0, "packets": 5.0},
+            {"at": now - 1, "cpu": 30.0, "ram": 60.0, "io": 4.0, "packets": 15.0},
+        ]
+    )
+
+    summary = ring.summary()
+    assert summary["samples"] == 2
+    assert summary["cpu"] == {"min": 10.0, "avg": 20.0, "max": 30.0}
+    assert ring.summary(max_age=0.5) is None
+
+
+def test_matrix_skips_range_markers_for_a_single_sample():
+    stats = {"min": 61.0, "avg": 61.0, "max": 61.0}
+    host = {"samples": 1, "window_s": 0.0, "cpu": stats, "ram": stats, "io": stats, "packets": stats}
+
+    single = build_readme.generate_system_matrix_svg("seed", host=host)
+    ranged = build_readme.generate_system_matrix_svg("seed", host=dict(host, samples=2))
+
+    assert "61-61" not in single and 'width="2" height="16"' not in single
+    assert "61-61" in ranged
@@ -0,0 +1,87 @@
+import gzip
+
+import minify_surface
+from minify_surface import minify_html, minify_svg, prune_defs
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <title>Demo</title>
+  <style>
+    body { color: red; }  /* note */
+  </style>
+</head>
+<body>
+  <!-- banner -->
+  <section>
+    <p>Built by <b>one</b>
+      <i>person</i> <a href="#">here</a></p>
+    <pre>  keep
+    this  </pre>
+    <script>if (a < b) {  run();  }</script>
+  </section>
+</body>
+</html>
+"""
+
+CARD = """<svg xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="border"><stop offset="0%"/></linearGradient>
+    <filter id="unused"><feGaussianBlur stdDeviation="3"/></filter>
+  </defs>
+  <rect stroke="url(#border)"/>
+  <text x="1" y="2"><tspan>stars</tspan> <tspan>12</tspan></text>
+</svg>
+"""
+
+
+def test_html_drops_whitespace_only_around_block_tags():
+    out = minify_html(PAGE)
+
+    assert "<html lang=\"en\"><head><title>Demo</title><style>" in out
+    assert "<section><p>Built by <b>one</b> <i>person</i> <a href=\"#\">here</a></p><pre>" in out
+    assert "banner" not in out
+    assert out.endswith("</body></html>\n")
+
+
+def test_html_keeps_raw_blocks_and_minifies_styles():
+    out = minify_html(PAGE)
+
+    assert "<style>body{color:red}</style>" in out
+    assert "<pre>  keep\n    this  </pre>" in out
+    assert "<script>if (a < b) {  run();  }</script>" in out
+
+
+def test_minify_is_idempotent():
+    assert minify_html(minify_html(PAGE)) == minify_html(PAGE)
+    assert minify_svg(minify_svg(CARD)) == minify_svg(CARD)
+
+
+def test_svg_keeps_text_spacing_and_referenced_defs():
+    out = minify_svg(CARD)
+
+    assert '<tspan>stars</tspan> <tspan>12</tspan>' in out
+    assert '<defs><linearGradient id="border"><stop offset="0%"/></linearGradient></defs><rect' in out
+    assert "unused" not in out
+
+
+def test_prune_defs_drops_duplicate_and_empty_blocks():
+    defs = '<defs><filter id="glow"/></defs>'
+    text = f'<svg>{defs}<g>{defs}<circle filter="url(#glow)"/></g><defs><mask id="m"/></defs></svg>'
+
+    assert prune_defs(text) == f'<svg>{defs}<g><circle filter="url(#glow)"/></g></svg>'
+
+
+def test_hashed_assets_are_compressed_but_not_rewritten(tmp_path, monkeypatch):
+    monkeypatch.setattr(minify_surface, "ROOT", tmp_path)
+    asset = tmp_path / "surface.0123456789ab.css"
+    plain = tmp_path / "extra.css"
+    for path in (asset, plain):
+        path.write_text("a { color: red; }\n", encoding="utf-8")
+
+    minify_surface.process(asset)
+    minify_surface.process(plain)
+
+    assert asset.read_text(encoding="utf-8") == "a { color: red; }\n"
+    assert gzip.decompress((tmp_path / "surface.0123456789ab.css.gz").read_bytes()) == asset.read_bytes()
+    assert plain.read_text(encoding="utf-8") == "a{color:red}\n"
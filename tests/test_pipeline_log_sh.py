@@ -0,0 +1,39 @@
+import json
+import subprocess
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "pipeline_log.sh"
+
+
+def run_bash(tmp_path, body):
+    log = tmp_path / "pipeline.jsonl"
+    script = f"""set -euo pipefail
+trap 'echo caller-trap' EXIT
+PLOG_FILE={log}
+. {SCRIPT} demo
+{body}
+"""
+    result = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True)
+    events = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()] if log.exists() else []
+    return result.stdout, events
+
+
+def test_sourcing_keeps_the_callers_exit_trap(tmp_path):
+    stdout, events = run_bash(tmp_path, 'plog INFO "hello"\nplog_flush')
+    assert stdout.strip() == "caller-trap"
+    assert [event["msg"] for event in events] == ["hello"]
+    assert events[0]["stage"] == "demo"
+
+
+def test_marks_report_elapsed_ms(tmp_path):
+    _, events = run_bash(tmp_path, 'plog_mark "build step"\nplog INFO "built" "build step"\nplog INFO "plain" missing\nplog_flush')
+    assert "ms" in events[0]
+    assert "ms" not in events[1]
+
+
+def test_fallback_without_epochrealtime(tmp_path):
+    body = 'PLOG_FAST=0\nunset EPOCHREALTIME\nplog_mark build\nplog INFO "slow path" build\nplog_flush'
+    _, events = run_bash(tmp_path, body)
+    assert events[0]["msg"] == "slow path"
+    assert events[0]["ts"].endswith(".000+00:00")
+    assert events[0]["ms"] == 0
@@ -0,0 +1,113 @@
+import json
+import threading
+
+import pytest
+
+import pipeline_trace
+from pipeline_trace import Tracer, self_times
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    tracer.enabled = True
+    tracer.registered = True  # export is called by the test, not at exit
+    return tracer
+
+
+def spans(tracer):
+    return {event["name"]: event for event in tracer.events if event["ph"] == "X"}
+
+
+def complete(name, ts, dur, tid=1):
+    return {"ph": "X", "name": name, "ts": ts, "dur": dur, "pid": 1, "tid": tid, "args": {}}
+
+
+def test_nested_spans_sit_inside_their_parent(tracer):
+    with tracer.span("build", cat="build") as attrs:
+        with tracer.span("render", bytes=10):
+            with tracer.span("write"):
+                pass
+        attrs["outputs"] = 2
+
+    events = spans(tracer)
+    build, render, write = events["build"], events["render"], events["write"]
+
+    assert build["tid"] == render["tid"] == write["tid"]
+    assert build["ts"] <= render["ts"] <= write["ts"]
+    assert write["ts"] + write["dur"] <= render["ts"] + render["dur"] <= build["ts"] + build["dur"]
+    assert (build["args"], render["args"]) == ({"outputs": 2}, {"bytes": 10})
+
+    rows = {event["name"]: (self_ms, total_ms) for self_ms, total_ms, event in self_times(list(events.values()))}
+    assert rows["build"][0] == pytest.approx((build["dur"] - render["dur"]) / 1000)
+    assert rows["render"][0] == pytest.approx((render["dur"] - write["dur"]) / 1000)
+
+
+def test_worker_threads_get_their_own_lanes(tracer):
+    def work():
+        with tracer.span("worker"):
+            pass
+
+    with tracer.span("main"):
+        thread = threading.Thread(target=work, name="pool-1")
+        thread.start()
+        thread.join()
+
+    events = spans(tracer)
+    names = {event["tid"]: event["args"]["name"] for event in tracer.events if event["name"] == "thread_name"}
+    assert events["main"]["tid"] != events["worker"]["tid"]
+    assert names[events["worker"]["tid"]] == "pool-1"
+
+    rows = {event["name"]: self_ms for self_ms, _, event in self_times(list(events.values()))}
+    assert rows["main"] == pytest.approx(events["main"]["dur"] / 1000)
+
+
+def test_self_time_subtracts_only_direct_children():
+    events = [
+        complete("root", 0, 1000),
+        complete("child", 100, 400),
+        complete("grandchild", 150, 100),
+        complete("sibling", 600, 300),
+        complete("other-lane", 0, 2000, tid=2),
+    ]
+
+    rows = {event["name"]: (self_ms, total_ms) for self_ms, total_ms, event in self_times(events)}
+
+    assert rows["root"] == (0.3, 1.0)
+    assert rows["child"] == (0.3, 0.4)
+    assert rows["grandchild"] == (0.1, 0.1)
+    assert rows["sibling"] == (0.3, 0.3)
+    assert rows["other-lane"] == (2.0, 2.0)
+
+
+def test_errors_are_recorded_on_the_span(tracer):
+    with pytest.raises(KeyError):
+        with tracer.span("lookup"):
+            raise KeyError("missing")
+
+    assert spans(tracer)["lookup"]["args"] == {"error": "KeyError"}
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    tracer.enabled = False
+
+    with tracer.span("quiet", path="/x") as attrs:
+        attrs["bytes"] = 3
+
+    assert tracer.events == [] and tracer.export() is None
+
+
+def test_export_writes_one_fragment_per_process(tracer, tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_trace, "TRACE_DIR", tmp_path / "trace")
+    monkeypatch.setenv("PIPELINE_RUN_ID", "run-1")
+    tracer.stage = "build_readme"
+    with tracer.span("build"):
+        pass
+
+    path = tracer.export()
+
+    assert path.parent == tmp_path / "trace" / "run-1" and path.name.startswith("build_readme-")
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert events[0]["args"] == {"name": "build_readme"}
+    assert [event["name"] for event in events if event["ph"] == "X"] == ["build"]
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import registry_index
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_index, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "INDEX_JSON", tmp_path / "dist" / "registry-index.json")
+
+    def write(registry, projects):
+        for rel, payload in ((registry_index.REGISTRY_SOURCE, registry), (registry_index.PROJECTS_SOURCE, projects)):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload), encoding="utf-8")
+
+    return write
+
+
+def test_registry_accepts_every_name_alias(sources):
+    sources(
+        {
+            "repositories": [
+                {"full_name": "me/alpha"},
+                {"repo": "me/beta"},
+                {"slug": "https://github.com/me/gamma"},
+                {"name": "delta", "owner": "me"},
+                "epsilon",
+            ]
+        },
+        [],
+    )
+    index = registry_index.load_index(write=False)
+
+    names = sorted(entry["full_name"] for entry in index.registry())
+    assert names == sorted(["me/alpha", "me/beta", "me/gamma", "me/delta", f"{registry_index.DEFAULT_OWNER}/epsilon"])
+    assert index.warnings == []
+
+
+def test_duplicate_registry_repo_is_dropped(sources):
+    sources({"repositories": [{"full_name": "me/alpha"}, {"repo": "ME/Alpha"}]}, [])
+    index = registry_index.load_index(write=False)
+
+    assert len(list(index.registry())) == 1
+    assert index.warnings == [f"{registry_index.REGISTRY_SOURCE}[1]: duplicate me/alpha"]
+
+
+def test_projects_sharing_a_repo_are_all_kept(sources):
+    sources(
+        {"repositories": [{"full_name": "me/mono", "enabled": True}]},
+        {
+            "projects": [
+                {"id": "mono-api", "repo": "https://github.com/me/mono"},
+                {"id": "mono-web", "repo": "https://github.com/me/mono"},
+            ]
+        },
+    )
+    index = registry_index.load_index(write=False)
+
+    assert [project["id"] for project in index.projects()] == ["mono-api", "mono-web"]
+    assert len(index.by_full_name["me/mono"]) == 3
+    assert index.get("me/mono")["sources"] == [registry_index.REGISTRY_SOURCE]
+    assert index.get("mono-web")["project"]["id"] == "mono-web"
+    assert index.repository("mono-web")["full_name"] == "me/mono"
+    assert index.warnings == []
+
+
+def test_projects_are_deduplicated_by_id(sources):
+    sources(
+        [],
+        [
+            {"id": "alpha", "repo": "me/alpha"},
+            {"id": "Alpha", "repo": "me/other"},
+        ],
+    )
+    index = registry_index.load_index(write=False)
+
+    assert [project["repo"] for project in index.projects()] == ["me/alpha"]
+    assert index.warnings == [f"{registry_index.PROJECTS_SOURCE}[1]: duplicate id Alpha"]
+    assert index.repository("alpha") is None
+
+
+def test_index_is_reused_until_a_source_changes(sources):
+    sources({"repositories": ["me/alpha"]}, [])
+    first = registry_index.load_index()
+    assert registry_index.INDEX_JSON.exists()
+
+    assert registry_index.load_index().fingerprint == first.fingerprint
+
+    sources({"repositories": ["me/alpha", "me/beta"]}, [])
+    assert registry_index.load_index().fingerprint != first.fingerprint
@@ -0,0 +1,55 @@
+import argparse
+import re
+
+import pytest
+
+import build_readme
+import generate_project_cards as cards
+import render_profile
+from repo_record import RepoRecord
+
+FILTER = re.compile(r"<filter\b|filter=\"url\(")
+
+PANELS = [
+    lambda profile: build_readme.generate_flow_line_svg("abc123", profile),
+    lambda profile: build_readme.generate_quote_svg("stay curious", profile),
+    lambda profile: build_readme.generate_health_svg({"build": "ok"}, profile),
+    lambda profile: build_readme.generate_system_matrix_svg("abc123", profile),
+    lambda profile: build_readme.generate_metrics_svg([RepoRecord.from_json({"full_name": "me/alpha", "stars": 3})], profile),
+    lambda profile: cards.svg_card(RepoRecord.from_json({"full_name": "me/alpha", "stars": 3, "status": "tracked"}), profile=profile),
+]
+
+
+@pytest.mark.parametrize("render", PANELS)
+def test_lite_panels_have_no_filters(render):
+    assert FILTER.search(render("full"))
+    assert not FILTER.search(render("lite"))
+
+
+def test_lite_helpers_bake_the_glow_as_a_wider_layer():
+    halo, dot = re.findall(r"<circle [^>]*/>", render_profile.glow_circle("lite", 10, 20, 5, "#fff"))
+
+    assert f'r="{5 + render_profile.HALO_SPREAD}"' in halo
+    assert f'opacity="{render_profile.HALO_OPACITY}"' in halo
+    assert dot == '<circle cx="10" cy="20" r="5" fill="#fff"/>'
+    assert render_profile.filter_defs("lite", "<filter/>") == ""
+
+
+def test_profile_defaults_from_the_environment(monkeypatch):
+    monkeypatch.setenv(render_profile.PROFILE_ENV, " LITE ")
+    assert render_profile.default_profile() == "lite"
+
+    monkeypatch.setenv(render_profile.PROFILE_ENV, "fancy")
+    assert render_profile.default_profile() == "full"
+
+    parser = argparse.ArgumentParser()
+    monkeypatch.setenv(render_profile.PROFILE_ENV, "lite")
+    render_profile.add_profile_argument(parser)
+    assert parser.parse_args([]).profile == "lite"
+
+
+def test_switching_profile_invalidates_cached_cards():
+    trace = cards.card_trace({"full_name": "me/alpha"})
+
+    assert cards.card_hash(trace) == cards.card_hash(trace, "full")
+    assert cards.card_hash(trace, "lite") != cards.card_hash(trace)
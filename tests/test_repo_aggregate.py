@@ -0,0 +1,65 @@
+import random
+
+import collect_repo_metrics
+from repo_aggregate import RepoAggregator, TopK, top_repos
+from repo_record import RepoRecord
+
+
+def repo(name, stars, status="tracked", **fields):
+    return RepoRecord.from_json({"full_name": f"me/{name}", "stars": stars, "status": status, **fields})
+
+
+def names(repos):
+    return [item.full_name for item in repos]
+
+
+TIED = [repo(name, stars) for name, stars in zip("qwertyuiopasdfgh", [3, 1, 3, 0, 5, 3, 1, 5, 0, 2, 3, 3, 1, 5, 2, 0])]
+
+
+def test_topk_matches_a_full_sort_with_ties():
+    for limit in (1, 3, 5, 8, len(TIED), len(TIED) + 4):
+        for seed in range(5):
+            shuffled = list(TIED)
+            random.Random(seed).shuffle(shuffled)
+            assert names(top_repos(shuffled, limit)) == names(sorted(TIED, key=RepoRecord.sort_key)[:limit])
+
+
+def test_topk_evicts_the_worst_entry():
+    top = TopK(2)
+    for item in (repo("low", 1), repo("mid", 5), repo("high", 9), repo("zero", 0)):
+        top.push(item)
+    assert names(top.items()) == ["me/high", "me/mid"]
+
+
+def test_topk_limit_zero_keeps_nothing():
+    top = TopK(0)
+    top.push(repo("alpha", 10))
+    assert top.items() == []
+    assert TopK(-3).items() == []
+
+
+def test_aggregator_counts_tracked_repos_only():
+    stats = RepoAggregator(top_limit=2).consume(
+        [
+            repo("alpha", 4, forks=2, open_issues=1, language="Python"),
+            repo("beta", 6, language="python"),
+            repo("gamma", 9, status="unavailable"),
+            repo("delta", 1),
+        ]
+    )
+    assert (stats.repo_count, stats.tracked_count, stats.unavailable_count) == (4, 3, 1)
+    assert (stats.total_stars, stats.total_forks, stats.total_open_issues) == (11, 2, 1)
+    assert stats.sorted_languages() == {"Python": 1, "python": 1, "Unknown": 1}
+    assert names(stats.top()) == ["me/beta", "me/alpha"]
+
+
+def test_passthrough_yields_every_record_while_counting():
+    stats = RepoAggregator()
+    assert names(stats.passthrough(TIED)) == names(TIED)
+    assert stats.repo_count == len(TIED)
+
+
+def test_aggregate_and_readme_panel_agree_on_order():
+    aggregate = collect_repo_metrics.aggregate_metrics(TIED)
+    panel = sorted(TIED, key=RepoRecord.sort_key)[:8]
+    assert [item["full_name"] for item in aggregate["top_repos"]] == names(panel)
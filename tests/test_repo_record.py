@@ -0,0 +1,74 @@
+import collect_repo_metrics
+from repo_record import DEFAULT_OWNER, RepoRecord
+
+
+def test_registry_string_splits_owner_and_name():
+    record = RepoRecord.from_json(" me/alpha ")
+    assert (record.owner, record.name, record.full_name) == ("me", "alpha", "me/alpha")
+    assert record.html_url == "https://github.com/me/alpha"
+    assert record.status is None and record.stars == 0
+
+
+def test_bare_name_uses_the_default_owner():
+    assert RepoRecord.from_json("alpha").full_name == f"{DEFAULT_OWNER}/alpha"
+    assert RepoRecord.from_json("alpha", default_owner="you").full_name == "you/alpha"
+    assert RepoRecord.from_json({"name": "beta", "owner": "me"}).full_name == "me/beta"
+
+
+def test_github_urls_reduce_to_owner_and_name():
+    for form in ("https://github.com/Me/Alpha", "http://github.com/Me/Alpha/", "github.com/Me/Alpha"):
+        record = RepoRecord.from_json(form)
+        assert (record.owner, record.name, record.key) == ("Me", "Alpha", "me/alpha")
+
+
+def test_dict_aliases_fill_counters():
+    record = RepoRecord.from_json(
+        {
+            "repo": "me/alpha",
+            "state": "tracked",
+            "stargazers_count": "12",
+            "forks_count": 3,
+            "watchers_count": None,
+            "open_issues_count": "n/a",
+        }
+    )
+    assert (record.status, record.stars, record.forks, record.watchers, record.open_issues) == ("tracked", 12, 3, 0, 0)
+
+
+def test_unusable_items_are_rejected():
+    for item in ("", "unknown", {}, {"full_name": "me/"}, 42, None):
+        assert RepoRecord.from_json(item) is None
+
+
+def test_key_is_case_insensitive_and_drives_sort_order():
+    upper = RepoRecord.from_json({"full_name": "Me/Beta", "stars": 2})
+    lower = RepoRecord.from_json({"full_name": "me/alpha", "stars": 2})
+    top = RepoRecord.from_json({"full_name": "me/zeta", "stars": 9})
+
+    assert upper.key == "me/beta"
+    assert sorted([upper, lower, top], key=RepoRecord.sort_key) == [top, lower, upper]
+
+
+def test_to_json_round_trips_the_metrics_shape():
+    payload = collect_repo_metrics.build_metrics_payload(
+        [
+            RepoRecord.from_json(
+                {
+                    "full_name": "me/alpha",
+                    "status": "tracked",
+                    "description": "demo",
+                    "language": "Python",
+                    "stars": 4,
+                    "forks": 1,
+                    "default_branch": "main",
+                    "archived": True,
+                    "pushed_at": "2024-01-01T00:00:00Z",
+                }
+            )
+        ]
+    )
+    record = payload["repositories"][0]
+
+    assert set(record) == set(RepoRecord.__slots__)
+    assert payload["repos"] == payload["repositories"]
+    assert RepoRecord.from_json(record).to_json() == record
@@ -0,0 +1,109 @@
+import json
+import sys
+
+import pytest
+
+import build_readme
+import collect_repo_metrics
+import registry_index
+import surface_io
+
+PAYLOADS = [
+    {"name": "café", "stars": 3, "archived": False, "error": None, "tags": ["a", "b"]},
+    {"cpu": {"min": 0.1, "avg": 12.5, "max": 99.99}, "window_s": 2.0},
+    {"tiny": 1e-7, "huge": 1e16, "nested": [{"value": 1.2345678901234568e17}]},
+]
+
+RECORDS = [
+    {"full_name": "me/alpha", "stars": 3, "description": "café", "archived": False, "error": None},
+    {"full_name": "me/beta", "stars": 0, "tags": ["a", "b"]},
+]
+
+
+def stdlib_document(payload):
+    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+def stdlib_line(payload):
+    return (json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_document_bytes_match_stdlib(payload):
+    assert surface_io.dumps_json(payload) == stdlib_document(payload)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_jsonl_line_bytes_match_stdlib(payload):
+    assert surface_io.encode_jsonl_line(payload) == stdlib_line(payload)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_stdlib_fallback_matches(payload, monkeypatch):
+    monkeypatch.setattr(surface_io, "orjson", None)
+    assert surface_io.dumps_json(payload) == stdlib_document(payload)
+    assert surface_io.encode_jsonl_line(payload) == stdlib_line(payload)
+
+
+def test_write_json_streams_canonical_bytes(tmp_path):
+    path = tmp_path / "doc.json"
+    surface_io.write_json(path, PAYLOADS[2])
+    assert path.read_text(encoding="utf-8") == stdlib_document(PAYLOADS[2])
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = tmp_path / "records.jsonl"
+
+    assert surface_io.write_jsonl(path, iter(RECORDS)) == len(RECORDS)
+    assert list(surface_io.iter_jsonl(path)) == RECORDS
+    assert path.read_bytes() == b"".join(surface_io.encode_jsonl_line(item) for item in RECORDS)
+    assert not path.with_name(path.name + ".tmp").exists()
+
+
+def test_iter_records_prefers_the_jsonl_companion(tmp_path):
+    document = tmp_path / "metrics.json"
+    document.write_text(json.dumps({"repositories": [{"full_name": "me/stale"}]}), encoding="utf-8")
+
+    assert list(surface_io.iter_records(document, ("repos", "repositories"))) == [{"full_name": "me/stale"}]
+
+    surface_io.write_jsonl(surface_io.jsonl_path(document), RECORDS)
+    assert list(surface_io.iter_records(document, ("repos", "repositories"))) == RECORDS
+
+
+def test_iter_records_skips_blank_lines_and_reports_bad_ones(tmp_path):
+    path = tmp_path / "index.jsonl"
+    path.write_text('{"a":1}\n\n{"a":2}\nnot json\n', encoding="utf-8")
+
+    with pytest.raises(SystemExit, match=r"index.jsonl:4"):
+        list(surface_io.iter_jsonl(path))
+
+    assert list(surface_io.iter_records(tmp_path / "missing.json", ("repos",))) == []
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "both"])
+def test_collected_metrics_reload_from_jsonl(tmp_path, monkeypatch, output_format):
+    (tmp_path / "identity").mkdir()
+    (tmp_path / "identity/repos.json").write_text(json.dumps({"repositories": ["me/alpha", "me/beta"]}), encoding="utf-8")
+    metrics_json = tmp_path / "metrics/metrics.json"
+
+    monkeypatch.setattr(collect_repo_metrics, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "INDEX_JSON", tmp_path / "dist/registry-index.json")
+    monkeypatch.setattr(collect_repo_metrics, "METRICS_DIR", tmp_path / "metrics")
+    monkeypatch.setattr(collect_repo_metrics, "METRICS_JSON", metrics_json)
+    monkeypatch.setattr(collect_repo_metrics, "METRICS_JSONL", surface_io.jsonl_path(metrics_json))
+    monkeypatch.setattr(collect_repo_metrics, "AGGREGATE_JSON", tmp_path / "metrics/aggregate.json")
+    monkeypatch.setattr(build_readme, "ROOT", tmp_path)
+    monkeypatch.setattr(sys, "argv", ["collect_repo_metrics.py", "--offline", "--sleep", "0", "--format", output_format])
+
+    assert collect_repo_metrics.main() == 0
+
+    lines = list(surface_io.iter_jsonl(surface_io.jsonl_path(metrics_json)))
+    header = json.loads(metrics_json.read_text(encoding="utf-8"))
+    assert [line["full_name"] for line in lines] == ["me/alpha", "me/beta"]
+    assert ("repositories" in header) == (output_format == "both")
+    assert [repo.full_name for repo in build_readme.load_repo_metrics()] == ["me/alpha", "me/beta"]
+
+    monkeypatch.setattr(sys, "argv", ["collect_repo_metrics.py", "--offline", "--sleep", "0", "--format", "json"])
+    assert collect_repo_metrics.main() == 0
+    assert not surface_io.jsonl_path(metrics_json).exists()
@@ -0,0 +1,114 @@
+import functools
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+import registry_index
+import sync_orchestrator as sync
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_index, "ROOT", tmp_path)
+    monkeypatch.setattr(registry_index, "INDEX_JSON", tmp_path / "dist" / "registry-index.json")
+    for name, path in (
+        ("METRICS_DIR", "metrics"),
+        ("HEALTH_FILE", "health/orchestrator.json"),
+        ("LOCK_DIR", "tmp/orchestrator"),
+    ):
+        monkeypatch.setattr(sync, name, tmp_path / path)
+    monkeypatch.setattr(sync, "PipelineLog", functools.partial(sync.PipelineLog, path=tmp_path / "logs/pipeline.jsonl"))
+
+    def write(names, **settings):
+        payload = {
+            "repositories": [{"owner": "me", "name": name, "enabled": True} for name in names]
+            + [{"owner": "me", "name": "off", "enabled": False}],
+            "sync_settings": {"retry_attempts": 2, "retry_delay_seconds": 0, **settings},
+        }
+        path = tmp_path / "identity" / "repos.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    return write
+
+
+class FakeGitHub:
+    """Stands in for GitHubClient; records peak concurrency and per-repo calls."""
+
+    authenticated = True
+
+    def __init__(self, delay=0.05, failures=()):
+        self.delay = delay
+        self.failures = set(failures)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+
+    def __call__(self, token=None, pool_size=None):
+        return self
+
+    def close(self):
+        pass
+
+    def get(self, path, timeout=15):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.calls.append(path)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if path.rsplit("/", 1)[-1] in self.failures:
+            return 503, None, "unavailable"
+        return 200, {"stargazers_count": 3, "watchers_count": 1, "forks_count": 2}, None
+
+
+def run(monkeypatch, fake, *args):
+    monkeypatch.setattr(sync, "GitHubClient", fake)
+    monkeypatch.setattr(sys, "argv", ["sync_orchestrator.py", *args])
+    return sync.main()
+
+
+def health(tmp_path):
+    return json.loads((tmp_path / "health" / "orchestrator.json").read_text(encoding="utf-8"))
+
+
+def test_requests_overlap_up_to_the_concurrency_bound(registry, monkeypatch, tmp_path):
+    names = [f"r{n}" for n in range(6)]
+    registry(names)
+    fake = FakeGitHub(delay=0.1)
+
+    started = time.monotonic()
+    assert run(monkeypatch, fake, "--concurrency", "3") == 0
+    elapsed = time.monotonic() - started
+
+    assert fake.peak == 3
+    assert elapsed < 0.1 * len(names)
+    assert sorted(fake.calls) == sorted(f"/repos/me/{name}" for name in names)
+    assert health(tmp_path)["repos_synced"] == len(names)
+
+
+def test_failures_are_retried_and_degrade_health(registry, monkeypatch, tmp_path):
+    registry(["good", "bad"])
+    fake = FakeGitHub(delay=0, failures={"bad"})
+
+    assert run(monkeypatch, fake) == 1
+    assert fake.calls.count("/repos/me/bad") == 2
+    assert (health(tmp_path)["status"], health(tmp_path)["failures"]) == ("degraded", 1)
+    assert json.loads((tmp_path / "metrics" / "me_good.json").read_text(encoding="utf-8"))["stargazers"] == 3
+
+
+def test_recent_locks_skip_repos_unless_forced(registry, monkeypatch):
+    registry(["alpha"], interval_minutes=60)
+    assert run(monkeypatch, FakeGitHub(delay=0)) == 0
+
+    again = FakeGitHub(delay=0)
+    assert run(monkeypatch, again) == 0
+    assert again.calls == []
+
+    assert run(monkeypatch, again, "--force") == 0
+    assert again.calls == ["/repos/me/alpha"]
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+import validate_surfaces as validate
+
+
+@pytest.fixture
+def surface(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate, "ROOT", tmp_path)
+    monkeypatch.setattr(validate, "CACHE_FILE", tmp_path / "dist" / "validate-cache.json")
+    calls = []
+
+    def counting(checker):
+        def check(path):
+            calls.append(path.name)
+            return checker(path)
+
+        return check
+
+    monkeypatch.setattr(validate, "CHECKERS", {suffix: counting(checker) for suffix, checker in validate.CHECKERS.items()})
+    return tmp_path, calls
+
+
+def write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_unchanged_files_are_cache_hits(surface):
+    root, calls = surface
+    paths = [write(root, "a.json", "{}"), write(root, "b.svg", '<svg xmlns="http://www.w3.org/2000/svg"/>')]
+
+    assert set(validate.validate_files(paths, jobs=2).values()) == {None}
+    assert sorted(calls) == ["a.json", "b.svg"]
+
+    calls.clear()
+    assert set(validate.validate_files(paths, jobs=2).values()) == {None}
+    assert calls == []
+
+
+def test_changed_bytes_and_check_version_are_misses(surface, monkeypatch):
+    root, calls = surface
+    path = write(root, "a.json", "{}")
+    validate.validate_files([path], jobs=1)
+
+    write(root, "a.json", "{not json")
+    calls.clear()
+    assert validate.validate_files([path], jobs=1)[str(path)] is not None
+    assert calls == ["a.json"]
+
+    monkeypatch.setattr(validate, "CHECK_VERSION", validate.CHECK_VERSION + "-next")
+    calls.clear()
+    validate.validate_files([path], jobs=1)
+    assert calls == ["a.json"]
+
+
+def test_cached_failures_are_still_reported(surface):
+    root, calls = surface
+    path = write(root, "broken.jsonl", '{"a": 1}\n{oops\n')
+
+    first = validate.validate_files([path], jobs=1)
+    calls.clear()
+    second = validate.validate_files([path], jobs=1)
+
+    assert calls == []
+    assert second == first
+    assert second[str(path)].startswith("line 2:")
+
+
+def test_no_cache_rechecks_and_deleted_files_leave_the_cache(surface):
+    root, calls = surface
+    keep = write(root, "keep.json", "[]")
+    gone = write(root, "gone.json", "[]")
+    validate.validate_files([keep, gone], jobs=1)
+    gone.unlink()
+
+    calls.clear()
+    validate.validate_files([keep], jobs=1, use_cache=False)
+    cache = json.loads((root / "dist" / "validate-cache.json").read_text(encoding="utf-8"))
+
+    assert calls == ["keep.json"]
+    assert list(cache["results"]) == [str(keep)]
+
+
+@pytest.mark.parametrize("threshold", [0, 10**9])
+def test_svg_root_is_checked_on_both_parsers(surface, monkeypatch, threshold):
+    root, _ = surface
+    monkeypatch.setattr(validate, "ITERPARSE_MIN_BYTES", threshold)
+
+    assert validate.check_svg(write(root, "ok.svg", '<svg xmlns="http://www.w3.org/2000/svg"><g/></svg>')) is None
+    assert validate.check_svg(write(root, "html.svg", "<html/>")) == "root element is <html>, expected <svg>"
+    assert validate.check_svg(write(root, "cut.svg", "<svg><g></svg>")) is not None
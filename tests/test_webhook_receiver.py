@@ -0,0 +1,64 @@
+import sys
+
+import pytest
+
+import webhook_receiver as webhook
+
+
+def cards_argv(batch):
+    return dict(webhook.stage_commands(batch))["cards"]
+
+
+def test_cards_stage_follows_build_settings(monkeypatch):
+    monkeypatch.delenv("SURFACE_CARD_ATLAS", raising=False)
+    monkeypatch.setenv("SURFACE_RENDER_PROFILE", "lite")
+    argv = cards_argv({"me/alpha": {"cards"}})
+    assert argv == [sys.executable, "scripts/generate_project_cards.py", "--limit", "8", "--profile", "lite"]
+
+    monkeypatch.setenv("SURFACE_CARD_ATLAS", "1")
+    assert cards_argv({"me/alpha": {"cards"}})[-1] == "--atlas"
+
+
+class FakeIndex:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get(self, key):
+        return self.entries.get(key)
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(webhook, "ROOT", tmp_path)
+    monkeypatch.setattr(webhook, "INDEX_CACHE", {})
+    loads = []
+    entry = {"key": "me/alpha", "enabled": True, "sources": [webhook.REGISTRY_SOURCE]}
+
+    def load_index(write=True):
+        loads.append(write)
+        return FakeIndex({"me/alpha": entry})
+
+    monkeypatch.setattr(webhook, "load_index", load_index)
+    return loads
+
+
+def push(full_name):
+    return {"repository": {"full_name": full_name}}
+
+
+def test_plan_event_reuses_the_index_until_a_source_changes(index, tmp_path):
+    assert webhook.plan_event("push", push("me/alpha"), None)[1] == ("metrics", "cards", "readme")
+    assert webhook.plan_event("star", push("me/alpha"), None)[1] == ("sync", "metrics", "cards", "readme")
+    assert index == [False]
+
+    source = tmp_path / webhook.SOURCES[0]
+    source.parent.mkdir(parents=True)
+    source.write_text("[]", encoding="utf-8")
+    webhook.plan_event("push", push("me/alpha"), None)
+    assert index == [False, False]
+
+
+def test_plan_event_ignores_unregistered_repos(index):
+    key, stages, reason = webhook.plan_event("push", push("me/other"), None)
+    assert (key, stages) == ("me/other", ())
+    assert "identity/repos.json" in reason